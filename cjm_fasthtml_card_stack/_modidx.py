@@ -27,20 +27,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'cjm_fasthtml_card_stack/components/states.py'),
                                                            'cjm_fasthtml_card_stack.components.states.render_placeholder_card': ( 'components/states.html#render_placeholder_card',
                                                                                                                                   'cjm_fasthtml_card_stack/components/states.py')},
-            'cjm_fasthtml_card_stack.components.viewport': { 'cjm_fasthtml_card_stack.components.viewport._grid_template_rows': ( 'components/viewport.html#_grid_template_rows',
+            'cjm_fasthtml_card_stack.components.viewport': { 'cjm_fasthtml_card_stack.components.viewport.CompiledViewportStyles': ( 'components/viewport.html#compiledviewportstyles',
+                                                                                                                                     'cjm_fasthtml_card_stack/components/viewport.py'),
+                                                             'cjm_fasthtml_card_stack.components.viewport._compile_viewport_styles': ( 'components/viewport.html#_compile_viewport_styles',
+                                                                                                                                       'cjm_fasthtml_card_stack/components/viewport.py'),
+                                                             'cjm_fasthtml_card_stack.components.viewport._grid_template_rows': ( 'components/viewport.html#_grid_template_rows',
                                                                                                                                   'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport._map_to_scrollbar': ( 'components/viewport.html#_map_to_scrollbar',
                                                                                                                                 'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport._render_click_overlay': ( 'components/viewport.html#_render_click_overlay',
                                                                                                                                     'cjm_fasthtml_card_stack/components/viewport.py'),
+                                                             'cjm_fasthtml_card_stack.components.viewport._render_focused_section_oob': ( 'components/viewport.html#_render_focused_section_oob',
+                                                                                                                                          'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport._render_mode_sync_script': ( 'components/viewport.html#_render_mode_sync_script',
                                                                                                                                        'cjm_fasthtml_card_stack/components/viewport.py'),
+                                                             'cjm_fasthtml_card_stack.components.viewport.compile_viewport_styles': ( 'components/viewport.html#compile_viewport_styles',
+                                                                                                                                      'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport.render_all_slots_oob': ( 'components/viewport.html#render_all_slots_oob',
                                                                                                                                    'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport.render_card_stack_scrollbar': ( 'components/viewport.html#render_card_stack_scrollbar',
                                                                                                                                           'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport.render_slot_card': ( 'components/viewport.html#render_slot_card',
                                                                                                                                'cjm_fasthtml_card_stack/components/viewport.py'),
+                                                             'cjm_fasthtml_card_stack.components.viewport.render_slots_diff_oob': ( 'components/viewport.html#render_slots_diff_oob',
+                                                                                                                                    'cjm_fasthtml_card_stack/components/viewport.py'),
                                                              'cjm_fasthtml_card_stack.components.viewport.render_viewport': ( 'components/viewport.html#render_viewport',
                                                                                                                               'cjm_fasthtml_card_stack/components/viewport.py')},
             'cjm_fasthtml_card_stack.core.button_ids': { 'cjm_fasthtml_card_stack.core.button_ids.CardStackButtonIds': ( 'core/button_ids.html#cardstackbuttonids',
@@ -83,6 +93,44 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'cjm_fasthtml_card_stack/core/constants.py'),
                                                         'cjm_fasthtml_card_stack.core.constants.width_storage_key': ( 'core/constants.html#width_storage_key',
                                                                                                                       'cjm_fasthtml_card_stack/core/constants.py')},
+            'cjm_fasthtml_card_stack.core.data_source': { 'cjm_fasthtml_card_stack.core.data_source.CardStackDataSource': ( 'core/data_source.html#cardstackdatasource',
+                                                                                                                            'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CardStackDataSource.count': ( 'core/data_source.html#cardstackdatasource.count',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CardStackDataSource.get_range': ( 'core/data_source.html#cardstackdatasource.get_range',
+                                                                                                                                      'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CountedItems': ( 'core/data_source.html#counteditems',
+                                                                                                                     'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CountedItems.__init__': ( 'core/data_source.html#counteditems.__init__',
+                                                                                                                              'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CountedItems.count': ( 'core/data_source.html#counteditems.count',
+                                                                                                                           'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.CountedItems.get_range': ( 'core/data_source.html#counteditems.get_range',
+                                                                                                                               'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.ListDataSource': ( 'core/data_source.html#listdatasource',
+                                                                                                                       'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.ListDataSource.__init__': ( 'core/data_source.html#listdatasource.__init__',
+                                                                                                                                'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.ListDataSource.count': ( 'core/data_source.html#listdatasource.count',
+                                                                                                                             'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.ListDataSource.get_range': ( 'core/data_source.html#listdatasource.get_range',
+                                                                                                                                 'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.WindowedItems': ( 'core/data_source.html#windoweditems',
+                                                                                                                      'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.WindowedItems.__getitem__': ( 'core/data_source.html#windoweditems.__getitem__',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.WindowedItems.__init__': ( 'core/data_source.html#windoweditems.__init__',
+                                                                                                                               'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.WindowedItems.__len__': ( 'core/data_source.html#windoweditems.__len__',
+                                                                                                                              'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source._is_data_source': ( 'core/data_source.html#_is_data_source',
+                                                                                                                        'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.count_once': ( 'core/data_source.html#count_once',
+                                                                                                                   'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.fetch_window': ( 'core/data_source.html#fetch_window',
+                                                                                                                     'cjm_fasthtml_card_stack/core/data_source.py'),
+                                                          'cjm_fasthtml_card_stack.core.data_source.item_count': ( 'core/data_source.html#item_count',
+                                                                                                                   'cjm_fasthtml_card_stack/core/data_source.py')},
             'cjm_fasthtml_card_stack.core.html_ids': { 'cjm_fasthtml_card_stack.core.html_ids.CardStackHtmlIds': ( 'core/html_ids.html#cardstackhtmlids',
                                                                                                                    'cjm_fasthtml_card_stack/core/html_ids.py'),
                                                        'cjm_fasthtml_card_stack.core.html_ids.CardStackHtmlIds.card_count_auto_toggle': ( 'core/html_ids.html#cardstackhtmlids.card_count_auto_toggle',
@@ -122,38 +170,358 @@ d = { 'settings': { 'branch': 'main',
                                                      'cjm_fasthtml_card_stack.core.models.CardStackState': ( 'core/models.html#cardstackstate',
                                                                                                              'cjm_fasthtml_card_stack/core/models.py'),
                                                      'cjm_fasthtml_card_stack.core.models.CardStackUrls': ( 'core/models.html#cardstackurls',
-                                                                                                            'cjm_fasthtml_card_stack/core/models.py')},
+                                                                                                            'cjm_fasthtml_card_stack/core/models.py'),
+                                                     'cjm_fasthtml_card_stack.core.models._is_int': ( 'core/models.html#_is_int',
+                                                                                                      'cjm_fasthtml_card_stack/core/models.py'),
+                                                     'cjm_fasthtml_card_stack.core.models.decode_state': ( 'core/models.html#decode_state',
+                                                                                                           'cjm_fasthtml_card_stack/core/models.py'),
+                                                     'cjm_fasthtml_card_stack.core.models.encode_state': ( 'core/models.html#encode_state',
+                                                                                                           'cjm_fasthtml_card_stack/core/models.py'),
+                                                     'cjm_fasthtml_card_stack.core.models.state_from_compact': ( 'core/models.html#state_from_compact',
+                                                                                                                 'cjm_fasthtml_card_stack/core/models.py'),
+                                                     'cjm_fasthtml_card_stack.core.models.state_to_compact': ( 'core/models.html#state_to_compact',
+                                                                                                               'cjm_fasthtml_card_stack/core/models.py')},
+            'cjm_fasthtml_card_stack.core.state_store': { 'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore': ( 'core/state_store.html#cardstackstatestore',
+                                                                                                                            'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore.__init__': ( 'core/state_store.html#cardstackstatestore.__init__',
+                                                                                                                                     'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore._flush': ( 'core/state_store.html#cardstackstatestore._flush',
+                                                                                                                                   'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore._load': ( 'core/state_store.html#cardstackstatestore._load',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore._read': ( 'core/state_store.html#cardstackstatestore._read',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore._remember': ( 'core/state_store.html#cardstackstatestore._remember',
+                                                                                                                                      'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore._write_many': ( 'core/state_store.html#cardstackstatestore._write_many',
+                                                                                                                                        'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore.get': ( 'core/state_store.html#cardstackstatestore.get',
+                                                                                                                                'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore.key': ( 'core/state_store.html#cardstackstatestore.key',
+                                                                                                                                'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.CardStackStateStore.put': ( 'core/state_store.html#cardstackstatestore.put',
+                                                                                                                                'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.MemoryStateStore': ( 'core/state_store.html#memorystatestore',
+                                                                                                                         'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.MemoryStateStore.__init__': ( 'core/state_store.html#memorystatestore.__init__',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.MemoryStateStore._read': ( 'core/state_store.html#memorystatestore._read',
+                                                                                                                               'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.MemoryStateStore._write_many': ( 'core/state_store.html#memorystatestore._write_many',
+                                                                                                                                     'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore': ( 'core/state_store.html#sessionstatestore',
+                                                                                                                          'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore.__init__': ( 'core/state_store.html#sessionstatestore.__init__',
+                                                                                                                                   'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore._read': ( 'core/state_store.html#sessionstatestore._read',
+                                                                                                                                'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore._write_many': ( 'core/state_store.html#sessionstatestore._write_many',
+                                                                                                                                      'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore.get': ( 'core/state_store.html#sessionstatestore.get',
+                                                                                                                              'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore.key': ( 'core/state_store.html#sessionstatestore.key',
+                                                                                                                              'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SessionStateStore.put': ( 'core/state_store.html#sessionstatestore.put',
+                                                                                                                              'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SqliteStateStore': ( 'core/state_store.html#sqlitestatestore',
+                                                                                                                         'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SqliteStateStore.__init__': ( 'core/state_store.html#sqlitestatestore.__init__',
+                                                                                                                                  'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SqliteStateStore._read': ( 'core/state_store.html#sqlitestatestore._read',
+                                                                                                                               'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SqliteStateStore._write_many': ( 'core/state_store.html#sqlitestatestore._write_many',
+                                                                                                                                     'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.SqliteStateStore.close': ( 'core/state_store.html#sqlitestatestore.close',
+                                                                                                                               'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.batch_state_writes': ( 'core/state_store.html#batch_state_writes',
+                                                                                                                           'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.state_from_dict': ( 'core/state_store.html#state_from_dict',
+                                                                                                                        'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.state_snapshot': ( 'core/state_store.html#state_snapshot',
+                                                                                                                       'cjm_fasthtml_card_stack/core/state_store.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_store.state_to_dict': ( 'core/state_store.html#state_to_dict',
+                                                                                                                      'cjm_fasthtml_card_stack/core/state_store.py')},
+            'cjm_fasthtml_card_stack.core.state_token': { 'cjm_fasthtml_card_stack.core.state_token._b64decode': ( 'core/state_token.html#_b64decode',
+                                                                                                                   'cjm_fasthtml_card_stack/core/state_token.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_token._b64encode': ( 'core/state_token.html#_b64encode',
+                                                                                                                   'cjm_fasthtml_card_stack/core/state_token.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_token._tag': ( 'core/state_token.html#_tag',
+                                                                                                             'cjm_fasthtml_card_stack/core/state_token.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_token.sign_state_token': ( 'core/state_token.html#sign_state_token',
+                                                                                                                         'cjm_fasthtml_card_stack/core/state_token.py'),
+                                                          'cjm_fasthtml_card_stack.core.state_token.verify_state_token': ( 'core/state_token.html#verify_state_token',
+                                                                                                                           'cjm_fasthtml_card_stack/core/state_token.py')},
+            'cjm_fasthtml_card_stack.helpers.benchmark': { 'cjm_fasthtml_card_stack.helpers.benchmark.BenchCase': ( 'helpers/benchmark.html#benchcase',
+                                                                                                                    'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.BenchCase.key': ( 'helpers/benchmark.html#benchcase.key',
+                                                                                                                        'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.BenchRegression': ( 'helpers/benchmark.html#benchregression',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.BenchRegression.ratio': ( 'helpers/benchmark.html#benchregression.ratio',
+                                                                                                                                'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.BenchResult': ( 'helpers/benchmark.html#benchresult',
+                                                                                                                      'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._SyntheticItems': ( 'helpers/benchmark.html#_syntheticitems',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._SyntheticItems.__init__': ( 'helpers/benchmark.html#_syntheticitems.__init__',
+                                                                                                                                   'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._SyntheticItems.count': ( 'helpers/benchmark.html#_syntheticitems.count',
+                                                                                                                                'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._SyntheticItems.get_range': ( 'helpers/benchmark.html#_syntheticitems.get_range',
+                                                                                                                                    'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._bench_render': ( 'helpers/benchmark.html#_bench_render',
+                                                                                                                        'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._percentile': ( 'helpers/benchmark.html#_percentile',
+                                                                                                                      'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark._response_bytes': ( 'helpers/benchmark.html#_response_bytes',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.bench_cases': ( 'helpers/benchmark.html#bench_cases',
+                                                                                                                      'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.card_stack_bench': ( 'helpers/benchmark.html#card_stack_bench',
+                                                                                                                           'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.compare_to_baseline': ( 'helpers/benchmark.html#compare_to_baseline',
+                                                                                                                              'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.format_results': ( 'helpers/benchmark.html#format_results',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.load_baseline': ( 'helpers/benchmark.html#load_baseline',
+                                                                                                                        'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.run_benchmarks': ( 'helpers/benchmark.html#run_benchmarks',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.run_case': ( 'helpers/benchmark.html#run_case',
+                                                                                                                   'cjm_fasthtml_card_stack/helpers/benchmark.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.benchmark.save_baseline': ( 'helpers/benchmark.html#save_baseline',
+                                                                                                                        'cjm_fasthtml_card_stack/helpers/benchmark.py')},
             'cjm_fasthtml_card_stack.helpers.focus': { 'cjm_fasthtml_card_stack.helpers.focus.calculate_viewport_window': ( 'helpers/focus.html#calculate_viewport_window',
                                                                                                                             'cjm_fasthtml_card_stack/helpers/focus.py'),
+                                                       'cjm_fasthtml_card_stack.helpers.focus.decode_view_state': ( 'helpers/focus.html#decode_view_state',
+                                                                                                                    'cjm_fasthtml_card_stack/helpers/focus.py'),
+                                                       'cjm_fasthtml_card_stack.helpers.focus.encode_view_state': ( 'helpers/focus.html#encode_view_state',
+                                                                                                                    'cjm_fasthtml_card_stack/helpers/focus.py'),
                                                        'cjm_fasthtml_card_stack.helpers.focus.render_focus_oob': ( 'helpers/focus.html#render_focus_oob',
                                                                                                                    'cjm_fasthtml_card_stack/helpers/focus.py'),
                                                        'cjm_fasthtml_card_stack.helpers.focus.resolve_focus_slot': ( 'helpers/focus.html#resolve_focus_slot',
                                                                                                                      'cjm_fasthtml_card_stack/helpers/focus.py')},
+            'cjm_fasthtml_card_stack.helpers.heights': { 'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel': ( 'helpers/heights.html#cardheightmodel',
+                                                                                                                      'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.__init__': ( 'helpers/heights.html#cardheightmodel.__init__',
+                                                                                                                               'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.__len__': ( 'helpers/heights.html#cardheightmodel.__len__',
+                                                                                                                              'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel._discard': ( 'helpers/heights.html#cardheightmodel._discard',
+                                                                                                                               'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel._evict': ( 'helpers/heights.html#cardheightmodel._evict',
+                                                                                                                             'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel._store': ( 'helpers/heights.html#cardheightmodel._store',
+                                                                                                                             'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.choose_visible_count': ( 'helpers/heights.html#cardheightmodel.choose_visible_count',
+                                                                                                                                           'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.fallback_height': ( 'helpers/heights.html#cardheightmodel.fallback_height',
+                                                                                                                                      'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.height': ( 'helpers/heights.html#cardheightmodel.height',
+                                                                                                                             'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.invalidate': ( 'helpers/heights.html#cardheightmodel.invalidate',
+                                                                                                                                 'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.key': ( 'helpers/heights.html#cardheightmodel.key',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.CardHeightModel.record_measurements': ( 'helpers/heights.html#cardheightmodel.record_measurements',
+                                                                                                                                          'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights._fit_cards': ( 'helpers/heights.html#_fit_cards',
+                                                                                                                 'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.fit_visible_count': ( 'helpers/heights.html#fit_visible_count',
+                                                                                                                        'cjm_fasthtml_card_stack/helpers/heights.py'),
+                                                         'cjm_fasthtml_card_stack.helpers.heights.parse_card_heights': ( 'helpers/heights.html#parse_card_heights',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/heights.py')},
+            'cjm_fasthtml_card_stack.helpers.loadtest': { 'cjm_fasthtml_card_stack.helpers.loadtest.LoadResult': ( 'helpers/loadtest.html#loadresult',
+                                                                                                                   'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.LoadResult.throughput': ( 'helpers/loadtest.html#loadresult.throughput',
+                                                                                                                              'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.LoadStats': ( 'helpers/loadtest.html#loadstats',
+                                                                                                                  'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.TraceStep': ( 'helpers/loadtest.html#tracestep',
+                                                                                                                  'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._LoadSession': ( 'helpers/loadtest.html#_loadsession',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._LoadSession.__init__': ( 'helpers/loadtest.html#_loadsession.__init__',
+                                                                                                                              'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._LoadSession._track': ( 'helpers/loadtest.html#_loadsession._track',
+                                                                                                                            'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._LoadSession.close': ( 'helpers/loadtest.html#_loadsession.close',
+                                                                                                                           'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._LoadSession.send': ( 'helpers/loadtest.html#_loadsession.send',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._auto_adjust': ( 'helpers/loadtest.html#_auto_adjust',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._load_stats': ( 'helpers/loadtest.html#_load_stats',
+                                                                                                                    'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._page_jump': ( 'helpers/loadtest.html#_page_jump',
+                                                                                                                   'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._scrollbar_scrub': ( 'helpers/loadtest.html#_scrollbar_scrub',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._touch_fling': ( 'helpers/loadtest.html#_touch_fling',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest._wheel_burst': ( 'helpers/loadtest.html#_wheel_burst',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.build_load_app': ( 'helpers/loadtest.html#build_load_app',
+                                                                                                                       'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.build_session_trace': ( 'helpers/loadtest.html#build_session_trace',
+                                                                                                                            'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.card_stack_loadtest': ( 'helpers/loadtest.html#card_stack_loadtest',
+                                                                                                                            'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.format_load_results': ( 'helpers/loadtest.html#format_load_results',
+                                                                                                                            'cjm_fasthtml_card_stack/helpers/loadtest.py'),
+                                                          'cjm_fasthtml_card_stack.helpers.loadtest.run_load_test': ( 'helpers/loadtest.html#run_load_test',
+                                                                                                                      'cjm_fasthtml_card_stack/helpers/loadtest.py')},
+            'cjm_fasthtml_card_stack.helpers.render_cache': { 'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache': ( 'helpers/render_cache.html#cardrendercache',
+                                                                                                                                'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.__contains__': ( 'helpers/render_cache.html#cardrendercache.__contains__',
+                                                                                                                                             'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.__init__': ( 'helpers/render_cache.html#cardrendercache.__init__',
+                                                                                                                                         'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.__len__': ( 'helpers/render_cache.html#cardrendercache.__len__',
+                                                                                                                                        'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache._evict': ( 'helpers/render_cache.html#cardrendercache._evict',
+                                                                                                                                       'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache._lookup': ( 'helpers/render_cache.html#cardrendercache._lookup',
+                                                                                                                                        'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache._store': ( 'helpers/render_cache.html#cardrendercache._store',
+                                                                                                                                       'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.get_or_render': ( 'helpers/render_cache.html#cardrendercache.get_or_render',
+                                                                                                                                              'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.get_or_render_async': ( 'helpers/render_cache.html#cardrendercache.get_or_render_async',
+                                                                                                                                                    'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.invalidate': ( 'helpers/render_cache.html#cardrendercache.invalidate',
+                                                                                                                                           'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.key': ( 'helpers/render_cache.html#cardrendercache.key',
+                                                                                                                                    'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.size_bytes': ( 'helpers/render_cache.html#cardrendercache.size_bytes',
+                                                                                                                                           'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache.CardRenderCache.wrap': ( 'helpers/render_cache.html#cardrendercache.wrap',
+                                                                                                                                     'cjm_fasthtml_card_stack/helpers/render_cache.py'),
+                                                              'cjm_fasthtml_card_stack.helpers.render_cache._default_item_key': ( 'helpers/render_cache.html#_default_item_key',
+                                                                                                                                  'cjm_fasthtml_card_stack/helpers/render_cache.py')},
+            'cjm_fasthtml_card_stack.helpers.telemetry': { 'cjm_fasthtml_card_stack.helpers.telemetry.ClientTelemetry': ( 'helpers/telemetry.html#clienttelemetry',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry.TelemetryHistogram': ( 'helpers/telemetry.html#telemetryhistogram',
+                                                                                                                             'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry.TelemetryHistogram.count': ( 'helpers/telemetry.html#telemetryhistogram.count',
+                                                                                                                                   'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry.TelemetryHistogram.mean': ( 'helpers/telemetry.html#telemetryhistogram.mean',
+                                                                                                                                  'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry.TelemetryHistogram.quantile': ( 'helpers/telemetry.html#telemetryhistogram.quantile',
+                                                                                                                                      'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry._number': ( 'helpers/telemetry.html#_number',
+                                                                                                                  'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry._parse_histogram': ( 'helpers/telemetry.html#_parse_histogram',
+                                                                                                                           'cjm_fasthtml_card_stack/helpers/telemetry.py'),
+                                                           'cjm_fasthtml_card_stack.helpers.telemetry.parse_client_telemetry': ( 'helpers/telemetry.html#parse_client_telemetry',
+                                                                                                                                 'cjm_fasthtml_card_stack/helpers/telemetry.py')},
+            'cjm_fasthtml_card_stack.helpers.timing': { 'cjm_fasthtml_card_stack.helpers.timing.CardStackMetrics': ( 'helpers/timing.html#cardstackmetrics',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.CardStackMetrics.increment': ( 'helpers/timing.html#cardstackmetrics.increment',
+                                                                                                                               'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.CardStackMetrics.observe': ( 'helpers/timing.html#cardstackmetrics.observe',
+                                                                                                                             'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming': ( 'helpers/timing.html#requesttiming',
+                                                                                                                  'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.__init__': ( 'helpers/timing.html#requesttiming.__init__',
+                                                                                                                           'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.finish': ( 'helpers/timing.html#requesttiming.finish',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.header_value': ( 'helpers/timing.html#requesttiming.header_value',
+                                                                                                                               'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.library': ( 'helpers/timing.html#requesttiming.library',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.measure': ( 'helpers/timing.html#requesttiming.measure',
+                                                                                                                          'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.RequestTiming.record': ( 'helpers/timing.html#requesttiming.record',
+                                                                                                                         'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing._serialize': ( 'helpers/timing.html#_serialize',
+                                                                                                               'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing._timed_awaitable': ( 'helpers/timing.html#_timed_awaitable',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.instrument_route': ( 'helpers/timing.html#instrument_route',
+                                                                                                                     'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.report_timing': ( 'helpers/timing.html#report_timing',
+                                                                                                                  'cjm_fasthtml_card_stack/helpers/timing.py'),
+                                                        'cjm_fasthtml_card_stack.helpers.timing.timed_callback': ( 'helpers/timing.html#timed_callback',
+                                                                                                                   'cjm_fasthtml_card_stack/helpers/timing.py')},
+            'cjm_fasthtml_card_stack.js.bundle': { 'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles': ( 'js/bundle.html#cardstackjsbundles',
+                                                                                                             'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.__init__': ( 'js/bundle.html#cardstackjsbundles.__init__',
+                                                                                                                      'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.get': ( 'js/bundle.html#cardstackjsbundles.get',
+                                                                                                                 'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.get_or_build': ( 'js/bundle.html#cardstackjsbundles.get_or_build',
+                                                                                                                          'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.preloading': ( 'js/bundle.html#cardstackjsbundles.preloading',
+                                                                                                                        'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.response': ( 'js/bundle.html#cardstackjsbundles.response',
+                                                                                                                      'cjm_fasthtml_card_stack/js/bundle.py'),
+                                                   'cjm_fasthtml_card_stack.js.bundle.CardStackJsBundles.script_url': ( 'js/bundle.html#cardstackjsbundles.script_url',
+                                                                                                                        'cjm_fasthtml_card_stack/js/bundle.py')},
             'cjm_fasthtml_card_stack.js.auto_adjust': {},
             'cjm_fasthtml_card_stack.js.controls': { 'cjm_fasthtml_card_stack.js.controls._generate_card_count_mgmt_js': ( 'js/controls.html#_generate_card_count_mgmt_js',
                                                                                                                            'cjm_fasthtml_card_stack/js/controls.py'),
+                                                     'cjm_fasthtml_card_stack.js.controls._generate_prefs_mgmt_js': ( 'js/controls.html#_generate_prefs_mgmt_js',
+                                                                                                                      'cjm_fasthtml_card_stack/js/controls.py'),
                                                      'cjm_fasthtml_card_stack.js.controls._generate_scale_mgmt_js': ( 'js/controls.html#_generate_scale_mgmt_js',
                                                                                                                       'cjm_fasthtml_card_stack/js/controls.py'),
                                                      'cjm_fasthtml_card_stack.js.controls._generate_width_mgmt_js': ( 'js/controls.html#_generate_width_mgmt_js',
                                                                                                                       'cjm_fasthtml_card_stack/js/controls.py')},
-            'cjm_fasthtml_card_stack.js.core': { 'cjm_fasthtml_card_stack.js.core._generate_coordinator_js': ( 'js/core.html#_generate_coordinator_js',
+            'cjm_fasthtml_card_stack.js.core': { 'cjm_fasthtml_card_stack.js.core._build_card_stack_runtime': ( 'js/core.html#_build_card_stack_runtime',
+                                                                                                                'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core._compose_card_stack_js': ( 'js/core.html#_compose_card_stack_js',
+                                                                                                             'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core._generate_coordinator_js': ( 'js/core.html#_generate_coordinator_js',
                                                                                                                'cjm_fasthtml_card_stack/js/core.py'),
                                                  'cjm_fasthtml_card_stack.js.core._generate_global_callbacks_js': ( 'js/core.html#_generate_global_callbacks_js',
                                                                                                                     'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core._generate_instance_logic_js': ( 'js/core.html#_generate_instance_logic_js',
+                                                                                                                  'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core._generate_instance_scrollbar_js': ( 'js/core.html#_generate_instance_scrollbar_js',
+                                                                                                                      'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core.card_stack_runtime_config': ( 'js/core.html#card_stack_runtime_config',
+                                                                                                                'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core.generate_card_stack_instance_js': ( 'js/core.html#generate_card_stack_instance_js',
+                                                                                                                      'cjm_fasthtml_card_stack/js/core.py'),
                                                  'cjm_fasthtml_card_stack.js.core.generate_card_stack_js': ( 'js/core.html#generate_card_stack_js',
                                                                                                              'cjm_fasthtml_card_stack/js/core.py'),
+                                                 'cjm_fasthtml_card_stack.js.core.generate_card_stack_runtime_js': ( 'js/core.html#generate_card_stack_runtime_js',
+                                                                                                                     'cjm_fasthtml_card_stack/js/core.py'),
                                                  'cjm_fasthtml_card_stack.js.core.global_callback_name': ( 'js/core.html#global_callback_name',
                                                                                                            'cjm_fasthtml_card_stack/js/core.py')},
+            'cjm_fasthtml_card_stack.js.item_events': { 'cjm_fasthtml_card_stack.js.item_events._generate_item_events_js': ( 'js/item_events.html#_generate_item_events_js',
+                                                                                                                             'cjm_fasthtml_card_stack/js/item_events.py')},
             'cjm_fasthtml_card_stack.js.navigation': { 'cjm_fasthtml_card_stack.js.navigation.generate_page_nav_js': ( 'js/navigation.html#generate_page_nav_js',
                                                                                                                        'cjm_fasthtml_card_stack/js/navigation.py')},
             'cjm_fasthtml_card_stack.js.scroll': { 'cjm_fasthtml_card_stack.js.scroll.generate_scroll_nav_js': ( 'js/scroll.html#generate_scroll_nav_js',
                                                                                                                  'cjm_fasthtml_card_stack/js/scroll.py')},
             'cjm_fasthtml_card_stack.js.sync': { 'cjm_fasthtml_card_stack.js.sync.generate_card_stack_sync_js': ( 'js/sync.html#generate_card_stack_sync_js',
                                                                                                                   'cjm_fasthtml_card_stack/js/sync.py')},
+            'cjm_fasthtml_card_stack.js.telemetry': { 'cjm_fasthtml_card_stack.js.telemetry._generate_telemetry_js': ( 'js/telemetry.html#_generate_telemetry_js',
+                                                                                                                       'cjm_fasthtml_card_stack/js/telemetry.py')},
             'cjm_fasthtml_card_stack.js.touch': { 'cjm_fasthtml_card_stack.js.touch.generate_touch_nav_js': ( 'js/touch.html#generate_touch_nav_js',
                                                                                                               'cjm_fasthtml_card_stack/js/touch.py')},
+            'cjm_fasthtml_card_stack.js.values': { 'cjm_fasthtml_card_stack.js.values.JsRef': ( 'js/values.html#jsref',
+                                                                                                'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.JsRefs': ( 'js/values.html#jsrefs',
+                                                                                                 'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.JsRefs.__getattr__': ( 'js/values.html#jsrefs.__getattr__',
+                                                                                                             'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.JsRefs.__init__': ( 'js/values.html#jsrefs.__init__',
+                                                                                                          'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.js_derived': ( 'js/values.html#js_derived',
+                                                                                                     'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.js_global': ( 'js/values.html#js_global',
+                                                                                                    'cjm_fasthtml_card_stack/js/values.py'),
+                                                   'cjm_fasthtml_card_stack.js.values.js_value': ( 'js/values.html#js_value',
+                                                                                                   'cjm_fasthtml_card_stack/js/values.py')},
             'cjm_fasthtml_card_stack.js.viewport': { 'cjm_fasthtml_card_stack.js.viewport.generate_viewport_height_js': ( 'js/viewport.html#generate_viewport_height_js',
                                                                                                                           'cjm_fasthtml_card_stack/js/viewport.py')},
+            'cjm_fasthtml_card_stack.js.window': { 'cjm_fasthtml_card_stack.js.window._generate_window_patcher_js': ( 'js/window.html#_generate_window_patcher_js',
+                                                                                                                      'cjm_fasthtml_card_stack/js/window.py')},
+            'cjm_fasthtml_card_stack.js.ws_nav': { 'cjm_fasthtml_card_stack.js.ws_nav._generate_ws_nav_js': ( 'js/ws_nav.html#_generate_ws_nav_js',
+                                                                                                              'cjm_fasthtml_card_stack/js/ws_nav.py')},
             'cjm_fasthtml_card_stack.keyboard.actions': { 'cjm_fasthtml_card_stack.keyboard.actions.build_card_stack_url_map': ( 'keyboard/actions.html#build_card_stack_url_map',
                                                                                                                                  'cjm_fasthtml_card_stack/keyboard/actions.py'),
                                                           'cjm_fasthtml_card_stack.keyboard.actions.create_card_stack_focus_zone': ( 'keyboard/actions.html#create_card_stack_focus_zone',
@@ -162,19 +530,111 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                       'cjm_fasthtml_card_stack/keyboard/actions.py'),
                                                           'cjm_fasthtml_card_stack.keyboard.actions.render_card_stack_action_buttons': ( 'keyboard/actions.html#render_card_stack_action_buttons',
                                                                                                                                          'cjm_fasthtml_card_stack/keyboard/actions.py')},
-            'cjm_fasthtml_card_stack.routes.handlers': { 'cjm_fasthtml_card_stack.routes.handlers.build_nav_response': ( 'routes/handlers.html#build_nav_response',
+            'cjm_fasthtml_card_stack.routes.handlers': { 'cjm_fasthtml_card_stack.routes.handlers._build_concurrently': ( 'routes/handlers.html#_build_concurrently',
+                                                                                                                          'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._choose_visible_count': ( 'routes/handlers.html#_choose_visible_count',
+                                                                                                                            'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._diff_base_index': ( 'routes/handlers.html#_diff_base_index',
+                                                                                                                       'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._maybe_await': ( 'routes/handlers.html#_maybe_await',
+                                                                                                                   'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._prefetch_window': ( 'routes/handlers.html#_prefetch_window',
+                                                                                                                       'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._resolve_direction': ( 'routes/handlers.html#_resolve_direction',
+                                                                                                                         'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._superseded': ( 'routes/handlers.html#_superseded',
+                                                                                                                  'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers._superseded_response': ( 'routes/handlers.html#_superseded_response',
+                                                                                                                           'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.build_nav_response': ( 'routes/handlers.html#build_nav_response',
                                                                                                                          'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.build_slots_response': ( 'routes/handlers.html#build_slots_response',
                                                                                                                            'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate': ( 'routes/handlers.html#card_stack_navigate',
                                                                                                                           'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate_async': ( 'routes/handlers.html#card_stack_navigate_async',
+                                                                                                                                'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate_by': ( 'routes/handlers.html#card_stack_navigate_by',
+                                                                                                                             'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate_by_async': ( 'routes/handlers.html#card_stack_navigate_by_async',
+                                                                                                                                   'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate_to_index': ( 'routes/handlers.html#card_stack_navigate_to_index',
                                                                                                                                    'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_navigate_to_index_async': ( 'routes/handlers.html#card_stack_navigate_to_index_async',
+                                                                                                                                         'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_save_prefs': ( 'routes/handlers.html#card_stack_save_prefs',
+                                                                                                                            'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.card_stack_save_scale': ( 'routes/handlers.html#card_stack_save_scale',
                                                                                                                             'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.card_stack_save_width': ( 'routes/handlers.html#card_stack_save_width',
                                                                                                                             'cjm_fasthtml_card_stack/routes/handlers.py'),
                                                          'cjm_fasthtml_card_stack.routes.handlers.card_stack_update_viewport': ( 'routes/handlers.html#card_stack_update_viewport',
-                                                                                                                                 'cjm_fasthtml_card_stack/routes/handlers.py')},
-            'cjm_fasthtml_card_stack.routes.router': { 'cjm_fasthtml_card_stack.routes.router.init_card_stack_router': ( 'routes/router.html#init_card_stack_router',
-                                                                                                                         'cjm_fasthtml_card_stack/routes/router.py')}}}
+                                                                                                                                 'cjm_fasthtml_card_stack/routes/handlers.py'),
+                                                         'cjm_fasthtml_card_stack.routes.handlers.card_stack_update_viewport_async': ( 'routes/handlers.html#card_stack_update_viewport_async',
+                                                                                                                                       'cjm_fasthtml_card_stack/routes/handlers.py')},
+            'cjm_fasthtml_card_stack.routes.item_events': { 'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier': ( 'routes/item_events.html#cardstacknotifier',
+                                                                                                                              'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier.__init__': ( 'routes/item_events.html#cardstacknotifier.__init__',
+                                                                                                                                       'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier.connected': ( 'routes/item_events.html#cardstacknotifier.connected',
+                                                                                                                                        'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier.notify_items_changed': ( 'routes/item_events.html#cardstacknotifier.notify_items_changed',
+                                                                                                                                                   'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier.subscribe': ( 'routes/item_events.html#cardstacknotifier.subscribe',
+                                                                                                                                        'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.CardStackNotifier.unsubscribe': ( 'routes/item_events.html#cardstacknotifier.unsubscribe',
+                                                                                                                                          'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._ItemSubscription': ( 'routes/item_events.html#_itemsubscription',
+                                                                                                                              'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._ItemSubscription.__init__': ( 'routes/item_events.html#_itemsubscription.__init__',
+                                                                                                                                       'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._ItemSubscription._merge': ( 'routes/item_events.html#_itemsubscription._merge',
+                                                                                                                                     'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._ItemSubscription.next': ( 'routes/item_events.html#_itemsubscription.next',
+                                                                                                                                   'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._ItemSubscription.push': ( 'routes/item_events.html#_itemsubscription.push',
+                                                                                                                                   'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events._clamp_focus': ( 'routes/item_events.html#_clamp_focus',
+                                                                                                                         'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.build_items_changed_response': ( 'routes/item_events.html#build_items_changed_response',
+                                                                                                                                         'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.build_items_changed_response_async': ( 'routes/item_events.html#build_items_changed_response_async',
+                                                                                                                                               'cjm_fasthtml_card_stack/routes/item_events.py'),
+                                                            'cjm_fasthtml_card_stack.routes.item_events.item_event_message': ( 'routes/item_events.html#item_event_message',
+                                                                                                                               'cjm_fasthtml_card_stack/routes/item_events.py')},
+            'cjm_fasthtml_card_stack.routes.prerender': { 'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer': ( 'routes/prerender.html#cardprerenderer',
+                                                                                                                        'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer.__init__': ( 'routes/prerender.html#cardprerenderer.__init__',
+                                                                                                                                 'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer._job_done': ( 'routes/prerender.html#cardprerenderer._job_done',
+                                                                                                                                  'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer._record_use': ( 'routes/prerender.html#cardprerenderer._record_use',
+                                                                                                                                    'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer._render_window': ( 'routes/prerender.html#cardprerenderer._render_window',
+                                                                                                                                       'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer.close': ( 'routes/prerender.html#cardprerenderer.close',
+                                                                                                                              'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer.schedule': ( 'routes/prerender.html#cardprerenderer.schedule',
+                                                                                                                                 'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer.wait': ( 'routes/prerender.html#cardprerenderer.wait',
+                                                                                                                             'cjm_fasthtml_card_stack/routes/prerender.py'),
+                                                          'cjm_fasthtml_card_stack.routes.prerender.CardPrerenderer.wrap': ( 'routes/prerender.html#cardprerenderer.wrap',
+                                                                                                                             'cjm_fasthtml_card_stack/routes/prerender.py')},
+            'cjm_fasthtml_card_stack.routes.router': { 'cjm_fasthtml_card_stack.routes.router._async_route': ( 'routes/router.html#_async_route',
+                                                                                                               'cjm_fasthtml_card_stack/routes/router.py'),
+                                                       'cjm_fasthtml_card_stack.routes.router._batched_route': ( 'routes/router.html#_batched_route',
+                                                                                                                 'cjm_fasthtml_card_stack/routes/router.py'),
+                                                       'cjm_fasthtml_card_stack.routes.router.init_card_stack_js_router': ( 'routes/router.html#init_card_stack_js_router',
+                                                                                                                            'cjm_fasthtml_card_stack/routes/router.py'),
+                                                       'cjm_fasthtml_card_stack.routes.router.init_card_stack_router': ( 'routes/router.html#init_card_stack_router',
+                                                                                                                         'cjm_fasthtml_card_stack/routes/router.py')},
+            'cjm_fasthtml_card_stack.routes.window': { 'cjm_fasthtml_card_stack.routes.window._apply_move': ( 'routes/window.html#_apply_move',
+                                                                                                              'cjm_fasthtml_card_stack/routes/window.py'),
+                                                       'cjm_fasthtml_card_stack.routes.window._superseded_payload': ( 'routes/window.html#_superseded_payload',
+                                                                                                                      'cjm_fasthtml_card_stack/routes/window.py'),
+                                                       'cjm_fasthtml_card_stack.routes.window.build_window_payload': ( 'routes/window.html#build_window_payload',
+                                                                                                                       'cjm_fasthtml_card_stack/routes/window.py'),
+                                                       'cjm_fasthtml_card_stack.routes.window.card_stack_window': ( 'routes/window.html#card_stack_window',
+                                                                                                                    'cjm_fasthtml_card_stack/routes/window.py'),
+                                                       'cjm_fasthtml_card_stack.routes.window.card_stack_window_async': ( 'routes/window.html#card_stack_window_async',
+                                                                                                                          'cjm_fasthtml_card_stack/routes/window.py')}}}
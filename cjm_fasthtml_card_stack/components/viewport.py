@@ -4,10 +4,13 @@ and OOB section updates."""
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/components/viewport.ipynb.
 
 # %% auto #0
-__all__ = ['render_slot_card', 'render_all_slots_oob', 'render_card_stack_scrollbar', 'render_viewport']
+__all__ = ['CompiledViewportStyles', 'compile_viewport_styles', 'render_slot_card', 'render_all_slots_oob',
+           'render_slots_diff_oob', 'render_card_stack_scrollbar', 'render_viewport']
 
 # %% ../../nbs/components/viewport.ipynb #v1000003
-from typing import Any, Callable, List, Optional
+import functools
+from dataclasses import dataclass, fields
+from typing import Any, Callable, List, Optional, Tuple
 
 from fasthtml.common import Div, Script, Hidden
 
@@ -28,13 +31,103 @@ from cjm_fasthtml_virtual_scrollbar.core.models import ScrollbarConfig, Scrollba
 from cjm_fasthtml_virtual_scrollbar.components.scrollbar import render_scrollbar
 
 # Local imports
-from ..core.config import CardStackConfig
+from ..core.config import CardStackConfig, CardStackStyleConfig
 from ..core.html_ids import CardStackHtmlIds
 from ..core.models import CardStackState, CardRenderContext, CardStackUrls
 from ..core.constants import CardRole
-from ..helpers.focus import resolve_focus_slot, calculate_viewport_window
+from ..core.data_source import CardItems, item_count, fetch_window
+from ..helpers.focus import resolve_focus_slot, calculate_viewport_window, encode_view_state
 from .states import render_placeholder_card
 
+# %% ../../nbs/components/viewport.ipynb #0gz8ktyzlo
+@dataclass(frozen=True)
+class CompiledViewportStyles:
+    """Precomputed class/style strings for one card stack configuration."""
+    section_before_cls: str  # Before section (cards aligned toward the focused card)
+    section_after_cls: str  # After section
+    focused_section_cls: str  # Focused section, including focus emphasis classes
+    focused_slot_cls: str  # Slot wrapper for the focused card
+    context_slot_cls: str  # Slot wrapper for context and placeholder cards
+    context_slot_overlay_cls: str  # Context slot wrapper that holds a click-to-focus overlay
+    inner_cls: str  # Grid container holding the three sections
+    outer_cls: str  # Outer viewport container
+    outer_style: str  # CSS custom property declarations for the outer container
+
+# %% ../../nbs/components/viewport.ipynb #g33z4tkogv
+_STYLE_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(CardStackStyleConfig))
+
+@functools.lru_cache(maxsize=64)
+def _compile_viewport_styles(
+    prefix: str,  # Card stack instance prefix
+    style_values: Tuple[str, ...],  # CardStackStyleConfig field values, in field order
+) -> CompiledViewportStyles:  # Compiled bundle
+    """Build all viewport wrapper classes for one prefix + style combination."""
+    style = CardStackStyleConfig(*style_values)
+
+    # Section styling — gap via CSS custom property.
+    # touch.none on before/after sections (not outer container) so the focused
+    # section can conditionally enable native touch scrolling for oversized cards.
+    section_cls = lambda alignment: combine_classes(
+        flex_display, flex_direction.col, alignment, items.center,
+        w.full, gap(f'[var(--{prefix}-section-gap)]'), overflow.hidden,
+        touch.none,
+    )
+
+    # Focus emphasis styling on the section (not the slot) so the shadow
+    # renders outside the overflow-y-auto clipping boundary.
+    focus_cls = combine_classes(
+        style.focus_ring,
+        style.focus_shadow,
+        style.focus_border_radius,
+        style.focus_z_index
+    )
+
+    # Slot container — context cards get configurable padding via CSS custom property
+    slot_cls = lambda is_focused, has_overlay: combine_classes(
+        "viewport-slot",
+        p(f'[var(--{prefix}-slot-padding)]') if not is_focused else "",
+        w.full,
+        position.relative if has_overlay else ""
+    )
+
+    return CompiledViewportStyles(
+        section_before_cls=section_cls(justify.end),
+        section_after_cls=section_cls(justify.start),
+        # Focused section starts with touch.none; JS toggles to pan-y when
+        # card content overflows (see constrainFocusedSection in coordinator).
+        focused_section_cls=combine_classes(
+            flex_display, justify.center, items.start, w.full,
+            overflow.y.auto, touch.none, focus_cls,
+        ),
+        focused_slot_cls=slot_cls(True, False),
+        context_slot_cls=slot_cls(False, False),
+        context_slot_overlay_cls=slot_cls(False, True),
+        inner_cls=combine_classes(
+            grid_display, w.full, h.full, m.x.auto,
+            gap(f'[var(--{prefix}-section-gap)]')
+        ),
+        # Outer container: no touch.none — touch-action set per-section so the
+        # focused section can conditionally allow native scrolling for oversized cards.
+        outer_cls=combine_classes(
+            grow(), min_h._0,
+            p.x(f'[var(--{prefix}-viewport-padding-x)]'),
+            p.y(f'[var(--{prefix}-viewport-padding-y)]'),
+            overflow.hidden,
+            opacity(0), transition.opacity, duration(150), ease._in
+        ),
+        # CSS custom property declarations on outer container
+        outer_style=style.css_vars_style(prefix),
+    )
+
+def compile_viewport_styles(
+    config: CardStackConfig,  # Card stack configuration
+) -> CompiledViewportStyles:  # Compiled bundle (cached per prefix + style values)
+    """Return the compiled viewport styles for a config."""
+    style = config.style
+    return _compile_viewport_styles(
+        config.prefix, tuple(getattr(style, name) for name in _STYLE_FIELDS)
+    )
+
 # %% ../../nbs/components/viewport.ipynb #v1000005
 def _render_mode_sync_script(
     active_mode: Optional[str] = None,  # Active keyboard mode name (None = navigation)
@@ -70,16 +163,18 @@ def _render_mode_sync_script(
     """)
 
 # %% ../../nbs/components/viewport.ipynb #v1000007
+_CLICK_OVERLAY_CLS: str = combine_classes(
+    position.absolute, inset(0), z(10),
+    cursor.pointer
+)
+
 def _render_click_overlay(
     item_index: int,  # Index of the item this slot represents
     urls: CardStackUrls,  # URL bundle for navigation
 ) -> Any:  # Transparent click overlay element
     """Render transparent click-to-focus overlay for a context card slot."""
     return Div(
-        cls=combine_classes(
-            position.absolute, inset(0), z(10),
-            cursor.pointer
-        ),
+        cls=_CLICK_OVERLAY_CLS,
         hx_post=urls.nav_to_index,
         hx_vals=f'{{"target_index": {item_index}}}',
         hx_swap="none"
@@ -89,7 +184,7 @@ def _render_click_overlay(
 def render_slot_card(
     slot_index: int,  # Index of this slot in the viewport (0-based)
     focus_slot: int,  # Which slot is the focused position
-    card_items: List[Any],  # Full items list
+    card_items: CardItems,  # Items list, data source, or fetched window
     item_index: int,  # Item index (negative or >= len for placeholder)
     render_card: Callable,  # Callback: (item, CardRenderContext) -> FT
     state: CardStackState,  # Current card stack state
@@ -97,6 +192,7 @@ def render_slot_card(
     ids: CardStackHtmlIds,  # HTML IDs for this instance
     urls: CardStackUrls,  # URL bundle for navigation
     oob: bool = False,  # Whether to render as OOB swap
+    styles: Optional[CompiledViewportStyles] = None,  # Precompiled classes (compiled from config if None)
 ) -> Any:  # Slot content wrapper
     """Render a single card for a viewport slot.
 
@@ -104,13 +200,14 @@ def render_slot_card(
     focused *section* div, not on the slot itself. This keeps the shadow
     outside the section's overflow-y-auto clipping boundary.
     """
-    total_items = len(card_items)
+    total_items = item_count(card_items)
     is_placeholder = item_index < 0 or item_index >= total_items
     slot_id = ids.viewport_slot(item_index)
     is_focused = slot_index == focus_slot
     card_role: CardRole = "focused" if is_focused else "context"
     distance = slot_index - focus_slot
-    prefix = config.prefix
+    if styles is None:
+        styles = compile_viewport_styles(config)
 
     # Determine placeholder type based on position relative to focus
     placeholder_type = "start" if slot_index < focus_slot else "end"
@@ -129,7 +226,7 @@ def render_slot_card(
             card_scale=state.card_scale,
             distance_from_focus=distance,
         )
-        content = render_card(card_items[item_index], context)
+        content = render_card(fetch_window(card_items, [item_index])[item_index], context)
 
     # Mode sync script in focused slot OOB updates
     mode_sync = _render_mode_sync_script(state.active_mode, zone_id=ids.card_stack) if (oob and is_focused) else None
@@ -140,12 +237,12 @@ def render_slot_card(
         click_overlay = _render_click_overlay(item_index, urls)
 
     # Slot container — context cards get configurable padding via CSS custom property
-    slot_cls = combine_classes(
-        "viewport-slot",
-        p(f'[var(--{prefix}-slot-padding)]') if not is_focused else "",
-        w.full,
-        position.relative if click_overlay else ""
-    )
+    if is_focused:
+        slot_cls = styles.focused_slot_cls
+    elif click_overlay:
+        slot_cls = styles.context_slot_overlay_cls
+    else:
+        slot_cls = styles.context_slot_cls
 
     return Div(
         content,
@@ -157,9 +254,25 @@ def render_slot_card(
         hx_swap_oob="innerHTML" if oob else None
     )
 
+# %% ../../nbs/components/viewport.ipynb #m3utsvsu1k
+def _render_focused_section_oob(
+    focused_card: Any,  # Rendered slot for the focused item
+    state: CardStackState,  # Current card stack state
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+) -> Any:  # Focused section with innerHTML OOB swap
+    """Render the focused viewport section as an OOB innerHTML swap."""
+    mode_sync = _render_mode_sync_script(state.active_mode, zone_id=ids.card_stack)
+    return Div(
+        focused_card, mode_sync,
+        id=ids.viewport_section_focused,
+        cls=compile_viewport_styles(config).focused_section_cls,
+        hx_swap_oob="innerHTML"
+    )
+
 # %% ../../nbs/components/viewport.ipynb #v1000021
 def render_all_slots_oob(
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
@@ -167,13 +280,14 @@ def render_all_slots_oob(
     render_card: Callable,  # Card renderer callback
 ) -> List[Any]:  # List of OOB elements (3 sections)
     """Render all viewport sections with OOB swap for granular updates."""
-    total_items = len(card_items)
+    total_items = item_count(card_items)
     focus_slot = resolve_focus_slot(state.focus_position, state.visible_count)
-    prefix = config.prefix
+    styles = compile_viewport_styles(config)
 
     viewport_indices = calculate_viewport_window(
         state.focused_index, total_items, state.visible_count, state.focus_position
     )
+    card_items = fetch_window(card_items, viewport_indices)
 
     before_cards = []
     focused_card = None
@@ -184,7 +298,7 @@ def render_all_slots_oob(
             slot_index=slot_index, focus_slot=focus_slot,
             card_items=card_items, item_index=item_index,
             render_card=render_card, state=state,
-            config=config, ids=ids, urls=urls, oob=False,
+            config=config, ids=ids, urls=urls, oob=False, styles=styles,
         )
 
         if slot_index < focus_slot:
@@ -194,52 +308,84 @@ def render_all_slots_oob(
         else:
             after_cards.append(card_el)
 
-    # Section styling — gap via CSS custom property.
-    # touch.none on before/after sections for custom touch nav.
-    section_cls = lambda alignment: combine_classes(
-        flex_display, flex_direction.col, alignment, items.center,
-        w.full, gap(f'[var(--{prefix}-section-gap)]'), overflow.hidden,
-        touch.none,
-    )
-
+    # touch.none on before/after sections for custom touch nav (see compiled styles).
     before_section = Div(
         *before_cards,
         id=ids.viewport_section_before,
-        cls=section_cls(justify.end),
+        cls=styles.section_before_cls,
         hx_swap_oob="innerHTML"
     )
 
-    # Focus emphasis styling on the section (not the slot) so the shadow
-    # renders outside the overflow-y-auto clipping boundary.
-    focus_cls = combine_classes(
-        config.style.focus_ring,
-        config.style.focus_shadow,
-        config.style.focus_border_radius,
-        config.style.focus_z_index
-    )
-
-    # Focused section starts with touch.none; JS toggles to pan-y when
-    # card content overflows (see constrainFocusedSection in coordinator).
-    mode_sync = _render_mode_sync_script(state.active_mode, zone_id=ids.card_stack)
-    focused_section = Div(
-        focused_card, mode_sync,
-        id=ids.viewport_section_focused,
-        cls=combine_classes(
-            flex_display, justify.center, items.start, w.full,
-            overflow.y.auto, touch.none, focus_cls,
-        ),
-        hx_swap_oob="innerHTML"
-    )
+    focused_section = _render_focused_section_oob(focused_card, state, config, ids)
 
     after_section = Div(
         *after_cards,
         id=ids.viewport_section_after,
-        cls=section_cls(justify.start),
+        cls=styles.section_after_cls,
         hx_swap_oob="innerHTML"
     )
 
     return [before_section, focused_section, after_section]
 
+# %% ../../nbs/components/viewport.ipynb #lbk9k8e838
+def render_slots_diff_oob(
+    prev_focused_index: int,  # Focused index the client DOM currently shows
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (already moved to the new index)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback
+) -> List[Any]:  # OOB slot operations (or 3 full sections on fallback)
+    """Render only the slot changes between the previous and current viewport windows."""
+    delta = state.focused_index - prev_focused_index
+    if delta == 0 or abs(delta) >= state.visible_count:
+        return render_all_slots_oob(card_items, state, config, ids, urls, render_card)
+
+    total_items = item_count(card_items)
+    focus_slot = resolve_focus_slot(state.focus_position, state.visible_count)
+    prev_indices = calculate_viewport_window(
+        prev_focused_index, total_items, state.visible_count, state.focus_position
+    )
+    new_indices = calculate_viewport_window(
+        state.focused_index, total_items, state.visible_count, state.focus_position
+    )
+    card_items = fetch_window(card_items, new_indices)
+    first_index = new_indices[0]
+    styles = compile_viewport_styles(config)
+
+    def _render(item_index):
+        return render_slot_card(
+            slot_index=item_index - first_index, focus_slot=focus_slot,
+            card_items=card_items, item_index=item_index,
+            render_card=render_card, state=state,
+            config=config, ids=ids, urls=urls, oob=False, styles=styles,
+        )
+
+    # Windows are contiguous, so arrivals always land on one edge of a section:
+    # the bottom when moving down, the top when moving up.
+    insert_swap = "beforeend" if delta > 0 else "afterbegin"
+    sections = (
+        (ids.viewport_section_before, prev_indices[:focus_slot], new_indices[:focus_slot]),
+        (ids.viewport_section_after, prev_indices[focus_slot + 1:], new_indices[focus_slot + 1:]),
+    )
+
+    ops = []
+    for section_id, prev_slots, new_slots in sections:
+        kept = set(prev_slots) & set(new_slots)
+        ops.extend(
+            Div(id=ids.viewport_slot(i), hx_swap_oob="delete")
+            for i in prev_slots if i not in kept
+        )
+        arriving = [_render(i) for i in new_slots if i not in kept]
+        if arriving:
+            ops.append(Div(*arriving, hx_swap_oob=f"{insert_swap}:#{section_id}"))
+
+    ops.append(_render_focused_section_oob(
+        _render(state.focused_index), state, config, ids
+    ))
+    return ops
+
 # %% ../../nbs/components/viewport.ipynb #v1000031
 def _grid_template_rows(
     focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
@@ -292,7 +438,7 @@ def render_card_stack_scrollbar(
 
 # %% ../../nbs/components/viewport.ipynb #v1000041
 def render_viewport(
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
@@ -301,13 +447,14 @@ def render_viewport(
     form_input_name: str = "focused_index",  # Name for the focused index hidden input
 ) -> Any:  # Viewport component with 3-section layout
     """Render the card stack viewport with 3-section CSS Grid layout."""
-    total_items = len(card_items)
+    total_items = item_count(card_items)
     focus_slot = resolve_focus_slot(state.focus_position, state.visible_count)
-    prefix = config.prefix
+    styles = compile_viewport_styles(config)
 
     viewport_indices = calculate_viewport_window(
         state.focused_index, total_items, state.visible_count, state.focus_position
     )
+    card_items = fetch_window(card_items, viewport_indices)
 
     before_cards = []
     focused_card = None
@@ -318,7 +465,7 @@ def render_viewport(
             slot_index=slot_index, focus_slot=focus_slot,
             card_items=card_items, item_index=item_index,
             render_card=render_card, state=state,
-            config=config, ids=ids, urls=urls, oob=False,
+            config=config, ids=ids, urls=urls, oob=False, styles=styles,
         )
 
         if slot_index < focus_slot:
@@ -328,78 +475,45 @@ def render_viewport(
         else:
             after_cards.append(card_el)
 
-    # Section styling — gap via CSS custom property.
-    # touch.none on before/after sections (not outer container) so the focused
-    # section can conditionally enable native touch scrolling for oversized cards.
-    section_cls = lambda alignment: combine_classes(
-        flex_display, flex_direction.col, alignment, items.center,
-        w.full, gap(f'[var(--{prefix}-section-gap)]'), overflow.hidden,
-        touch.none,
-    )
-
+    # Section, inner, and outer classes come from the compiled styles bundle
+    # (see Compiled Styles above for the touch-action and focus emphasis rules).
     before_section = Div(
         *before_cards,
         id=ids.viewport_section_before,
-        cls=section_cls(justify.end)
+        cls=styles.section_before_cls
     )
 
-    # Focus emphasis styling on the section (not the slot) so the shadow
-    # renders outside the overflow-y-auto clipping boundary.
-    focus_cls = combine_classes(
-        config.style.focus_ring,
-        config.style.focus_shadow,
-        config.style.focus_border_radius,
-        config.style.focus_z_index
-    )
-
-    # Focused section starts with touch.none; JS toggles to pan-y when
-    # card content overflows (see constrainFocusedSection in coordinator).
     focused_section = Div(
         focused_card,
         id=ids.viewport_section_focused,
-        cls=combine_classes(
-            flex_display, justify.center, items.start, w.full,
-            overflow.y.auto, touch.none, focus_cls,
-        )
+        cls=styles.focused_section_cls
     )
 
     after_section = Div(
         *after_cards,
         id=ids.viewport_section_after,
-        cls=section_cls(justify.start)
+        cls=styles.section_after_cls
     )
 
     # Grid template based on focus position intent (stable across count changes)
     grid_rows = _grid_template_rows(state.focus_position)
 
-    inner_cls = combine_classes(
-        grid_display, w.full, h.full, m.x.auto,
-        gap(f'[var(--{prefix}-section-gap)]')
-    )
     inner_style = f"grid-template-rows: {grid_rows}; max-width: {state.card_width}rem"
 
-    # Outer container: no touch.none — touch-action set per-section so the
-    # focused section can conditionally allow native scrolling for oversized cards.
-    outer_cls = combine_classes(
-        grow(), min_h._0,
-        p.x(f'[var(--{prefix}-viewport-padding-x)]'),
-        p.y(f'[var(--{prefix}-viewport-padding-y)]'),
-        overflow.hidden,
-        opacity(0), transition.opacity, duration(150), ease._in
-    )
-
-    # CSS custom property declarations on outer container
-    outer_style = config.style.css_vars_style(prefix)
-
     # Hidden input for focused index (needed for keyboard nav hx-include and OOB updates).
     # Also carries data-total-items so the boundary no-op guard and any other
     # client-side code can read both values from a single always-fresh element
     # (this input is OOB-swapped on every nav via render_focus_oob).
+    # data-nav-seq seeds the client's latest-wins counter after a page load.
+    # data-view carries the view state for stateless nav (config.stateless_nav).
+    view_attrs = {"data_view": encode_view_state(state, config)} if config.stateless_nav else {}
     focused_input = Hidden(
         id=ids.focused_index_input,
         name=form_input_name,
         value=str(state.focused_index),
         data_total_items=str(total_items),
+        data_nav_seq=str(state.nav_seq),
+        **view_attrs,
     )
 
     card_stack_el = Div(
@@ -408,14 +522,14 @@ def render_viewport(
             focused_section,
             after_section,
             id=ids.card_stack_inner,
-            cls=inner_cls,
+            cls=styles.inner_cls,
             style=inner_style
         ),
         _render_mode_sync_script(state.active_mode, zone_id=ids.card_stack),
         focused_input,
         id=ids.card_stack,
-        cls=outer_cls,
-        style=outer_style,
+        cls=styles.outer_cls,
+        style=styles.outer_style,
         data_focused_index=str(state.focused_index),
         data_total_items=str(total_items),
         data_visible_count=str(state.visible_count)
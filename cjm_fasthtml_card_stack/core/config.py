@@ -7,7 +7,7 @@ __all__ = ['CardStackStyleConfig', 'CardStackConfig']
 
 # %% ../../nbs/core/config.ipynb #b1000003
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Optional, Tuple
 
 from cjm_fasthtml_tailwind.utilities.layout import z
 from cjm_fasthtml_tailwind.utilities.effects import ring, shadow
@@ -15,6 +15,8 @@ from cjm_fasthtml_tailwind.core.base import combine_classes
 from cjm_fasthtml_daisyui.utilities.semantic_colors import shadow_dui, ring_dui
 from cjm_fasthtml_daisyui.utilities.border_radius import border_radius
 
+from .constants import TELEMETRY_INTERVAL_MS
+
 # %% ../../nbs/core/config.ipynb #b1000005
 _prefix_counter: int = 0
 
@@ -72,6 +74,7 @@ class CardStackConfig:
 
     # Card count selector options
     visible_count_options: Tuple[int, ...] = (1, 3, 5, 7, 9)  # Choices for card count dropdown
+    visible_count_max: int = 50  # Upper bound for client-supplied visible counts (auto-adjust and view tokens)
 
     # Width slider bounds
     card_width_min: int = 30    # Width slider minimum (rem)
@@ -90,5 +93,15 @@ class CardStackConfig:
     # Scrollbar
     show_scrollbar: bool = True  # Show virtual scrollbar for mouse-driven scrubbing
 
+    # Navigation responses
+    incremental_nav: bool = False  # Send per-slot OOB diffs for small nav steps (context cards must not depend on distance_from_focus)
+    stateless_nav: bool = False    # Nav requests carry the view state; nav routes neither read nor write stored state
+    client_position_updates: bool = False  # Nav responses skip the progress and scrollbar re-renders (the client updates them in place)
+    window_patcher: bool = False  # Include the JSON window patcher JS (ns.fetchWindow / ns.applyWindow, needs urls.nav_window)
+    state_secret: Optional[str] = field(default=None, repr=False)  # HMAC key for signed view tokens (share across replicas)
+
+    # Client telemetry (active when urls.client_telemetry is set)
+    telemetry_interval_ms: int = TELEMETRY_INTERVAL_MS  # Milliseconds between telemetry beacons
+
     # Visual styling
     style: CardStackStyleConfig = field(default_factory=CardStackStyleConfig)  # Visual styling config
@@ -5,11 +5,12 @@
 # %% auto #0
 __all__ = ['CardRole', 'SCROLL_THRESHOLD', 'NAVIGATION_COOLDOWN', 'TRACKPAD_COOLDOWN', 'TOUCH_SWIPE_THRESHOLD',
            'TOUCH_MOMENTUM_MIN_VELOCITY', 'TOUCH_MOMENTUM_FRICTION', 'TOUCH_PINCH_THRESHOLD', 'TOUCH_VELOCITY_SAMPLES',
-           'DEFAULT_VISIBLE_COUNT', 'DEFAULT_CARD_WIDTH', 'DEFAULT_CARD_SCALE', 'width_storage_key',
+           'DEFAULT_VISIBLE_COUNT', 'DEFAULT_CARD_WIDTH', 'DEFAULT_CARD_SCALE', 'NAV_SEQ_HEADER',
+           'VISIBLE_COUNT_HEADER', 'TELEMETRY_BUCKETS', 'TELEMETRY_INTERVAL_MS', 'ITEM_EVENT', 'width_storage_key',
            'scale_storage_key', 'card_count_storage_key', 'auto_count_storage_key']
 
 # %% ../../nbs/core/constants.ipynb #e1000003
-from typing import Literal
+from typing import Literal, Tuple
 
 # %% ../../nbs/core/constants.ipynb #e1000005
 CardRole = Literal["focused", "context"]
@@ -55,3 +56,16 @@ def auto_count_storage_key(
 DEFAULT_VISIBLE_COUNT: int = 1  # Default number of cards visible in viewport (auto-adjust grows from here)
 DEFAULT_CARD_WIDTH: int = 80    # Default card stack width in rem
 DEFAULT_CARD_SCALE: int = 100   # Default card scale percentage
+
+# %% ../../nbs/core/constants.ipynb #p002u5geeu
+NAV_SEQ_HEADER: str = "X-Card-Stack-Nav-Seq"  # Response header carrying the server's latest nav_seq
+
+# %% ../../nbs/core/constants.ipynb #81l18dovr3
+VISIBLE_COUNT_HEADER: str = "X-Card-Stack-Visible-Count"  # Response header carrying a server-chosen visible count
+
+# %% ../../nbs/core/constants.ipynb #wq0fsqpjpx
+TELEMETRY_BUCKETS: Tuple[float, ...] = (1, 2, 4, 8, 16, 33, 50, 100, 200, 400, 800, 1600)  # Histogram bucket upper bounds (ms, or plain counts)
+TELEMETRY_INTERVAL_MS: int = 30000  # Default client telemetry beacon interval
+
+# %% ../../nbs/core/constants.ipynb #mywtguae4l
+ITEM_EVENT: str = "items"  # SSE event type of item change pushes
@@ -0,0 +1,147 @@
+"""Windowed item access protocol so render paths fetch only the indices in the viewport window."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/data_source.ipynb.
+
+# %% auto #0
+__all__ = ['CardItems', 'CardStackDataSource', 'ListDataSource', 'WindowedItems', 'CountedItems', 'item_count', 'fetch_window',
+           'count_once']
+
+# %% ../../nbs/core/data_source.ipynb #ds3wtz5vv3
+from typing import Any, List, Optional, Protocol, Sequence, Union, runtime_checkable
+
+# %% ../../nbs/core/data_source.ipynb #ia58a5ij2q
+@runtime_checkable
+class CardStackDataSource(Protocol):
+    """Windowed access to card stack items."""
+
+    def count(self) -> int:  # Total number of items
+        """Return the total number of items."""
+        ...
+
+    def get_range(
+        self,
+        start: int,  # First item index (inclusive, >= 0)
+        stop: int,  # Last item index (exclusive, <= count())
+    ) -> Sequence[Any]:  # Items in [start, stop)
+        """Return the items in the half-open index range [start, stop)."""
+        ...
+
+CardItems = Union[Sequence[Any], CardStackDataSource]  # Plain items list or windowed data source
+
+# %% ../../nbs/core/data_source.ipynb #jpjw9mxlq8
+class ListDataSource:
+    """Data source backed by an in-memory sequence."""
+
+    def __init__(
+        self,
+        items: Sequence[Any],  # Items to expose
+    ):
+        self.items = items
+
+    def count(self) -> int:  # Total number of items
+        """Return the total number of items."""
+        return len(self.items)
+
+    def get_range(
+        self,
+        start: int,  # First item index (inclusive)
+        stop: int,  # Last item index (exclusive)
+    ) -> Sequence[Any]:  # Items in [start, stop)
+        """Return the items in [start, stop)."""
+        return self.items[start:stop]
+
+# %% ../../nbs/core/data_source.ipynb #w4jo2jdbb4
+class WindowedItems:
+    """Absolute-index view over one fetched range of a data source."""
+
+    def __init__(
+        self,
+        total: int,  # Total item count in the source
+        start: int,  # Absolute index of the first fetched item
+        items: Sequence[Any],  # Fetched items
+    ):
+        self.total = total
+        self.start = start
+        self.items = items
+
+    def __len__(self) -> int:  # Total item count (not the fetched window size)
+        return self.total
+
+    def __getitem__(
+        self,
+        index: int,  # Absolute item index
+    ) -> Any:  # Item at that index
+        offset = index - self.start
+        if index < 0 or offset < 0 or offset >= len(self.items):
+            raise IndexError(f"Item {index} is outside the fetched window")
+        return self.items[offset]
+
+# %% ../../nbs/core/data_source.ipynb #c0untonce1
+class CountedItems:
+    """Data source view that calls the wrapped source's `count()` at most once."""
+
+    def __init__(
+        self,
+        source: CardStackDataSource,  # Wrapped data source
+    ):
+        self.source = source
+        self.total: Optional[int] = None  # Cached count (None until first asked)
+
+    def count(self) -> int:  # Total number of items (counted on first call)
+        """Return the total number of items, counting the source only once."""
+        if self.total is None:
+            self.total = self.source.count()
+        return self.total
+
+    def get_range(
+        self,
+        start: int,  # First item index (inclusive)
+        stop: int,  # Last item index (exclusive)
+    ) -> Sequence[Any]:  # Items in [start, stop)
+        """Return the items in [start, stop) from the wrapped source."""
+        return self.source.get_range(start, stop)
+
+# %% ../../nbs/core/data_source.ipynb #s4xovgw9vq
+def _is_data_source(
+    card_items: CardItems,  # Items list or data source
+) -> bool:  # Whether card_items implements CardStackDataSource
+    """Protocol check with a fast path for plain lists and fetched windows.
+
+    isinstance() against a runtime-checkable Protocol inspects every protocol
+    member, and render paths call this once per slot.
+    """
+    if isinstance(card_items, (list, tuple, WindowedItems)):
+        return False
+    if isinstance(card_items, CountedItems):
+        return True
+    return isinstance(card_items, CardStackDataSource)
+
+def item_count(
+    card_items: CardItems,  # Items list or data source
+) -> int:  # Total number of items
+    """Total item count for a list or data source."""
+    if _is_data_source(card_items):
+        return card_items.count()
+    return len(card_items)
+
+def fetch_window(
+    card_items: CardItems,  # Items list or data source
+    indices: List[int],  # Item indices needed (may include placeholder indices)
+) -> Sequence[Any]:  # Sequence indexable by absolute item index for the requested indices
+    """Fetch only the items for the given indices from a data source."""
+    if not _is_data_source(card_items):
+        return card_items
+    total = card_items.count()
+    real = [i for i in indices if 0 <= i < total]
+    if not real:
+        return WindowedItems(total, 0, [])
+    start, stop = min(real), max(real) + 1
+    return WindowedItems(total, start, card_items.get_range(start, stop))
+
+def count_once(
+    card_items: CardItems,  # Items list or data source
+) -> CardItems:  # Same items; data sources wrapped so count() runs once
+    """Wrap a data source for one request so its count is computed only once."""
+    if isinstance(card_items, CountedItems) or not _is_data_source(card_items):
+        return card_items
+    return CountedItems(card_items)
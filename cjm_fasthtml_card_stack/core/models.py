@@ -3,14 +3,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/models.ipynb.
 
 # %% auto #0
-__all__ = ['CardStackState', 'CardRenderContext', 'CardStackUrls']
+__all__ = ['STATE_FORMAT_VERSION', 'CardStackState', 'CardRenderContext', 'CardStackUrls', 'state_to_compact',
+           'state_from_compact', 'encode_state', 'decode_state']
 
 # %% ../../nbs/core/models.ipynb #a1000003
-from dataclasses import dataclass
-from typing import Optional
+import json
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Optional
 
 # %% ../../nbs/core/models.ipynb #a1000005
-@dataclass
+@dataclass(slots=True)
 class CardStackState:
     """Viewport state for a card stack instance."""
     focused_index: int = 0              # Index of focused item in the items list
@@ -20,9 +22,10 @@ class CardStackState:
     active_mode: Optional[str] = None  # Current interaction mode name (consumer-defined)
     focus_position: Optional[int] = None  # Slot offset for focused card (None=center, -1=bottom)
     is_auto_mode: bool = True          # Whether auto-adjust mode is active
+    nav_seq: int = 0                   # Highest client navigation sequence number processed (latest-wins)
 
 # %% ../../nbs/core/models.ipynb #a1000010
-@dataclass
+@dataclass(slots=True)
 class CardRenderContext:
     """Context passed to the consumer's render_card callback."""
     card_role: str                     # "focused" or "context"
@@ -35,7 +38,7 @@ class CardRenderContext:
     distance_from_focus: int           # Signed slot offset from focused card (0=focused)
 
 # %% ../../nbs/core/models.ipynb #a1000015
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CardStackUrls:
     """URL bundle for card stack navigation and viewport operations."""
 
@@ -47,8 +50,92 @@ class CardStackUrls:
     nav_page_up: str = ""   # Page jump up
     nav_page_down: str = "" # Page jump down
     nav_to_index: str = ""  # Navigate to specific index (click-to-focus)
+    nav_by: str = ""        # Navigate by a signed step count (coalesced wheel bursts)
 
     # Viewport URLs
     update_viewport: str = ""  # Change visible_count (full viewport re-render)
     save_width: str = ""       # Persist card_width
     save_scale: str = ""       # Persist card_scale
+    save_prefs: str = ""       # Persist any subset of width, scale, count, and auto mode (batched)
+
+    # JSON window URL
+    nav_window: str = ""  # Navigate and return the window as JSON (custom clients, window patcher)
+    nav_ws: str = ""      # WebSocket nav transport (empty = nav over HTTP only)
+
+    # Telemetry URL
+    client_telemetry: str = ""  # Receive client telemetry beacons (empty = telemetry off)
+
+    # Push URL
+    item_events: str = ""  # Item change event stream (empty = no server push)
+
+# %% ../../nbs/core/models.ipynb #g9u4nvfte7
+STATE_FORMAT_VERSION: int = 1  # Version written by state_to_compact
+
+_STATE_SHORT_KEYS: Dict[str, str] = {  # CardStackState field -> compact key
+    "focused_index": "i",
+    "visible_count": "n",
+    "card_width": "w",
+    "card_scale": "s",
+    "active_mode": "m",
+    "focus_position": "p",
+    "is_auto_mode": "a",
+    "nav_seq": "q",
+}
+_STATE_FIELDS_BY_KEY: Dict[str, str] = {v: k for k, v in _STATE_SHORT_KEYS.items()}
+_STATE_DEFAULTS: Dict[str, Any] = {f.name: f.default for f in fields(CardStackState)}
+
+def _is_int(value: Any) -> bool:
+    """Whether a decoded JSON value is a plain integer (not a bool)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+_STATE_VALUE_CHECKS: Dict[str, Callable[[Any], bool]] = {  # compact key -> accepts the decoded value
+    "i": lambda v: _is_int(v) and v >= 0,
+    "n": lambda v: _is_int(v) and v >= 1,
+    "w": lambda v: _is_int(v) and v >= 1,
+    "s": lambda v: _is_int(v) and v >= 1,
+    "m": lambda v: v is None or isinstance(v, str),
+    "p": lambda v: v is None or _is_int(v),
+    "a": lambda v: isinstance(v, int) and v in (0, 1),
+    "q": lambda v: _is_int(v) and v >= 0,
+}
+
+def state_to_compact(
+    state: CardStackState,  # State to serialize
+) -> Dict[str, Any]:  # Versioned short-key dict (default-valued fields omitted)
+    """Serialize a state to its compact versioned form."""
+    data: Dict[str, Any] = {"v": STATE_FORMAT_VERSION}
+    for name, key in _STATE_SHORT_KEYS.items():
+        value = getattr(state, name)
+        if value != _STATE_DEFAULTS[name]:
+            data[key] = int(value) if isinstance(value, bool) else value
+    return data
+
+def state_from_compact(
+    data: Dict[str, Any],  # Versioned short-key dict from state_to_compact
+) -> CardStackState:  # Rebuilt state
+    """Rebuild a state from its compact form (rejects wrongly typed or out-of-range values)."""
+    if not isinstance(data, dict) or data.get("v") != STATE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported card stack state format: {data!r:.80}")
+    values = {_STATE_FIELDS_BY_KEY[k]: v for k, v in data.items() if k in _STATE_FIELDS_BY_KEY}
+    for key, check in _STATE_VALUE_CHECKS.items():
+        if key in data and not check(data[key]):
+            raise ValueError(f"Invalid card stack state value for {key!r}: {data[key]!r:.40}")
+    if "a" in data:
+        values["is_auto_mode"] = bool(data["a"])
+    return CardStackState(**values)
+
+def encode_state(
+    state: CardStackState,  # State to serialize
+) -> str:  # Minimal JSON text
+    """Encode a state as compact JSON text."""
+    return json.dumps(state_to_compact(state), separators=(",", ":"))
+
+def decode_state(
+    text: str,  # JSON text from encode_state
+) -> CardStackState:  # Rebuilt state
+    """Decode a state from compact JSON text."""
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed card stack state: {text!r:.80}") from e
+    return state_from_compact(data)
@@ -0,0 +1,298 @@
+"""Pluggable CardStackState persistence (memory, session cookie, SQLite) that skips unchanged writes and batches the rest."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/state_store.ipynb.
+
+# %% auto #0
+__all__ = ['state_to_dict', 'state_from_dict', 'state_snapshot', 'CardStackStateStore', 'batch_state_writes', 'MemoryStateStore',
+           'SessionStateStore', 'SqliteStateStore']
+
+# %% ../../nbs/core/state_store.ipynb #3v2c2kopxl
+import contextlib
+import dataclasses
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .models import CardStackState, state_to_compact, state_from_compact
+
+# %% ../../nbs/core/state_store.ipynb #zbeofpexxs
+_STATE_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in dataclasses.fields(CardStackState))
+# nav_seq changes on every nav request, so including it would make every no-op move look dirty
+_SNAPSHOT_FIELD_NAMES: Tuple[str, ...] = tuple(name for name in _STATE_FIELD_NAMES if name != "nav_seq")
+
+def state_to_dict(
+    state: CardStackState,  # State to serialize
+) -> Dict[str, Any]:  # JSON-ready field values
+    """Serialize a state to a dict of its fields."""
+    return dataclasses.asdict(state)
+
+def state_from_dict(
+    data: Dict[str, Any],  # Stored field values
+    default_factory: Callable[[], CardStackState] = CardStackState,  # Supplies defaults for missing fields
+) -> CardStackState:  # Rebuilt state
+    """Rebuild a state from stored field values."""
+    base = default_factory()
+    known = {f.name for f in dataclasses.fields(base)}
+    return dataclasses.replace(base, **{k: v for k, v in data.items() if k in known})
+
+def state_snapshot(
+    state: CardStackState,  # State to snapshot
+) -> Tuple:  # Comparable field values
+    """Cheap comparable snapshot used to detect unchanged state (ignores `nav_seq`)."""
+    return tuple(getattr(state, name) for name in _SNAPSHOT_FIELD_NAMES)
+
+# %% ../../nbs/core/state_store.ipynb #26fvxp2dch
+_SESSION_ID_KEY: str = "card_stack_sid"  # Session entry holding the store's per-session ID
+
+_pending_writes: ContextVar[Optional[Dict[Tuple[int, str], Tuple["CardStackStateStore", Any, str, Dict[str, Any]]]]] = (
+    ContextVar("card_stack_pending_writes", default=None)
+)
+
+class CardStackStateStore:
+    """Base class for card stack state persistence with dirty tracking."""
+
+    def __init__(
+        self,
+        default_factory: Callable[[], CardStackState] = CardStackState,  # State used when nothing is stored
+        per_session: bool = True,  # Key states by session (False = one shared state per namespace)
+        max_tracked: int = 4096,  # Most recently used keys whose snapshots are kept for dirty tracking
+    ):
+        self.default_factory = default_factory
+        self.per_session = per_session
+        self.max_tracked = max_tracked
+        self.writes = 0  # Backend write calls (a batch counts once)
+        self.skipped = 0  # put() calls skipped because the state was unchanged
+        self._clean: "OrderedDict[str, Tuple]" = OrderedDict()  # key -> snapshot of the state last read or written
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        namespace: str,  # Card stack namespace (usually config.prefix)
+        session: Optional[dict] = None,  # Request session (None = single shared state)
+    ) -> str:  # Storage key
+        """Storage key for a namespace within a session."""
+        if session is None or not self.per_session:
+            return f"default/{namespace}"
+        sid = session.get(_SESSION_ID_KEY)
+        if sid is None:
+            sid = session[_SESSION_ID_KEY] = uuid.uuid4().hex
+        return f"{sid}/{namespace}"
+
+    def get(
+        self,
+        namespace: str,  # Card stack namespace (usually config.prefix)
+        session: Optional[dict] = None,  # Request session (None = single shared state)
+    ) -> CardStackState:  # Fresh state (stored, or a default)
+        """Load a state and remember its snapshot for dirty tracking."""
+        key = self.key(namespace, session)
+        pending = _pending_writes.get()
+        if pending is not None and (id(self), key) in pending:
+            data = pending[(id(self), key)][3]  # Read-your-writes inside a batch
+        else:
+            data = self._read(session, key)
+        state = self._load(data)
+        with self._lock:
+            self._remember(key, state_snapshot(state))
+        return state
+
+    def put(
+        self,
+        namespace: str,  # Card stack namespace (usually config.prefix)
+        state: CardStackState,  # State to store
+        session: Optional[dict] = None,  # Request session (None = single shared state)
+    ) -> bool:  # Whether a write was issued (or queued in a batch)
+        """Store a state unless it is unchanged since it was last read or written."""
+        key = self.key(namespace, session)
+        snapshot = state_snapshot(state)
+        with self._lock:
+            if self._clean.get(key) == snapshot:
+                self.skipped += 1
+                return False
+            self._remember(key, snapshot)
+        data = state_to_compact(state)
+        pending = _pending_writes.get()
+        if pending is not None:
+            pending[(id(self), key)] = (self, session, key, data)
+        else:
+            self._flush([(session, key, data)])
+        return True
+
+    def _remember(
+        self,
+        key: str,  # Storage key
+        snapshot: Tuple,  # Snapshot of the state last read or written
+    ) -> None:
+        """Track a key's snapshot, dropping least-recently-used keys (caller holds the lock)."""
+        self._clean[key] = snapshot
+        self._clean.move_to_end(key)
+        while len(self._clean) > self.max_tracked:
+            self._clean.popitem(last=False)
+
+    def _load(
+        self,
+        data: Optional[Dict[str, Any]],  # Stored data (compact, or a plain field dict)
+    ) -> CardStackState:  # Stored state, or a default
+        """Rebuild a state from stored data."""
+        if data is None:
+            return self.default_factory()
+        if "v" in data:
+            try:
+                return state_from_compact(data)
+            except ValueError:
+                return self.default_factory()  # Unknown format version (e.g. written by a newer release)
+        return state_from_dict(data, self.default_factory)
+
+    def _flush(
+        self,
+        entries: List[Tuple[Any, str, Dict[str, Any]]],  # (session, key, data) to write
+    ) -> None:
+        """Write entries in one backend call."""
+        self._write_many(entries)
+        self.writes += 1
+
+    def _read(
+        self,
+        session: Optional[dict],  # Request session
+        key: str,  # Storage key
+    ) -> Optional[Dict[str, Any]]:  # Stored data, or None
+        """Backend read."""
+        raise NotImplementedError
+
+    def _write_many(
+        self,
+        entries: List[Tuple[Any, str, Dict[str, Any]]],  # (session, key, data) to write
+    ) -> None:
+        """Backend write of one or more entries."""
+        raise NotImplementedError
+
+@contextlib.contextmanager
+def batch_state_writes() -> Iterator[None]:
+    """Defer and coalesce state store writes until the block exits."""
+    if _pending_writes.get() is not None:
+        yield  # Nested: the outer batch flushes
+        return
+    pending: Dict[Tuple[int, str], Tuple[CardStackStateStore, Any, str, Dict[str, Any]]] = {}
+    token = _pending_writes.set(pending)
+    try:
+        yield
+    finally:
+        _pending_writes.reset(token)
+        by_store: Dict[int, Tuple[CardStackStateStore, List]] = {}
+        for store, session, key, data in pending.values():
+            by_store.setdefault(id(store), (store, []))[1].append((session, key, data))
+        for store, entries in by_store.values():
+            store._flush(entries)
+
+# %% ../../nbs/core/state_store.ipynb #br68sfjrqf
+class MemoryStateStore(CardStackStateStore):
+    """Process-local state store (single process; lost on restart)."""
+
+    def __init__(
+        self,
+        default_factory: Callable[[], CardStackState] = CardStackState,  # State used when nothing is stored
+        per_session: bool = True,  # Key states by session (False = one shared state per namespace)
+        max_tracked: int = 4096,  # Most recently used keys whose snapshots are kept for dirty tracking
+    ):
+        super().__init__(default_factory, per_session, max_tracked)
+        self._data: Dict[str, Dict[str, Any]] = {}
+
+    def _read(self, session, key):
+        with self._lock:
+            data = self._data.get(key)
+        return dict(data) if data is not None else None
+
+    def _write_many(self, entries):
+        with self._lock:
+            for _, key, data in entries:
+                self._data[key] = data
+
+# %% ../../nbs/core/state_store.ipynb #uh0egukvkj
+class SessionStateStore(CardStackStateStore):
+    """State stored in the request session (a signed cookie by default in FastHTML).
+
+    The session travels with each request, so its contents are the dirty
+    baseline rather than the process-wide snapshots.
+    """
+
+    def __init__(
+        self,
+        default_factory: Callable[[], CardStackState] = CardStackState,  # State used when nothing is stored
+        key_prefix: str = "card_stack:",  # Session entry prefix
+    ):
+        super().__init__(default_factory)
+        self.key_prefix = key_prefix
+
+    def key(self, namespace, session=None):
+        if session is None:
+            raise ValueError("SessionStateStore needs the request session")
+        return f"{self.key_prefix}{namespace}"
+
+    def get(self, namespace, session=None):
+        key = self.key(namespace, session)
+        return self._load(session.get(key))
+
+    def put(self, namespace, state, session=None):
+        key = self.key(namespace, session)
+        if state == self._load(session.get(key)):
+            self.skipped += 1
+            return False
+        data = state_to_compact(state)
+        # Written immediately even inside a batch: the session middleware
+        # serializes the cookie once per response anyway.
+        self._flush([(session, key, data)])
+        return True
+
+    def _read(self, session, key):
+        return session.get(key)
+
+    def _write_many(self, entries):
+        for session, key, data in entries:
+            session[key] = data
+
+# %% ../../nbs/core/state_store.ipynb #5vavq51n36
+_TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+class SqliteStateStore(CardStackStateStore):
+    """State stored in a SQLite table (one row per session and namespace)."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",  # Database file path
+        table: str = "card_stack_state",  # Table name (created if missing)
+        default_factory: Callable[[], CardStackState] = CardStackState,  # State used when nothing is stored
+        per_session: bool = True,  # Key states by session (False = one shared state per namespace)
+        max_tracked: int = 4096,  # Most recently used keys whose snapshots are kept for dirty tracking
+    ):
+        super().__init__(default_factory, per_session, max_tracked)
+        if not _TABLE_NAME_RE.match(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.table = table
+        self._db_lock = threading.Lock()
+        # Autocommit mode; writes open explicit transactions
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def _read(self, session, key):
+        with self._db_lock:
+            row = self._conn.execute(f"SELECT data FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write_many(self, entries):
+        rows = [(key, json.dumps(data, separators=(",", ":"))) for _, key, data in entries]
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(f"INSERT OR REPLACE INTO {self.table} (key, data) VALUES (?, ?)", rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,63 @@
+"""HMAC-signed compact state tokens, so client-carried state can be trusted across app replicas."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/state_token.ipynb.
+
+# %% auto #0
+__all__ = ['sign_state_token', 'verify_state_token']
+
+# %% ../../nbs/core/state_token.ipynb #pvtv5b4eed
+import base64
+import hashlib
+import hmac
+from typing import Optional, Union
+
+from .models import CardStackState, encode_state, decode_state
+
+# %% ../../nbs/core/state_token.ipynb #xmign5meen
+_TAG_BYTES = 16  # Truncated HMAC-SHA256 tag length (128 bits)
+
+def _b64encode(data: bytes) -> str:
+    """Unpadded base64url."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(text: str) -> bytes:
+    """Decode unpadded base64url (raises ValueError on bad input)."""
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def _tag(
+    secret: Union[str, bytes],  # Signing key
+    namespace: str,  # Token namespace (card stack prefix)
+    payload: str,  # Encoded payload
+) -> bytes:  # Truncated HMAC tag
+    """HMAC-SHA256 over the namespace and payload."""
+    key = secret.encode("utf-8") if isinstance(secret, str) else secret
+    message = f"{namespace}.{payload}".encode("utf-8")
+    return hmac.new(key, message, hashlib.sha256).digest()[:_TAG_BYTES]
+
+def sign_state_token(
+    state: CardStackState,  # State to serialize
+    secret: Union[str, bytes],  # Signing key shared by all replicas
+    namespace: str = "",  # Binds the token to one card stack (use the config prefix)
+) -> str:  # Signed token: <payload>.<tag>
+    """Serialize a state into a signed, compact, URL- and attribute-safe token."""
+    payload = _b64encode(encode_state(state).encode("utf-8"))
+    return f"{payload}.{_b64encode(_tag(secret, namespace, payload))}"
+
+def verify_state_token(
+    token: Optional[str],  # Token sent by the client
+    secret: Union[str, bytes],  # Signing key shared by all replicas
+    namespace: str = "",  # Namespace the token must have been signed for
+) -> Optional[CardStackState]:  # Decoded state, or None if the token does not verify
+    """Verify a signed token and decode its state."""
+    if not token:
+        return None
+    payload, sep, tag = token.partition(".")
+    if not sep:
+        return None
+    try:
+        valid = hmac.compare_digest(_b64decode(tag), _tag(secret, namespace, payload))
+        if not valid:
+            return None
+        return decode_state(_b64decode(payload).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
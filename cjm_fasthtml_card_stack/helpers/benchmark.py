@@ -0,0 +1,304 @@
+"""In-process benchmark suite for the render and navigation hot paths, with stored baselines to flag regressions."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/benchmark.ipynb.
+
+# %% auto #0
+__all__ = ['BENCH_TARGETS', 'BASELINE_FORMAT_VERSION', 'BenchCase', 'bench_cases', 'BenchResult', 'run_case', 'run_benchmarks',
+           'BenchRegression', 'save_baseline', 'load_baseline', 'compare_to_baseline', 'format_results',
+           'card_stack_bench']
+
+# %% ../../nbs/helpers/benchmark.ipynb #vne9owhbtl
+import dataclasses
+import itertools
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastcore.script import call_parse
+from fasthtml.common import Div, Span, to_xml
+
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState, CardStackUrls, CardRenderContext
+from ..components.viewport import render_viewport, render_all_slots_oob
+from cjm_fasthtml_card_stack.routes.handlers import (
+    build_nav_response, card_stack_navigate, card_stack_update_viewport,
+)
+
+# %% ../../nbs/helpers/benchmark.ipynb #4l9hlzg7h1
+class _SyntheticItems:
+    """Data source that generates item text on demand."""
+
+    def __init__(
+        self,
+        total: int,  # Total number of items
+    ):
+        self.total = total
+
+    def count(self) -> int:  # Total number of items
+        """Return the total number of items."""
+        return self.total
+
+    def get_range(
+        self,
+        start: int,  # First item index (inclusive)
+        stop: int,  # Last item index (exclusive)
+    ) -> List[str]:  # Generated items in [start, stop)
+        """Return generated items for [start, stop)."""
+        return [f"Item {i}: the quick brown fox jumps over the lazy dog." for i in range(start, stop)]
+
+def _bench_render(
+    item: Any,  # Item to render
+    ctx: CardRenderContext,  # Render context
+) -> Any:  # Card content
+    """Representative card renderer: a couple of elements and role-dependent classes."""
+    return Div(Span(f"#{ctx.index + 1}"), Span(str(item)), cls=f"card card-{ctx.card_role}")
+
+_BENCH_URLS = CardStackUrls(
+    nav_up="/bench/nav_up", nav_down="/bench/nav_down",
+    nav_first="/bench/nav_first", nav_last="/bench/nav_last",
+    nav_page_up="/bench/nav_page_up", nav_page_down="/bench/nav_page_down",
+    nav_to_index="/bench/nav_to_index", nav_by="/bench/nav_by",
+    update_viewport="/bench/update_viewport",
+)
+
+BENCH_TARGETS: Dict[str, Callable] = {  # Target name -> call(items, state, config, ids, urls, render_card)
+    "render_viewport": lambda items, state, config, ids, urls, render: render_viewport(
+        items, state, config, ids, urls, render),
+    "render_all_slots_oob": lambda items, state, config, ids, urls, render: render_all_slots_oob(
+        items, state, config, ids, urls, render),
+    "build_nav_response": lambda items, state, config, ids, urls, render: build_nav_response(
+        items, state, config, ids, urls, render),
+    "card_stack_navigate": lambda items, state, config, ids, urls, render: card_stack_navigate(
+        "down", items, dataclasses.replace(state), config, ids, urls, render),
+    "card_stack_update_viewport": lambda items, state, config, ids, urls, render: card_stack_update_viewport(
+        state.visible_count, items, dataclasses.replace(state), config, ids, urls, render, is_auto=False),
+}
+
+# %% ../../nbs/helpers/benchmark.ipynb #fezilnrscm
+@dataclass(slots=True, frozen=True)
+class BenchCase:
+    """One benchmark configuration."""
+    target: str  # Key in BENCH_TARGETS
+    total_items: int  # Number of items in the stack
+    visible_count: int  # Number of visible card slots
+    click_to_focus: bool = False  # Context cards get click overlays
+    show_scrollbar: bool = True  # Virtual scrollbar rendered / updated
+
+    @property
+    def key(self) -> str:  # Stable identifier used in baselines
+        """Stable identifier used in baselines."""
+        return (f"{self.target}/n={self.total_items}/v={self.visible_count}"
+                f"/click={int(self.click_to_focus)}/scrollbar={int(self.show_scrollbar)}")
+
+def bench_cases(
+    targets: Iterable[str] = tuple(BENCH_TARGETS),  # Hot paths to drive
+    total_items: Iterable[int] = (10, 1_000, 100_000, 1_000_000),  # Stack sizes
+    visible_counts: Iterable[int] = (1, 5, 15, 51),  # Viewport sizes
+    click_to_focus: Iterable[bool] = (False, True),  # Click overlay settings
+    show_scrollbar: Iterable[bool] = (True, False),  # Scrollbar settings
+) -> List[BenchCase]:  # Cross product of the given settings
+    """Build the benchmark grid."""
+    return [
+        BenchCase(*combo)
+        for combo in itertools.product(targets, total_items, visible_counts, click_to_focus, show_scrollbar)
+    ]
+
+# %% ../../nbs/helpers/benchmark.ipynb #dls6kk0xs5
+@dataclass(slots=True)
+class BenchResult:
+    """Measurements for one benchmark case."""
+    key: str  # BenchCase.key
+    median_us: float  # Median latency per call (microseconds)
+    p99_us: float  # 99th percentile latency per call (microseconds)
+    alloc_kib: float  # Peak traced allocation during one call (KiB)
+    alloc_blocks: int  # Memory blocks still allocated after one call (response included)
+    response_bytes: int  # Rendered HTML size of the response
+
+def _response_bytes(
+    response: Any,  # Element or tuple of elements returned by a target
+) -> int:  # UTF-8 size of the rendered HTML
+    """Render a response the way FastHTML would and measure it."""
+    parts = response if isinstance(response, (tuple, list)) else (response,)
+    return sum(len(to_xml(part).encode("utf-8")) for part in parts if hasattr(part, "tag"))
+
+def _percentile(
+    samples: Sequence[float],  # Measurements
+    pct: float,  # Percentile (0-100)
+) -> float:  # Nearest-rank percentile
+    """Nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def run_case(
+    case: BenchCase,  # Configuration to measure
+    repeat: int = 50,  # Timed calls
+    warmup: int = 3,  # Untimed calls first (fills caches)
+    render_card: Callable = _bench_render,  # Card renderer callback
+) -> BenchResult:  # Measurements
+    """Measure one benchmark case in-process."""
+    call = BENCH_TARGETS[case.target]
+    config = CardStackConfig(
+        prefix="bench", click_to_focus=case.click_to_focus, show_scrollbar=case.show_scrollbar,
+    )
+    ids = CardStackHtmlIds(prefix=config.prefix)
+    items = _SyntheticItems(case.total_items)
+    state = CardStackState(focused_index=case.total_items // 2, visible_count=case.visible_count)
+
+    def once():
+        return call(items, state, config, ids, _BENCH_URLS, render_card)
+
+    for _ in range(warmup):
+        once()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        once()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        response = once()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return BenchResult(
+        key=case.key,
+        median_us=statistics.median(samples),
+        p99_us=_percentile(samples, 99),
+        alloc_kib=peak / 1024,
+        alloc_blocks=max(0, blocks),
+        response_bytes=_response_bytes(response),
+    )
+
+def run_benchmarks(
+    cases: Iterable[BenchCase],  # Configurations to measure
+    repeat: int = 50,  # Timed calls per case
+    progress: Optional[Callable[[BenchResult], None]] = None,  # Called after each case
+) -> Dict[str, BenchResult]:  # Results by case key
+    """Measure every case."""
+    results = {}
+    for case in cases:
+        result = run_case(case, repeat=repeat)
+        results[result.key] = result
+        if progress is not None:
+            progress(result)
+    return results
+
+# %% ../../nbs/helpers/benchmark.ipynb #ysew8dfawl
+BASELINE_FORMAT_VERSION = 1  # Bump when BenchResult fields change meaning
+
+@dataclass(slots=True)
+class BenchRegression:
+    """A metric that got worse than its baseline."""
+    key: str  # BenchCase.key
+    metric: str  # BenchResult field name
+    baseline: float  # Baseline value
+    current: float  # Measured value
+
+    @property
+    def ratio(self) -> float:  # current / baseline
+        """How many times worse than the baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+_TIME_METRICS: Tuple[str, ...] = ("median_us", "p99_us")
+_SIZE_METRICS: Tuple[str, ...] = ("alloc_kib", "alloc_blocks", "response_bytes")
+
+def save_baseline(
+    results: Dict[str, BenchResult],  # Results by case key
+    path: str | Path,  # JSON file to write
+) -> None:
+    """Store results as a baseline."""
+    data = {
+        "version": BASELINE_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {key: dataclasses.asdict(r) for key, r in results.items()},
+    }
+    Path(path).write_text(json.dumps(data, indent=1, sort_keys=True))
+
+def load_baseline(
+    path: str | Path,  # JSON file written by save_baseline
+) -> Dict[str, BenchResult]:  # Baseline results by case key
+    """Load a stored baseline."""
+    data = json.loads(Path(path).read_text())
+    if data.get("version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline version: {data.get('version')!r}")
+    return {key: BenchResult(**r) for key, r in data["results"].items()}
+
+def compare_to_baseline(
+    results: Dict[str, BenchResult],  # Fresh results
+    baseline: Dict[str, BenchResult],  # Stored baseline
+    time_tolerance: float = 0.25,  # Allowed fractional growth for latencies
+    size_tolerance: float = 0.05,  # Allowed fractional growth for allocations and bytes
+) -> List[BenchRegression]:  # Metrics that regressed
+    """Flag metrics that grew past their tolerance."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metrics, tolerance in ((_TIME_METRICS, time_tolerance), (_SIZE_METRICS, size_tolerance)):
+            for metric in metrics:
+                old, new = getattr(base, metric), getattr(result, metric)
+                if new > old * (1 + tolerance):
+                    regressions.append(BenchRegression(key, metric, old, new))
+    return regressions
+
+def format_results(
+    results: Dict[str, BenchResult],  # Results by case key
+    regressions: Sequence[BenchRegression] = (),  # Regressions to mark
+) -> str:  # Plain-text report
+    """Render results as a fixed-width table; regressed cases are marked with '!'."""
+    flagged = {r.key for r in regressions}
+    width = max((len(k) for k in results), default=10)
+    lines = [f"  {'case':<{width}} {'median us':>10} {'p99 us':>10} {'alloc KiB':>10} {'blocks':>8} {'bytes':>9}"]
+    for key, r in results.items():
+        mark = "!" if key in flagged else " "
+        lines.append(f"{mark} {key:<{width}} {r.median_us:>10.1f} {r.p99_us:>10.1f} "
+                     f"{r.alloc_kib:>10.1f} {r.alloc_blocks:>8} {r.response_bytes:>9}")
+    for r in regressions:
+        lines.append(f"REGRESSION {r.key} {r.metric}: {r.baseline:.1f} -> {r.current:.1f} ({r.ratio:.2f}x)")
+    return "\n".join(lines)
+
+# %% ../../nbs/helpers/benchmark.ipynb #5pwmju0x84
+_QUICK_GRID = dict(total_items=(10, 1_000_000), visible_counts=(1, 5, 51))  # Smoke-test subset
+
+@call_parse
+def card_stack_bench(
+    baseline: str = None,  # Baseline JSON to compare against (or write with --save)
+    save: bool = False,  # Write the results to --baseline instead of comparing
+    quick: bool = False,  # Run a reduced grid
+    repeat: int = 50,  # Timed calls per case
+    targets: str = "",  # Comma-separated targets (empty runs all)
+    time_tolerance: float = 0.25,  # Allowed latency growth (fraction)
+    size_tolerance: float = 0.05,  # Allowed allocation / size growth (fraction)
+):
+    "Benchmark the card stack render and navigation hot paths."
+    names = [t.strip() for t in targets.split(",") if t.strip()] or list(BENCH_TARGETS)
+    cases = bench_cases(names, **(_QUICK_GRID if quick else {}))
+    results = run_benchmarks(cases, repeat=repeat)
+    if save:
+        if not baseline:
+            raise SystemExit("--save needs --baseline PATH")
+        save_baseline(results, baseline)
+        print(format_results(results))
+        print(f"Baseline written to {baseline}")
+        return
+    regressions = []
+    if baseline:
+        regressions = compare_to_baseline(results, load_baseline(baseline), time_tolerance, size_tolerance)
+    print(format_results(results, regressions))
+    if regressions:
+        raise SystemExit(1)
@@ -3,14 +3,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/focus.ipynb.
 
 # %% auto #0
-__all__ = ['resolve_focus_slot', 'calculate_viewport_window', 'render_focus_oob']
+__all__ = ['resolve_focus_slot', 'calculate_viewport_window', 'render_focus_oob', 'encode_view_state', 'decode_view_state']
 
 # %% ../../nbs/helpers/focus.ipynb #f1000003
 from typing import List, Optional, Tuple
 
 from fasthtml.common import Hidden
 
+from ..core.config import CardStackConfig
 from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState, encode_state, decode_state
+from ..core.state_token import sign_state_token, verify_state_token
 
 # %% ../../nbs/helpers/focus.ipynb #f1000005
 def resolve_focus_slot(
@@ -59,6 +62,8 @@ def render_focus_oob(
     ids: CardStackHtmlIds,  # HTML IDs for this card stack instance
     form_input_name: str = "focused_index",  # Field name for the form input
     total_items: Optional[int] = None,  # Total item count (emitted as data-total-items for client-side boundary checks)
+    nav_seq: Optional[int] = None,  # Navigation sequence number (emitted as data-nav-seq for latest-wins ordering)
+    view: Optional[str] = None,  # View token from encode_view_state (emitted as data-view for stateless nav)
 ) -> Tuple[Hidden, ...]:  # Hidden inputs with OOB swap
     """Render OOB hidden inputs to synchronize focus after HTMX swap."""
     attrs = {}
@@ -70,6 +75,13 @@ def render_focus_oob(
         # from the card-stack container's data attrs (which are only set on
         # initial render).
         attrs["data_total_items"] = str(total_items)
+    if nav_seq is not None:
+        # The client drops nav responses whose sequence number is older than
+        # the newest one it has applied (see the coordinator JS).
+        attrs["data_nav_seq"] = str(nav_seq)
+    if view is not None:
+        # Stateless nav: the client sends this back with every nav request
+        attrs["data_view"] = view
     return (
         Hidden(
             id=ids.focused_index_input,
@@ -79,3 +91,49 @@ def render_focus_oob(
             **attrs,
         ),
     )
+
+# %% ../../nbs/helpers/focus.ipynb #ph6rsti9ty
+_VIEW_FIELDS: Tuple[str, ...] = ("visible_count", "card_scale", "focus_position", "active_mode")  # Fields carried in the view token
+
+def encode_view_state(
+    state: CardStackState,  # Current card stack state
+    config: Optional[CardStackConfig] = None,  # Signs the token when it has a state_secret
+) -> str:  # Compact view token (data-view)
+    """Encode the view fields a nav render needs (everything but the focused index)."""
+    view_state = CardStackState(**{f: getattr(state, f) for f in _VIEW_FIELDS})
+    if config is not None and config.state_secret:
+        return sign_state_token(view_state, config.state_secret, namespace=config.prefix)
+    return encode_state(view_state)
+
+def decode_view_state(
+    view: Optional[str],  # View token sent by the client
+    focused_index: Optional[int],  # Focused index sent by the client
+    config: CardStackConfig,  # Card stack configuration (for clamping bounds)
+    visible_count: Optional[int] = None,  # Live visible count (overrides the token)
+    card_scale: Optional[int] = None,  # Live scale percentage (overrides the token)
+) -> Optional[CardStackState]:  # Nav state, or None if the token is missing or malformed
+    """Rebuild a nav state from client-carried view state."""
+    if not view:
+        return None
+    if config.state_secret:
+        decoded = verify_state_token(view, config.state_secret, namespace=config.prefix)
+        if decoded is None:
+            return None
+        visible_count = None  # The signed count is authoritative
+    else:
+        try:
+            decoded = decode_state(view)
+        except (TypeError, ValueError):
+            return None
+    state = CardStackState(**{f: getattr(decoded, f) for f in _VIEW_FIELDS})
+    try:
+        state.focused_index = max(0, int(focused_index or 0))
+        if visible_count is not None:
+            state.visible_count = int(visible_count)
+        if card_scale is not None:
+            state.card_scale = int(card_scale)
+    except (TypeError, ValueError):
+        return None  # Malformed live values: fall back to stored state
+    state.visible_count = max(1, min(config.visible_count_max, state.visible_count))
+    state.card_scale = max(config.card_scale_min, min(config.card_scale_max, state.card_scale))
+    return state
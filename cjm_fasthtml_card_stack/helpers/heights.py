@@ -0,0 +1,228 @@
+"""Learned per-item card heights that let the server choose the auto-adjust visible count."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/heights.ipynb.
+
+# %% auto #0
+__all__ = ['fit_visible_count', 'CardHeightModel', 'parse_card_heights']
+
+# %% ../../nbs/helpers/heights.ipynb #35f3wfwxf8
+import json
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from ..core.models import CardStackState
+from ..core.data_source import CardItems, item_count, fetch_window
+from .focus import resolve_focus_slot
+from .render_cache import _default_item_key
+
+# %% ../../nbs/helpers/heights.ipynb #wi4fkusq9d
+def fit_visible_count(
+    before: int,  # Context cards that fit in the before section
+    after: int,  # Context cards that fit in the after section
+    focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+) -> int:  # Largest visible count whose window fits (at least 1)
+    """Largest visible count that puts at most `before`/`after` cards beside the focused card."""
+    count = 1
+    while count < before + after + 1:
+        slot = resolve_focus_slot(focus_position, count + 1)
+        if slot > before or count - slot > after:
+            break
+        count += 1
+    return count
+
+# %% ../../nbs/helpers/heights.ipynb #e591qfrxfo
+_FIT_TOLERANCE_PX: float = 2.0  # Matches the client's overflow tolerance
+
+class CardHeightModel:
+    """Thread-safe per-item card heights learned from client measurements."""
+
+    def __init__(
+        self,
+        estimate_height: Optional[Callable[[Any, CardStackState], Optional[float]]] = None,  # Optional estimator: (item, state) -> slot height in px (None = unknown)
+        item_key: Callable[[Any], Hashable] = _default_item_key,  # Item identity/version key
+        default_height: float = 100.0,  # Slot height in px used before anything is measured
+        min_height: float = 16.0,  # Smallest plausible slot height in px (bounds how far a fit looks)
+        max_entries: int = 4096,  # Maximum number of learned heights
+    ):
+        self.estimate_height = estimate_height
+        self.item_key = item_key
+        self.default_height = default_height
+        self.min_height = min_height
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._layout_totals: Dict[Tuple[int, int], List[float]] = {}  # (width, scale) -> [sum, count]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:  # Number of learned heights
+        return len(self._entries)
+
+    def key(
+        self,
+        item: Any,  # Data item
+        index: int,  # Item index
+        state: CardStackState,  # State providing card width and scale
+    ) -> Hashable:  # Learned-height key
+        """Build the key for an item's height at the state's card width and scale."""
+        return (index, self.item_key(item), state.card_width, state.card_scale)
+
+    def record_measurements(
+        self,
+        card_items: CardItems,  # All data items (list or data source)
+        state: CardStackState,  # State the measurements were taken at
+        heights: Mapping[int, float],  # Measured slot heights in px by item index
+    ) -> int:  # Number of heights recorded
+        """Learn measured slot heights; placeholder indices and invalid values are ignored."""
+        total = item_count(card_items)
+        valid = {
+            i: float(h) for i, h in heights.items()
+            if 0 <= i < total and math.isfinite(h) and h > 0
+        }
+        if not valid:
+            return 0
+        items = fetch_window(card_items, sorted(valid))
+        with self._lock:
+            for i, h in valid.items():
+                self._store(self.key(items[i], i, state), h)
+            self._evict()
+        return len(valid)
+
+    def height(
+        self,
+        item: Any,  # Data item
+        index: int,  # Item index
+        state: CardStackState,  # State providing card width and scale
+    ) -> float:  # Slot height in px
+        """Best known slot height: learned, then estimated, then the fallback."""
+        key = self.key(item, index, state)
+        with self._lock:
+            learned = self._entries.get(key)
+            if learned is not None:
+                self._entries.move_to_end(key)
+                return learned
+        if self.estimate_height is not None:
+            estimate = self.estimate_height(item, state)
+            if estimate is not None:
+                return float(estimate)
+        return self.fallback_height(state)
+
+    def fallback_height(
+        self,
+        state: CardStackState,  # State providing card width and scale
+    ) -> float:  # Slot height in px for unknown items and placeholders
+        """Mean learned height at the state's card width and scale, else `default_height`."""
+        with self._lock:
+            totals = self._layout_totals.get((state.card_width, state.card_scale))
+        return totals[0] / totals[1] if totals else self.default_height
+
+    def choose_visible_count(
+        self,
+        card_items: CardItems,  # All data items (list or data source)
+        state: CardStackState,  # Current state (focused index, focus position, width, scale)
+        section_height: float,  # Space available to each context section in px
+        gap: float = 0.0,  # Gap between cards in px
+    ) -> int:  # Visible count whose cards fit the viewport
+        """Choose the largest visible count whose context cards fit around the focused card."""
+        total = item_count(card_items)
+        focused = state.focused_index
+        pos = state.focus_position
+        # No card is shorter than min_height, so nothing past this fits, and
+        # no section holds more cards than the stack has
+        limit = max(0, int((section_height + gap) // (self.min_height + gap)))
+        limit = min(limit, total)
+        before_indices = [focused - d for d in range(1, limit + 1)] if pos != 0 else []
+        after_indices = [focused + d for d in range(1, limit + 1)] if pos != -1 else []
+        items = fetch_window(card_items, before_indices + after_indices)
+        fallback = self.fallback_height(state)
+
+        def heights(indices):
+            for i in indices:
+                yield self.height(items[i], i, state) if 0 <= i < total else fallback
+
+        before = _fit_cards(heights(before_indices), section_height, gap)
+        after = _fit_cards(heights(after_indices), section_height, gap)
+        return fit_visible_count(before, after, pos)
+
+    def invalidate(
+        self,
+        indices: Optional[Iterable[int]] = None,  # Item indices to forget (None = clear everything)
+    ) -> int:  # Number of entries removed
+        """Forget learned heights for the given item indices, or all heights."""
+        with self._lock:
+            if indices is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._layout_totals.clear()
+                return removed
+            targets = set(indices)
+            stale = [k for k in self._entries if k[0] in targets]
+            for k in stale:
+                self._discard(k)
+            return len(stale)
+
+    def _store(
+        self,
+        key: Hashable,  # Learned-height key
+        height: float,  # Measured height in px
+    ) -> None:
+        """Store a height (caller holds the lock)."""
+        self._discard(key)
+        self._entries[key] = height
+        totals = self._layout_totals.setdefault(key[2:], [0.0, 0])
+        totals[0] += height
+        totals[1] += 1
+
+    def _discard(
+        self,
+        key: Hashable,  # Learned-height key
+    ) -> None:
+        """Remove a height and its layout total contribution (caller holds the lock)."""
+        height = self._entries.pop(key, None)
+        if height is None:
+            return
+        totals = self._layout_totals[key[2:]]
+        totals[0] -= height
+        totals[1] -= 1
+        if totals[1] == 0:
+            del self._layout_totals[key[2:]]
+
+    def _evict(self) -> None:
+        """Drop least-recently-used heights beyond max_entries (caller holds the lock)."""
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+def _fit_cards(
+    heights: Iterable[float],  # Slot heights, nearest to the focused card first
+    space: float,  # Section height in px
+    gap: float,  # Gap between cards in px
+) -> int:  # Number of leading cards that fit
+    """Count cards that fit in a section, stacking outward from the focused card."""
+    used, count = 0.0, 0
+    for h in heights:
+        used += h + (gap if count else 0.0)
+        if used > space + _FIT_TOLERANCE_PX:
+            break
+        count += 1
+    return count
+
+# %% ../../nbs/helpers/heights.ipynb #gmmnrx5u5r
+def parse_card_heights(
+    raw: Optional[str],  # JSON object of item index -> height in px
+) -> Dict[int, float]:  # Parsed heights (malformed entries dropped)
+    """Parse the client's `card_heights` form field."""
+    if not raw:
+        return {}
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    heights = {}
+    for index, height in data.items():
+        try:
+            heights[int(index)] = float(height)
+        except (TypeError, ValueError):
+            continue
+    return heights
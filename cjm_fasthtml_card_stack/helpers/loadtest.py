@@ -0,0 +1,333 @@
+"""Concurrent-session load tests of the card stack router in a local ASGI app, replaying realistic input traces."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/loadtest.ipynb.
+
+# %% auto #0
+__all__ = ['TRACE_KINDS', 'LOAD_MODES', 'TraceStep', 'build_session_trace', 'build_load_app', 'LoadStats', 'LoadResult',
+           'run_load_test', 'format_load_results', 'card_stack_loadtest']
+
+# %% ../../nbs/helpers/loadtest.ipynb #h6ga8c383b
+import asyncio
+import html
+import random
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import httpx  # Declared by the `bench` extra
+except ModuleNotFoundError:
+    import httpx2 as httpx  # Installed by newer python-fasthtml releases (same API)
+from fastcore.script import call_parse
+from fasthtml.common import FastHTML
+
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState
+from ..core.state_store import MemoryStateStore
+from .benchmark import _SyntheticItems, _bench_render, _percentile
+from .render_cache import CardRenderCache
+from ..routes.prerender import CardPrerenderer
+from ..routes.router import init_card_stack_router
+
+# %% ../../nbs/helpers/loadtest.ipynb #t3h2yy4eug
+@dataclass(slots=True, frozen=True)
+class TraceStep:
+    """One request in an input trace."""
+    route: str  # Router function name (e.g. "nav_by")
+    data: Tuple[Tuple[str, Any], ...] = ()  # Gesture-specific form fields
+
+def _wheel_burst(
+    rng: random.Random,  # Random source
+    total_items: int,  # Number of items in the stack
+) -> List[TraceStep]:  # A few coalesced wheel steps in one direction
+    """Mouse wheel burst: 3-8 coalesced steps of 1-3 items."""
+    sign = rng.choice((-1, 1))
+    return [TraceStep("nav_by", (("delta", sign * rng.randint(1, 3)),)) for _ in range(rng.randint(3, 8))]
+
+def _touch_fling(
+    rng: random.Random,  # Random source
+    total_items: int,  # Number of items in the stack
+) -> List[TraceStep]:  # Decaying steps in one direction
+    """Touch fling: momentum steps that shrink until the fling stops."""
+    sign, velocity, steps = rng.choice((-1, 1)), rng.randint(6, 15), []
+    while velocity >= 1:
+        steps.append(TraceStep("nav_by", (("delta", sign * velocity),)))
+        velocity = int(velocity * 0.6)
+    return steps
+
+def _page_jump(
+    rng: random.Random,  # Random source
+    total_items: int,  # Number of items in the stack
+) -> List[TraceStep]:  # Page or home/end jumps
+    """Keyboard paging: a few page steps, sometimes a jump to either end."""
+    if rng.random() < 0.2:
+        return [TraceStep(rng.choice(("nav_first", "nav_last")))]
+    route = rng.choice(("nav_page_up", "nav_page_down"))
+    return [TraceStep(route) for _ in range(rng.randint(2, 4))]
+
+def _scrollbar_scrub(
+    rng: random.Random,  # Random source
+    total_items: int,  # Number of items in the stack
+) -> List[TraceStep]:  # Absolute jumps along a drag
+    """Scrollbar drag: 6-12 absolute jumps from one position to another."""
+    start, end, count = rng.randrange(total_items), rng.randrange(total_items), rng.randint(6, 12)
+    return [
+        TraceStep("nav_to_index", (("target_index", round(start + (end - start) * (i + 1) / count)),))
+        for i in range(count)
+    ]
+
+def _auto_adjust(
+    rng: random.Random,  # Random source
+    total_items: int,  # Number of items in the stack
+) -> List[TraceStep]:  # An estimate followed by refinements
+    """Auto-adjust after a resize: a measured estimate, then growth and one step back."""
+    estimate = rng.randint(1, 9)
+    steps = [TraceStep("update_viewport", (("visible_count", estimate), ("section_height", 120.0 * estimate)))]
+    for count in (estimate + 2, estimate + 1):
+        steps.append(TraceStep("update_viewport", (("visible_count", count),)))
+    return steps
+
+TRACE_KINDS: Dict[str, Callable[[random.Random, int], List[TraceStep]]] = {  # Gesture -> trace generator
+    "wheel_burst": _wheel_burst,
+    "touch_fling": _touch_fling,
+    "page_jump": _page_jump,
+    "scrollbar_scrub": _scrollbar_scrub,
+    "auto_adjust": _auto_adjust,
+}
+
+def build_session_trace(
+    rng: random.Random,  # Random source (seed it for repeatable runs)
+    total_items: int,  # Number of items in the stack
+    steps: int,  # Number of requests in the trace
+    kinds: Sequence[str] = tuple(TRACE_KINDS),  # Gestures to draw from (uniformly)
+) -> List[TraceStep]:  # Concatenated gestures, cut to `steps` requests
+    """Build one session's request sequence from random gestures."""
+    trace: List[TraceStep] = []
+    while len(trace) < steps:
+        trace.extend(TRACE_KINDS[rng.choice(kinds)](rng, total_items))
+    return trace[:steps]
+
+# %% ../../nbs/helpers/loadtest.ipynb #dxk7q27cb5
+LOAD_MODES: Dict[str, Tuple[Dict[str, Any], Callable[[], Dict[str, Any]]]] = {  # Mode -> (config overrides, router kwargs factory)
+    "baseline": ({}, dict),
+    "incremental": ({"incremental_nav": True}, dict),
+    "stateless": ({"stateless_nav": True}, dict),
+    "position_updates": ({"client_position_updates": True}, dict),
+    "render_cache": ({}, lambda: {"render_cache": CardRenderCache(max_entries=1024)}),
+    "prerender": ({}, lambda: {"prerenderer": CardPrerenderer(CardRenderCache(max_entries=1024))}),
+}
+
+_LOAD_PREFIX = "load"
+
+def build_load_app(
+    mode: str = "baseline",  # LOAD_MODES names joined with "+"
+    total_items: int = 10_000,  # Number of items in the stack
+    visible_count: int = 5,  # Visible card slots each session starts with
+    render_card: Callable = _bench_render,  # Card renderer callback
+    route_prefix: str = "/card-stack",  # Route prefix for the card stack routes
+) -> Tuple[FastHTML, CardStackConfig, Dict[str, Any]]:  # (app, config, router kwargs used)
+    """Mount a card stack router for one mode in a local FastHTML app."""
+    overrides, router_kwargs = {}, {}
+    for name in mode.split("+"):
+        if name not in LOAD_MODES:
+            raise ValueError(f"Unknown load mode: {name!r} (choose from {', '.join(LOAD_MODES)})")
+        mode_overrides, factory = LOAD_MODES[name]
+        overrides.update(mode_overrides)
+        router_kwargs.update(factory())
+    config = CardStackConfig(prefix=_LOAD_PREFIX, **overrides)
+    items = _SyntheticItems(total_items)
+    store = MemoryStateStore(lambda: CardStackState(focused_index=total_items // 2, visible_count=visible_count))
+    router, _ = init_card_stack_router(
+        config, None, None, lambda: items, render_card,
+        route_prefix=route_prefix, state_store=store, **router_kwargs,
+    )
+    app = FastHTML(secret_key="card-stack-loadtest")
+    router.to_app(app)
+    return app, config, router_kwargs
+
+# %% ../../nbs/helpers/loadtest.ipynb #n1ib3ouite
+class _LoadSession:
+    """One simulated browser session."""
+
+    def __init__(
+        self,
+        app: FastHTML,  # App under test
+        config: CardStackConfig,  # Card stack configuration
+        route_prefix: str,  # Route prefix for the card stack routes
+    ):
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://loadtest",
+            headers={"HX-Request": "true"},
+        )
+        self.route_prefix = route_prefix
+        focus_id = re.escape(CardStackHtmlIds(prefix=config.prefix).focused_index_input)
+        self._focus_re = re.compile(rf'<input[^>]*id="{focus_id}"[^>]*>')
+        self.focused_index: Optional[int] = None
+        self.view = ""
+        self.nav_seq = 0
+
+    async def send(
+        self,
+        step: TraceStep,  # Request to send
+    ) -> Tuple[float, int, int]:  # (latency seconds, response bytes, status code)
+        """Send one trace step and track the focus the response reports."""
+        data = dict(step.data)
+        if step.route.startswith("nav_"):
+            self.nav_seq += 1
+            data["nav_seq"] = self.nav_seq
+            if self.view:
+                data["view"] = self.view
+        if self.focused_index is not None:
+            data["focused_index"] = self.focused_index
+        start = time.perf_counter()
+        response = await self.client.post(f"{self.route_prefix}/{step.route}", data=data)
+        content = response.content
+        elapsed = time.perf_counter() - start
+        self._track(content.decode("utf-8", "replace"))
+        return elapsed, len(content), response.status_code
+
+    def _track(
+        self,
+        body: str,  # Response body (HTML)
+    ) -> None:
+        """Adopt the focused index and view token from the focus input, if present."""
+        tag = self._focus_re.search(body)
+        if tag is None:
+            return
+        value = re.search(r' value="(\d+)"', tag.group(0))
+        if value is not None:
+            self.focused_index = int(value.group(1))
+        view = re.search(r" data-view=([\"'])(.*?)\1", tag.group(0))
+        if view is not None:
+            self.view = html.unescape(view.group(2))
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+# %% ../../nbs/helpers/loadtest.ipynb #9f7636gg0j
+@dataclass(slots=True)
+class LoadStats:
+    """Latency and size statistics for a set of requests."""
+    requests: int  # Requests sent
+    errors: int  # Responses with a non-2xx status
+    p50_ms: float  # Median latency (milliseconds)
+    p95_ms: float  # 95th percentile latency (milliseconds)
+    p99_ms: float  # 99th percentile latency (milliseconds)
+    mean_bytes: float  # Mean response body size
+    max_bytes: int  # Largest response body
+
+@dataclass(slots=True)
+class LoadResult:
+    """Outcome of one load test run."""
+    mode: str  # Mode that was tested
+    sessions: int  # Concurrent sessions
+    elapsed_s: float  # Wall time of the run (seconds)
+    overall: LoadStats  # Statistics over all requests
+    by_route: Dict[str, LoadStats] = field(default_factory=dict)  # Statistics per route
+
+    @property
+    def throughput(self) -> float:  # Requests per second
+        """Completed requests per second of wall time."""
+        return self.overall.requests / self.elapsed_s if self.elapsed_s else 0.0
+
+def _load_stats(
+    samples: Sequence[Tuple[float, int, int]],  # (latency seconds, bytes, status) per request
+) -> LoadStats:  # Aggregated statistics
+    """Aggregate request samples."""
+    latencies = [s[0] * 1000 for s in samples]
+    sizes = [s[1] for s in samples]
+    return LoadStats(
+        requests=len(samples),
+        errors=sum(1 for s in samples if not 200 <= s[2] < 300),
+        p50_ms=_percentile(latencies, 50),
+        p95_ms=_percentile(latencies, 95),
+        p99_ms=_percentile(latencies, 99),
+        mean_bytes=statistics.fmean(sizes),
+        max_bytes=max(sizes),
+    )
+
+async def run_load_test(
+    mode: str = "baseline",  # LOAD_MODES names joined with "+"
+    sessions: int = 8,  # Concurrent simulated sessions
+    steps: int = 200,  # Requests per session
+    total_items: int = 10_000,  # Number of items in the stack
+    visible_count: int = 5,  # Visible card slots each session starts with
+    kinds: Sequence[str] = tuple(TRACE_KINDS),  # Gestures to replay
+    seed: int = 0,  # Seed for the traces (same seed, same requests)
+    think_ms: float = 0.0,  # Pause between a session's requests
+    render_card: Callable = _bench_render,  # Card renderer callback
+) -> LoadResult:  # Throughput, latency and size statistics
+    """Replay input traces from concurrent sessions against a local card stack app."""
+    route_prefix = "/card-stack"
+    app, config, router_kwargs = build_load_app(mode, total_items, visible_count, render_card, route_prefix)
+    traces = [build_session_trace(random.Random(seed + i), total_items, steps, kinds) for i in range(sessions)]
+    samples: Dict[str, List[Tuple[float, int, int]]] = {}
+
+    async def replay(trace: List[TraceStep]) -> None:
+        session = _LoadSession(app, config, route_prefix)
+        try:
+            for step in trace:
+                samples.setdefault(step.route, []).append(await session.send(step))
+                if think_ms:
+                    await asyncio.sleep(think_ms / 1000)
+        finally:
+            await session.close()
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(replay(trace) for trace in traces))
+    finally:
+        if "prerenderer" in router_kwargs:
+            router_kwargs["prerenderer"].close()
+    elapsed = time.perf_counter() - start
+    everything = [s for route_samples in samples.values() for s in route_samples]
+    return LoadResult(
+        mode=mode, sessions=sessions, elapsed_s=elapsed,
+        overall=_load_stats(everything),
+        by_route={route: _load_stats(samples[route]) for route in sorted(samples)},
+    )
+
+def format_load_results(
+    results: Iterable[LoadResult],  # One result per mode
+    routes: bool = False,  # Add a per-route breakdown under each mode
+) -> str:  # Plain-text report
+    """Render load test results as a fixed-width table."""
+    results = list(results)
+    width = max([len(r.mode) for r in results] + [len(k) + 2 for r in results for k in r.by_route] + [4])
+    lines = [f"{'mode':<{width}} {'req/s':>8} {'requests':>9} {'errors':>6} "
+             f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'mean B':>8} {'max B':>8}"]
+
+    def row(label: str, s: LoadStats, rate: str) -> str:
+        return (f"{label:<{width}} {rate:>8} {s.requests:>9} {s.errors:>6} "
+                f"{s.p50_ms:>8.2f} {s.p95_ms:>8.2f} {s.p99_ms:>8.2f} {s.mean_bytes:>8.0f} {s.max_bytes:>8}")
+
+    for r in results:
+        lines.append(row(r.mode, r.overall, f"{r.throughput:.0f}"))
+        if routes:
+            lines.extend(row(f"  {route}", s, "") for route, s in r.by_route.items())
+    return "\n".join(lines)
+
+# %% ../../nbs/helpers/loadtest.ipynb #w13mqnj5rw
+@call_parse
+def card_stack_loadtest(
+    modes: str = "baseline",  # Comma-separated modes to compare (see LOAD_MODES; join with + to combine)
+    sessions: int = 8,  # Concurrent simulated sessions
+    steps: int = 200,  # Requests per session
+    items: int = 10_000,  # Number of items in the stack
+    visible: int = 5,  # Visible card slots each session starts with
+    kinds: str = "",  # Comma-separated gestures to replay (empty replays all)
+    seed: int = 0,  # Trace seed
+    think_ms: float = 0.0,  # Pause between a session's requests (milliseconds)
+    routes: bool = False,  # Add a per-route breakdown
+):
+    "Load-test the card stack router with concurrent simulated sessions."
+    gestures = [k.strip() for k in kinds.split(",") if k.strip()] or list(TRACE_KINDS)
+    results = [
+        asyncio.run(run_load_test(mode.strip(), sessions, steps, items, visible, gestures, seed, think_ms))
+        for mode in modes.split(",") if mode.strip()
+    ]
+    print(format_load_results(results, routes=routes))
@@ -0,0 +1,195 @@
+"""Opt-in LRU cache of rendered cards, keyed by item identity and the render context fields that affect output."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/render_cache.ipynb.
+
+# %% auto #0
+__all__ = ['CardRenderCache']
+
+# %% ../../nbs/helpers/render_cache.ipynb #sws8et1qha
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+
+from fasthtml.common import NotStr, to_xml
+
+from ..core.models import CardRenderContext
+
+# %% ../../nbs/helpers/render_cache.ipynb #bea8p4js31
+_DEFAULT_CONTEXT_FIELDS: Tuple[str, ...] = (
+    "card_role", "active_mode", "card_scale", "total_items", "distance_from_focus",
+)
+
+def _default_item_key(
+    item: Any,  # Data item passed to render_card
+) -> Optional[Hashable]:  # Item value if hashable, otherwise None (no stable identity)
+    """Default item identity key.
+
+    Unhashable items such as dicts, and objects that hash by identity (plain
+    class instances), get no key: object identity is not stable when
+    `get_items()` rebuilds them per request, so freed addresses would be
+    reused by edited items. Pass an explicit `item_key` to cache them.
+    """
+    if type(item).__hash__ is object.__hash__:
+        return None
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        return None
+
+# %% ../../nbs/helpers/render_cache.ipynb #mzh6p35sb6
+class CardRenderCache:
+    """Thread-safe LRU cache of rendered card HTML.
+
+    Items are keyed by value when they hash by value. Unhashable items
+    (dicts, lists) and identity-hashed objects are rendered without caching
+    unless an `item_key` is given that returns a version-aware key for them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,  # Maximum number of cached cards
+        max_bytes: Optional[int] = None,  # Optional bound on total cached HTML size (UTF-8 bytes)
+        item_key: Callable[[Any], Optional[Hashable]] = _default_item_key,  # Item identity/version key (None = don't cache)
+        context_fields: Tuple[str, ...] = _DEFAULT_CONTEXT_FIELDS,  # CardRenderContext fields that affect rendering
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.item_key = item_key
+        self.context_fields = context_fields
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[NotStr, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:  # Number of cached cards
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:  # Whether key is cached (does not touch recency)
+        return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:  # Total cached HTML size in bytes
+        """Total size of cached HTML."""
+        return self._bytes
+
+    def key(
+        self,
+        item: Any,  # Data item
+        context: CardRenderContext,  # Render context for this slot
+    ) -> Optional[Hashable]:  # Cache key, or None if the item can't be cached
+        """Build the cache key for an item rendered with the given context."""
+        item_key = self.item_key(item)
+        if item_key is None:
+            return None
+        ctx_values = tuple(getattr(context, f) for f in self.context_fields)
+        return (context.index, item_key, ctx_values)
+
+    def get_or_render(
+        self,
+        item: Any,  # Data item
+        context: CardRenderContext,  # Render context for this slot
+        render_card: Callable,  # Callback: (item, CardRenderContext) -> FT
+    ) -> NotStr:  # Cached (or freshly rendered) card HTML
+        """Return cached HTML for the card, rendering and storing it on a miss."""
+        key = self.key(item, context)
+        if key is None:
+            return NotStr(to_xml(render_card(item, context)))
+        html = self._lookup(key)
+        if html is None:
+            # Render outside the lock so slow renderers don't serialize requests
+            html = self._store(key, render_card(item, context))
+        return html
+
+    async def get_or_render_async(
+        self,
+        item: Any,  # Data item
+        context: CardRenderContext,  # Render context for this slot
+        render_card: Callable,  # Async callback: (item, CardRenderContext) -> FT
+    ) -> NotStr:  # Cached (or freshly rendered) card HTML
+        """Async `get_or_render` for coroutine renderers."""
+        key = self.key(item, context)
+        if key is None:
+            return NotStr(to_xml(await render_card(item, context)))
+        html = self._lookup(key)
+        if html is None:
+            html = self._store(key, await render_card(item, context))
+        return html
+
+    def _lookup(
+        self,
+        key: Hashable,  # Cache key
+    ) -> Optional[NotStr]:  # Cached HTML, or None on a miss
+        """Look up a key, updating recency and hit/miss counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def _store(
+        self,
+        key: Hashable,  # Cache key
+        card: Any,  # Rendered card FT
+    ) -> NotStr:  # Stored HTML
+        """Serialize a rendered card and store it under key."""
+        html = NotStr(to_xml(card))
+        size = len(html.encode("utf-8"))
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (html, size)
+            self._bytes += size
+            self._evict()
+        return html
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until both bounds are satisfied."""
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def invalidate(
+        self,
+        indices: Optional[Iterable[int]] = None,  # Item indices to drop (None = clear everything)
+    ) -> int:  # Number of entries removed
+        """Remove cached cards for the given item indices, or all cards."""
+        with self._lock:
+            if indices is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+            targets = set(indices)
+            stale = [k for k in self._entries if k[0] in targets]
+            for k in stale:
+                self._bytes -= self._entries.pop(k)[1]
+            return len(stale)
+
+    def wrap(
+        self,
+        render_card: Callable,  # Callback: (item, CardRenderContext) -> FT
+    ) -> Callable:  # Drop-in render_card that serves from this cache
+        """Wrap a render_card callback so every call goes through the cache.
+
+        Coroutine renderers get a coroutine wrapper, so async routes still
+        detect them as async.
+        """
+        if inspect.iscoroutinefunction(render_card):
+            async def cached_render_card(item, context):
+                return await self.get_or_render_async(item, context, render_card)
+        else:
+            def cached_render_card(item, context):
+                return self.get_or_render(item, context, render_card)
+        cached_render_card.__wrapped__ = render_card
+        return cached_render_card
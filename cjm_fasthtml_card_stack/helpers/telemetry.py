@@ -0,0 +1,107 @@
+"""Parse and summarize client telemetry beacons (navigation latency, reflow time, auto-adjust iterations, dropped input)."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/telemetry.ipynb.
+
+# %% auto #0
+__all__ = ['TELEMETRY_FORMAT_VERSION', 'TelemetryHistogram', 'ClientTelemetry', 'parse_client_telemetry']
+
+# %% ../../nbs/helpers/telemetry.ipynb #vqxnipfust
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.constants import TELEMETRY_BUCKETS
+
+# %% ../../nbs/helpers/telemetry.ipynb #cio3vuh7cu
+TELEMETRY_FORMAT_VERSION = 1  # Bump when the report layout changes
+_MAX_REPORT_BYTES = 16384  # Larger beacons are rejected unparsed
+_MAX_METRICS = 32  # Histograms or counters per report
+_METRIC_NAME_RE = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
+
+@dataclass(slots=True)
+class TelemetryHistogram:
+    """Bucketed client measurements (bounds are TELEMETRY_BUCKETS plus overflow)."""
+    counts: Tuple[int, ...]  # Observations per bucket (last = above the top bound)
+    total: float = 0.0  # Sum of observed values
+    maximum: float = 0.0  # Largest observed value
+
+    @property
+    def count(self) -> int:  # Number of observations
+        """Number of observations."""
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:  # Mean observed value (0 when empty)
+        """Mean observed value."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(
+        self,
+        q: float,  # Quantile in [0, 1] (0.99 = p99)
+    ) -> float:  # Upper bound of the bucket holding the quantile (the maximum for overflow)
+        """Approximate a quantile from the buckets."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bound, n in zip(TELEMETRY_BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(float(bound), self.maximum)
+        return self.maximum
+
+@dataclass(slots=True)
+class ClientTelemetry:
+    """One client telemetry report."""
+    histograms: Dict[str, TelemetryHistogram] = field(default_factory=dict)  # Name -> histogram
+    counters: Dict[str, int] = field(default_factory=dict)  # Name -> count
+
+def _number(value: Any) -> bool:
+    """Finite, non-negative JSON number (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value) and value >= 0
+
+def _parse_histogram(data: Any) -> Optional[TelemetryHistogram]:
+    """Validate one histogram entry."""
+    if not isinstance(data, dict):
+        return None
+    counts = data.get("c")
+    if (not isinstance(counts, list) or len(counts) != len(TELEMETRY_BUCKETS) + 1
+            or not all(isinstance(n, int) and not isinstance(n, bool) and n >= 0 for n in counts)):
+        return None
+    total, maximum = data.get("s", 0), data.get("m", 0)
+    if not (_number(total) and _number(maximum)):
+        return None
+    return TelemetryHistogram(tuple(counts), float(total), float(maximum))
+
+def parse_client_telemetry(
+    report: str,  # JSON report posted by the client
+) -> Optional[ClientTelemetry]:  # Parsed report, or None if it is invalid
+    """Validate and parse a client telemetry report."""
+    if not report or len(report) > _MAX_REPORT_BYTES:
+        return None
+    try:
+        data = json.loads(report)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get("v") != TELEMETRY_FORMAT_VERSION:
+        return None
+    hists, counters = data.get("h", {}), data.get("n", {})
+    if not (isinstance(hists, dict) and isinstance(counters, dict)):
+        return None
+    if len(hists) > _MAX_METRICS or len(counters) > _MAX_METRICS:
+        return None
+    if not all(_METRIC_NAME_RE.match(name) for name in (*hists, *counters)):
+        return None
+    telemetry = ClientTelemetry()
+    for name, entry in hists.items():
+        hist = _parse_histogram(entry)
+        if hist is None:
+            return None
+        telemetry.histograms[name] = hist
+    for name, n in counters.items():
+        if not (isinstance(n, int) and not isinstance(n, bool) and n >= 0):
+            return None
+        telemetry.counters[name] = n
+    return telemetry
@@ -0,0 +1,198 @@
+"""Per-request phase timing for the card stack routes, exposed as a Server-Timing header and through a pluggable metrics sink."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/helpers/timing.ipynb.
+
+# %% auto #0
+__all__ = ['SERVER_TIMING_HEADER', 'RequestTiming', 'CardStackMetrics', 'report_timing', 'timed_callback', 'instrument_route']
+
+# %% ../../nbs/helpers/timing.ipynb #lyehfi2yrt
+import contextlib
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Protocol, runtime_checkable
+
+from fasthtml.common import HttpHeader, NotStr, to_xml
+
+# %% ../../nbs/helpers/timing.ipynb #qfm0125q4c
+SERVER_TIMING_HEADER = "Server-Timing"  # Response header carrying phase durations
+
+class RequestTiming:
+    """Phase durations for one request."""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}  # Phase -> total seconds
+        self.calls: Dict[str, int] = {}  # Phase -> times entered
+        self._start = time.perf_counter()
+        self.total: Optional[float] = None  # Wall time in seconds (set by finish)
+
+    def record(
+        self,
+        phase: str,  # Phase name
+        seconds: float,  # Time spent
+    ) -> None:
+        """Add time to a phase."""
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    @contextlib.contextmanager
+    def measure(
+        self,
+        phase: str,  # Phase name
+    ) -> Iterator[None]:
+        """Time the enclosed block as part of a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def finish(self) -> float:  # Wall time in seconds
+        """Stop the request clock."""
+        self.total = time.perf_counter() - self._start
+        return self.total
+
+    @property
+    def library(self) -> float:  # Seconds not attributed to any phase
+        """Time spent in the card stack itself."""
+        total = self.total if self.total is not None else time.perf_counter() - self._start
+        return max(0.0, total - sum(self.durations.values()))
+
+    def header_value(self) -> str:  # Server-Timing header value
+        """Format the phases as a Server-Timing header value (milliseconds)."""
+        entries = []
+        for phase, seconds in self.durations.items():
+            entry = f"{phase};dur={seconds * 1000:.3f}"
+            if self.calls[phase] > 1:
+                entry += f';desc="{self.calls[phase]} calls"'
+            entries.append(entry)
+        entries.append(f"library;dur={self.library * 1000:.3f}")
+        if self.total is not None:
+            entries.append(f"total;dur={self.total * 1000:.3f}")
+        return ", ".join(entries)
+
+# %% ../../nbs/helpers/timing.ipynb #8hcoqxi49s
+@runtime_checkable
+class CardStackMetrics(Protocol):
+    """Counter and histogram sink for request metrics."""
+
+    def increment(
+        self,
+        name: str,  # Counter name
+        value: int = 1,  # Amount to add
+        tags: Optional[Mapping[str, str]] = None,  # Dimensions (prefix, route, ...)
+    ) -> None:
+        """Add to a counter."""
+        ...
+
+    def observe(
+        self,
+        name: str,  # Histogram name
+        value: float,  # Observed value
+        tags: Optional[Mapping[str, str]] = None,  # Dimensions (prefix, route, phase, ...)
+    ) -> None:
+        """Record a histogram observation."""
+        ...
+
+def report_timing(
+    metrics: CardStackMetrics,  # Metrics sink
+    timing: RequestTiming,  # Finished request timing
+    tags: Mapping[str, str],  # Request dimensions (prefix, route)
+) -> None:
+    """Send one request's timing to a metrics sink."""
+    metrics.increment("card_stack.requests", 1, tags)
+    metrics.observe("card_stack.request_ms", (timing.total or 0.0) * 1000, tags)
+    for phase, seconds in timing.durations.items():
+        metrics.observe("card_stack.phase_ms", seconds * 1000, {**tags, "phase": phase})
+    metrics.observe("card_stack.phase_ms", timing.library * 1000, {**tags, "phase": "library"})
+    if "render" in timing.calls:
+        metrics.increment("card_stack.render_calls", timing.calls["render"], tags)
+
+# %% ../../nbs/helpers/timing.ipynb #p0uzmybxvj
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("card_stack_timing", default=None)
+
+def timed_callback(
+    phase: str,  # Phase the callback's time counts toward
+    fn: Callable,  # Callback to wrap (sync or async)
+) -> Callable:  # Wrapped callback
+    """Attribute a callback's time to a phase of the current request."""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def timed_async(*args, **kwargs):
+            timing = _current_timing.get()
+            if timing is None:
+                return await fn(*args, **kwargs)
+            with timing.measure(phase):
+                return await fn(*args, **kwargs)
+        return timed_async
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        timing = _current_timing.get()
+        if timing is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return _timed_awaitable(timing, phase, start, result)
+        timing.record(phase, time.perf_counter() - start)
+        return result
+    return timed
+
+async def _timed_awaitable(timing: RequestTiming, phase: str, start: float, awaitable: Any) -> Any:
+    """Finish timing a sync callback that returned an awaitable."""
+    try:
+        return await awaitable
+    finally:
+        timing.record(phase, time.perf_counter() - start)
+
+def _serialize(
+    response: Any,  # Route result
+) -> Any:  # Same response with FT parts rendered to HTML
+    """Render FT parts of a response to HTML, keeping headers and strings as they are."""
+    parts = response if isinstance(response, tuple) else (response,)
+    rendered = tuple(
+        NotStr(to_xml(part)) if hasattr(part, "tag") else part
+        for part in parts
+    )
+    return rendered if isinstance(response, tuple) else rendered[0]
+
+def instrument_route(
+    fn: Callable,  # Route body (may return an awaitable)
+    tags: Mapping[str, str],  # Dimensions for metrics (prefix, route)
+    metrics: Optional[CardStackMetrics] = None,  # Metrics sink
+    server_timing: bool = False,  # Append a Server-Timing header to the response
+) -> Callable:  # Instrumented route body with the same signature
+    """Time a route body's phases and report them."""
+    def finish(timing: RequestTiming, result: Any) -> Any:
+        with timing.measure("serialize"):
+            result = _serialize(result)
+        timing.finish()
+        if metrics is not None:
+            report_timing(metrics, timing, tags)
+        if server_timing:
+            header = HttpHeader(SERVER_TIMING_HEADER, timing.header_value())
+            result = (*result, header) if isinstance(result, tuple) else (result, header)
+        return result
+
+    async def finish_async(timing: RequestTiming, awaitable: Any) -> Any:
+        token = _current_timing.set(timing)
+        try:
+            result = await awaitable
+        finally:
+            _current_timing.reset(token)
+        return finish(timing, result)
+
+    @functools.wraps(fn)
+    def route(*args, **kwargs):
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            _current_timing.reset(token)
+        if inspect.isawaitable(result):
+            return finish_async(timing, result)
+        return finish(timing, result)
+    return route
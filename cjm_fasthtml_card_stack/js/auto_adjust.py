@@ -12,6 +12,7 @@ from ..core.config import CardStackConfig
 from ..core.html_ids import CardStackHtmlIds
 from ..core.models import CardStackUrls
 from ..core.constants import DEFAULT_VISIBLE_COUNT
+from .values import js_derived, js_value
 
 # %% ../../nbs/js/auto_adjust.ipynb #aa000005
 def _generate_auto_adjust_js(
@@ -20,28 +21,31 @@ def _generate_auto_adjust_js(
     urls: CardStackUrls,  # URL bundle (update_viewport)
     focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
 ) -> str:  # JS code fragment for auto visible count adjustment
-    """Generate JS for automatic visible count adjustment based on overflow detection."""
-    js_focus_pos = "null" if focus_position is None else str(focus_position)
+    """Generate JS for one-shot visible count adjustment (estimate, then at most one growth correction)."""
+    js_focus_pos = js_value(focus_position)
+    # Slot ID with the item index left off
+    js_slot_prefix = js_derived(lambda p: CardStackHtmlIds(prefix=p).viewport_slot(""), ids.prefix)
     return f"""
         // === Auto Visible Count Adjustment ===
         let _autoAdjusting = false;
         let _autoAdjustTimer = null;
         const _AUTO_FOCUS_POS = {js_focus_pos};
-        const _AUTO_STEP = (_AUTO_FOCUS_POS === null) ? 2 : 1;
+        const _AUTO_MAX_CORRECTIONS = 1;
+        let _autoCorrections = -1;  // -1 = idle, else growth corrections used this adjustment
+        let _autoIterations = 0;  // Count requests sent this adjustment (telemetry)
 
         // --- Growth validation state ---
         let _autoGrowing = false;
-        let _autoReverting = false;
         let _preGrowthItemIds = null;
         let _preGrowthCount = 0;
 
         function _getAutoCurrentCount() {{
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             return cs ? parseInt(cs.dataset.visibleCount || '{DEFAULT_VISIBLE_COUNT}') : {DEFAULT_VISIBLE_COUNT};
         }}
 
         function _getAutoTotalItems() {{
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             return cs ? parseInt(cs.dataset.totalItems || '0') : 0;
         }}
 
@@ -49,8 +53,8 @@ def _generate_auto_adjust_js(
             // Returns max overflow (px) across relevant sections.
             // Before section uses justify-end, so content overflows upward (out the top).
             // After section uses justify-start, so content overflows downward (out the bottom).
-            const before = document.getElementById('{ids.viewport_section_before}');
-            const after = document.getElementById('{ids.viewport_section_after}');
+            const before = document.getElementById({js_value(ids.viewport_section_before)});
+            const after = document.getElementById({js_value(ids.viewport_section_after)});
             let maxOverflow = 0;
 
             const checkBefore = (_AUTO_FOCUS_POS === null || _AUTO_FOCUS_POS > 0 || _AUTO_FOCUS_POS < 0);
@@ -79,7 +83,7 @@ def _generate_auto_adjust_js(
 
         function _getAutoAvgCardHeight() {{
             // Average height of rendered viewport-slot elements.
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             if (!cs) return 100;
             const slots = cs.querySelectorAll('.viewport-slot');
             if (slots.length === 0) return 100;
@@ -90,16 +94,113 @@ def _generate_auto_adjust_js(
 
         function _getAutoGapPx() {{
             // Read computed gap from the before section (or after).
-            const section = document.getElementById('{ids.viewport_section_before}')
-                         || document.getElementById('{ids.viewport_section_after}');
+            const section = document.getElementById({js_value(ids.viewport_section_before)})
+                         || document.getElementById({js_value(ids.viewport_section_after)});
             if (!section) return 16;
             return parseFloat(getComputedStyle(section).gap) || 16;
         }}
 
+        // --- One-shot estimation ---
+
+        function _getAutoContextCardHeight() {{
+            // Average context card height; falls back to all rendered slots
+            // (i.e. the focused card) when no context cards exist yet.
+            let total = 0, n = 0;
+            for (const id of [{js_value(ids.viewport_section_before)}, {js_value(ids.viewport_section_after)}]) {{
+                const section = document.getElementById(id);
+                if (!section) continue;
+                for (const s of section.children) {{ total += s.getBoundingClientRect().height; n++; }}
+            }}
+            return n > 0 ? total / n : _getAutoAvgCardHeight();
+        }}
+
+        function _getAutoSectionSpace() {{
+            // Height available to each context section: the inner grid's content
+            // box minus the focused section and the row gaps between sections.
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
+            const focused = document.getElementById({js_value(ids.viewport_section_focused)});
+            if (!inner || !focused) return 0;
+            const style = getComputedStyle(inner);
+            const content = inner.clientHeight
+                - (parseFloat(style.paddingTop) || 0) - (parseFloat(style.paddingBottom) || 0);
+            const sections = (_AUTO_FOCUS_POS === null || _AUTO_FOCUS_POS > 0) ? 2 : 1;
+            const rowGap = parseFloat(style.rowGap) || 0;
+            const free = content - focused.getBoundingClientRect().height - sections * rowGap;
+            return Math.max(0, free / sections);
+        }}
+
+        function _autoCountFor(before, after) {{
+            // Visible count whose window puts at most `before`/`after` cards in
+            // the before/after sections (mirrors resolve_focus_slot).
+            if (_AUTO_FOCUS_POS === null) return 1 + 2 * Math.min(before, after);
+            if (_AUTO_FOCUS_POS === 0) return 1 + after;
+            if (_AUTO_FOCUS_POS < 0) return 1 + before;
+            return _AUTO_FOCUS_POS <= before ? 1 + _AUTO_FOCUS_POS + after : 1 + before;
+        }}
+
+        function _estimateAutoCount() {{
+            const cardH = _getAutoContextCardHeight();
+            const gap = _getAutoGapPx();
+            const perSection = Math.max(0, Math.floor((_getAutoSectionSpace() + gap) / (cardH + gap)));
+            return _autoCountFor(perSection, perSection);
+        }}
+
+        function _countFittingCards(sectionId, nearestLast) {{
+            // Rendered cards that fit inside a section, counted outward from the
+            // focused card (the before section's nearest card is its last child).
+            const section = document.getElementById(sectionId);
+            if (!section) return 0;
+            const sRect = section.getBoundingClientRect();
+            const cards = Array.from(section.children);
+            if (nearestLast) cards.reverse();
+            let n = 0;
+            for (const card of cards) {{
+                const r = card.getBoundingClientRect();
+                if (r.top < sRect.top - 2 || r.bottom > sRect.bottom + 2) break;
+                n++;
+            }}
+            return n;
+        }}
+
+        function _fitRenderedCount() {{
+            return _autoCountFor(
+                _countFittingCards({js_value(ids.viewport_section_before)}, true),
+                _countFittingCards({js_value(ids.viewport_section_after)}, false),
+            );
+        }}
+
+        // --- Measurements for server-side height models ---
+
+        const _AUTO_SLOT_PREFIX = {js_slot_prefix};
+
+        ns._autoMeasurements = function(estimate) {{
+            // Context slot heights keyed by item index (the focused slot is
+            // constrained separately, so its height says little). Estimate
+            // requests also carry the section space so the server can choose
+            // the count itself.
+            const heights = {{}};
+            for (const id of [{js_value(ids.viewport_section_before)}, {js_value(ids.viewport_section_after)}]) {{
+                const section = document.getElementById(id);
+                if (!section) continue;
+                for (const s of section.children) {{
+                    if (!s.id || !s.id.startsWith(_AUTO_SLOT_PREFIX)) continue;
+                    const index = parseInt(s.id.slice(_AUTO_SLOT_PREFIX.length));
+                    const h = s.getBoundingClientRect().height;
+                    if (!isNaN(index) && h > 0) heights[index] = Math.round(h * 10) / 10;
+                }}
+            }}
+            const values = {{ card_heights: JSON.stringify(heights) }};
+            if (estimate) {{
+                values.section_height = Math.round(_getAutoSectionSpace() * 10) / 10;
+                values.card_gap = _getAutoGapPx();
+            }}
+            return values;
+        }};
+
         // --- Growth validation helpers ---
 
         function _snapshotItemIds() {{
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             if (!cs) return new Set();
             const slots = cs.querySelectorAll('.viewport-slot');
             const idSet = new Set();
@@ -111,7 +212,7 @@ def _generate_auto_adjust_js(
 
         function _hideNewItems() {{
             if (!_preGrowthItemIds) return;
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             if (!cs) return;
             const slots = cs.querySelectorAll('.viewport-slot');
             for (const s of slots) {{
@@ -122,7 +223,7 @@ def _generate_auto_adjust_js(
         }}
 
         function _revealNewItems() {{
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             if (!cs) return;
             const slots = cs.querySelectorAll('.viewport-slot');
             for (const s of slots) {{
@@ -132,25 +233,39 @@ def _generate_auto_adjust_js(
             }}
         }}
 
+        function _requestAutoCount(count, estimate) {{
+            const currentCount = _getAutoCurrentCount();
+            if (count > currentCount) {{
+                // Snapshot current state so new cards stay hidden until validated
+                _preGrowthCount = currentCount;
+                _preGrowthItemIds = _snapshotItemIds();
+                _autoGrowing = true;
+            }}
+            _autoAdjusting = true;
+            _autoIterations++;
+            ns._autoUpdateCount(count, estimate);
+        }}
+
+        function _finishAutoAdjust() {{
+            _revealNewItems();
+            _autoCorrections = -1;
+            if (ns._tm && _autoIterations > 0) ns._tm.observe('auto_adjust_iterations', _autoIterations);
+            _autoIterations = 0;
+        }}
+
         function _validateGrowth() {{
-            const overflow = _getAutoSectionOverflow();
-            if (overflow > 2) {{
-                // Growth caused overflow — revert to pre-growth count and stop
-                _autoGrowing = false;
-                _autoReverting = true;
-                _preGrowthItemIds = null;
-                _autoAdjusting = true;
-                ns._autoUpdateCount(_preGrowthCount);
-            }} else {{
-                // Growth fits — reveal the new items
-                _revealNewItems();
-                _autoGrowing = false;
-                _preGrowthItemIds = null;
-                // Continue to check if there's still room for more
-                requestAnimationFrame(function() {{
-                    ns._runAutoAdjust();
-                }});
+            // New cards are rendered but hidden (still occupying layout space)
+            _autoGrowing = false;
+            _preGrowthItemIds = null;
+            if (_getAutoSectionOverflow() > 2) {{
+                // Over-estimated: keep exactly the rendered cards that fit
+                _autoCorrections = _AUTO_MAX_CORRECTIONS;
+                const fit = _fitRenderedCount();
+                _requestAutoCount(Math.max(1, Math.min(fit, _getAutoCurrentCount() - 1)));
+                return;
             }}
+            _revealNewItems();
+            ns._runAutoAdjust();
         }}
 
         ns._cancelAutoGrowth = function() {{
@@ -160,18 +275,13 @@ def _generate_auto_adjust_js(
                 _preGrowthItemIds = null;
                 _preGrowthCount = 0;
             }}
-            _autoReverting = false;
+            _autoCorrections = -1;
+            _autoIterations = 0;
         }};
 
         ns._runAutoAdjust = function() {{
             if (!_isAutoMode() || _autoAdjusting) return;
 
-            // If we just reverted from a failed growth, stop the loop
-            if (_autoReverting) {{
-                _autoReverting = false;
-                return;
-            }}
-
             // If in growth validation cycle, validate instead of normal adjust
             if (_autoGrowing) {{
                 _validateGrowth();
@@ -182,40 +292,42 @@ def _generate_auto_adjust_js(
             const totalItems = _getAutoTotalItems();
             if (totalItems === 0) return;
 
-            const overflow = _getAutoSectionOverflow();
-            const avgHeight = _getAutoAvgCardHeight();
-            const gapPx = _getAutoGapPx();
-
-            if (overflow > 2) {{
-                // Overflow exists — remove enough cards to eliminate it
-                const toRemove = Math.ceil(overflow / (avgHeight + gapPx));
-                const adjusted = (_AUTO_FOCUS_POS === null)
-                    ? Math.max(_AUTO_STEP, Math.ceil(toRemove / 2) * 2)
-                    : Math.max(_AUTO_STEP, toRemove);
-                const newCount = Math.max(1, currentCount - adjusted);
-                if (newCount !== currentCount) {{
-                    _autoAdjusting = true;
-                    ns._autoUpdateCount(newCount);
-                }}
+            // The first request of an adjustment is the estimate; any later
+            // growth spends the correction budget.
+            const first = _autoCorrections < 0;
+            let target;
+            let estimate = false;
+            if (_getAutoSectionOverflow() > 2) {{
+                // Shrink to the rendered cards that fit. This is exact for the
+                // cards on screen, so no further growth follows it.
+                target = Math.max(1, Math.min(_fitRenderedCount(), currentCount - 1));
+                _autoCorrections = _AUTO_MAX_CORRECTIONS;
             }} else {{
-                // No overflow — grow incrementally (including beyond total
-                // items, which renders placeholder cards to fill viewport)
-                const newCount = currentCount + _AUTO_STEP;
-                // Snapshot current state before growth
-                _preGrowthCount = currentCount;
-                _preGrowthItemIds = _snapshotItemIds();
-                _autoGrowing = true;
-                _autoAdjusting = true;
-                ns._autoUpdateCount(newCount);
+                // Grow into free space (including beyond total items, which
+                // renders placeholder cards to fill the viewport)
+                target = Math.max(currentCount, _estimateAutoCount());
+                if (target > currentCount && !first) {{
+                    if (_autoCorrections >= _AUTO_MAX_CORRECTIONS) target = currentCount;
+                    else _autoCorrections++;
+                }} else if (first) {{
+                    _autoCorrections = 0;
+                    estimate = true;
+                }}
+            }}
+
+            if (target === currentCount) {{
+                _finishAutoAdjust();
+                return;
             }}
+            _requestAutoCount(target, estimate);
         }};
 
         ns.triggerAutoAdjust = function() {{
             // Debounced entry point for external triggers (resize, width, scale).
             if (!_isAutoMode()) return;
             clearTimeout(_autoAdjustTimer);
-            _autoReverting = false;
             _autoAdjustTimer = setTimeout(function() {{
+                _autoCorrections = -1;
                 ns._runAutoAdjust();
             }}, 200);
         }};
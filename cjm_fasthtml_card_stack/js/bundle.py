@@ -0,0 +1,113 @@
+"""Memoized card stack scripts served as cacheable external files."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/bundle.ipynb.
+
+# %% auto #0
+__all__ = ['CardStackJsBundles']
+
+# %% ../../nbs/js/bundle.ipynb #ejbpuwn3ey
+import contextlib
+import hashlib
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from fasthtml.common import Response
+
+# %% ../../nbs/js/bundle.ipynb #l4ps44ci0s
+_IMMUTABLE_CACHE_CONTROL: str = "public, max-age=31536000, immutable"
+
+_preloading: ContextVar[Tuple["CardStackJsBundles", ...]] = ContextVar("card_stack_js_preloading", default=())
+
+class CardStackJsBundles:
+    """Registry of generated card stack scripts keyed by input and content hash."""
+
+    def __init__(
+        self,
+        route_prefix: str = "/card-stack-js",  # URL prefix the bundles are served under
+        max_entries: int = 256,  # Maximum number of distinct scripts kept
+    ):
+        self.route_prefix = route_prefix
+        self.max_entries = max_entries
+        self.builds = 0  # Number of scripts generated (memo misses)
+        self._by_key: "OrderedDict[str, str]" = OrderedDict()  # input key -> content hash
+        self._pinned: Dict[str, str] = {}  # preloaded input key -> content hash (never evicted)
+        self._scripts: Dict[str, str] = {}  # content hash -> script text
+        self._lock = threading.Lock()
+
+    def script_url(
+        self,
+        content_hash: str,  # Content hash of a registered script
+    ) -> str:  # URL the script is served from
+        """URL for a registered script."""
+        return f"{self.route_prefix}/{content_hash}.js"
+
+    @contextlib.contextmanager
+    def preloading(self) -> Iterator["CardStackJsBundles"]:
+        """Pin every script built or looked up in this block so it is never evicted.
+
+        Run the page's script generators once at startup inside this block,
+        in every worker: the same inputs produce the same content hash, so
+        any process can serve any script URL a page references.
+        """
+        token = _preloading.set(_preloading.get() + (self,))
+        try:
+            yield self
+        finally:
+            _preloading.reset(token)
+
+    def get_or_build(
+        self,
+        key: Hashable,  # Generation inputs (must have a deterministic repr)
+        build: Callable[[], str],  # Generates the script text on a miss
+    ) -> str:  # URL of the (possibly freshly built) script
+        """Return the URL for the script generated from key, building it once."""
+        input_key = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        pin = self in _preloading.get()
+        with self._lock:
+            content_hash = self._pinned.get(input_key)
+            if content_hash is not None:
+                return self.script_url(content_hash)
+            content_hash = self._by_key.get(input_key)
+            if content_hash is not None:
+                if pin:
+                    self._pinned[input_key] = self._by_key.pop(input_key)
+                else:
+                    self._by_key.move_to_end(input_key)
+                return self.script_url(content_hash)
+
+        script = build()
+        content_hash = hashlib.sha256(script.encode("utf-8")).hexdigest()[:20]
+        with self._lock:
+            self.builds += 1
+            (self._pinned if pin else self._by_key)[input_key] = content_hash
+            self._scripts[content_hash] = script
+            while len(self._by_key) > self.max_entries:
+                _, evicted = self._by_key.popitem(last=False)
+                if evicted not in self._by_key.values() and evicted not in self._pinned.values():
+                    self._scripts.pop(evicted, None)
+        return self.script_url(content_hash)
+
+    def get(
+        self,
+        content_hash: str,  # Content hash from the script URL
+    ) -> Optional[str]:  # Script text, or None if unknown
+        """Look up a registered script by content hash."""
+        with self._lock:
+            return self._scripts.get(content_hash)
+
+    def response(
+        self,
+        content_hash: str,  # Content hash from the script URL
+        if_none_match: Optional[str] = None,  # Request If-None-Match header value
+    ) -> Response:  # JS response (200), not-modified (304), or not found (404)
+        """Build the HTTP response serving a registered script."""
+        script = self.get(content_hash)
+        if script is None:
+            return Response("", status_code=404)
+        etag = f'"{content_hash}"'
+        headers = {"ETag": etag, "Cache-Control": _IMMUTABLE_CACHE_CONTROL}
+        if if_none_match is not None and etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(script, media_type="application/javascript", headers=headers)
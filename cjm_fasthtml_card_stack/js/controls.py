@@ -14,6 +14,38 @@ from cjm_fasthtml_card_stack.core.constants import (
     auto_count_storage_key,
     DEFAULT_CARD_WIDTH, DEFAULT_CARD_SCALE, DEFAULT_VISIBLE_COUNT,
 )
+from .values import js_derived, js_value
+
+# %% ../../nbs/js/controls.ipynb #kzmsa31l5p
+def _generate_prefs_mgmt_js(
+    urls: CardStackUrls,  # URL bundle (save_prefs)
+) -> str:  # JS code fragment for batched preference persistence
+    """Generate JS that coalesces preference changes into batched save_prefs requests."""
+    prefs_url = js_value(urls.save_prefs)
+    return f"""
+        // === Preference Persistence ===
+        let _pendingPrefs = null;
+        let _prefsTimer = null;
+
+        ns._queuePrefs = function(prefs) {{
+            // Returns false when there is no batched endpoint (caller falls back)
+            if (!{prefs_url}) return false;
+            _pendingPrefs = Object.assign(_pendingPrefs || {{}}, prefs);
+            clearTimeout(_prefsTimer);
+            _prefsTimer = setTimeout(function() {{ ns.flushPrefs(false); }}, 500);
+            return true;
+        }};
+
+        ns.flushPrefs = function(useBeacon) {{
+            clearTimeout(_prefsTimer);
+            if (!_pendingPrefs) return;
+            const values = _pendingPrefs;
+            _pendingPrefs = null;
+            if (useBeacon && navigator.sendBeacon
+                    && navigator.sendBeacon({prefs_url}, new URLSearchParams(values))) return;
+            htmx.ajax('POST', {prefs_url}, {{ swap: 'none', values: values }});
+        }};
+    """
 
 # %% ../../nbs/js/controls.ipynb #ctrl000005
 def _generate_width_mgmt_js(
@@ -22,17 +54,18 @@ def _generate_width_mgmt_js(
     urls: CardStackUrls,  # URL bundle (save_width)
 ) -> str:  # JS code fragment for width management
     """Generate JS for width slider management."""
-    storage_key = width_storage_key(config.prefix)
+    storage_key = js_derived(width_storage_key, config.prefix)
     return f"""
         // === Width Management ===
-        const _WIDTH_KEY = '{storage_key}';
+        const _WIDTH_KEY = {storage_key};
         let _saveWidthTimer = null;
 
         function _saveWidthToServer(val) {{
-            if (!'{urls.save_width}') return;
+            if (ns._queuePrefs && ns._queuePrefs({{ card_width: val }})) return;
+            if (!{js_value(urls.save_width)}) return;
             clearTimeout(_saveWidthTimer);
             _saveWidthTimer = setTimeout(function() {{
-                htmx.ajax('POST', '{urls.save_width}', {{
+                htmx.ajax('POST', {js_value(urls.save_width)}, {{
                     swap: 'none', values: {{ card_width: val }}
                 }});
             }}, 500);
@@ -45,25 +78,25 @@ def _generate_width_mgmt_js(
         // decreaseWidth handler uses this effective width to avoid a dead
         // zone where multiple button presses produce no visible change.
         ns._getEffectiveWidthRem = function() {{
-            const inner = document.getElementById('{ids.card_stack_inner}');
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
             if (!inner) return Infinity;
             const remPx = parseFloat(getComputedStyle(document.documentElement).fontSize) || 16;
             return inner.offsetWidth / remPx;
         }};
 
         ns.updateWidth = function(value) {{
-            const inner = document.getElementById('{ids.card_stack_inner}');
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
             if (!inner) return;
             inner.style.maxWidth = value + 'rem';
             try {{ localStorage.setItem(_WIDTH_KEY, value); }} catch (e) {{}}
-            const slider = document.getElementById('{ids.width_slider}');
+            const slider = document.getElementById({js_value(ids.width_slider)});
             if (slider && parseInt(slider.value) !== parseInt(value)) slider.value = value;
             _saveWidthToServer(value);
             if (ns.triggerAutoAdjust) ns.triggerAutoAdjust();
         }};
 
         ns.decreaseWidth = function() {{
-            const slider = document.getElementById('{ids.width_slider}');
+            const slider = document.getElementById({js_value(ids.width_slider)});
             const current = slider ? parseInt(slider.value) : {DEFAULT_CARD_WIDTH};
             // Snap to the effective rendered width first. If the stored value
             // is above what the container actually renders, decrementing from
@@ -77,18 +110,18 @@ def _generate_width_mgmt_js(
         }};
 
         ns.increaseWidth = function() {{
-            const slider = document.getElementById('{ids.width_slider}');
+            const slider = document.getElementById({js_value(ids.width_slider)});
             const current = slider ? parseInt(slider.value) : {DEFAULT_CARD_WIDTH};
             ns.updateWidth(Math.min({config.card_width_max}, current + {config.card_width_step}));
         }};
 
         ns.applyWidth = function() {{
-            const inner = document.getElementById('{ids.card_stack_inner}');
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
             if (!inner) return;
             let val = {DEFAULT_CARD_WIDTH};
             try {{ const s = localStorage.getItem(_WIDTH_KEY); if (s) val = parseInt(s); }} catch (e) {{}}
             inner.style.maxWidth = val + 'rem';
-            const slider = document.getElementById('{ids.width_slider}');
+            const slider = document.getElementById({js_value(ids.width_slider)});
             if (slider) slider.value = val;
         }};
     """
@@ -100,44 +133,45 @@ def _generate_scale_mgmt_js(
     urls: CardStackUrls,  # URL bundle (save_scale)
 ) -> str:  # JS code fragment for scale management
     """Generate JS for scale slider management."""
-    storage_key = scale_storage_key(config.prefix)
+    storage_key = js_derived(scale_storage_key, config.prefix)
     return f"""
         // === Scale Management ===
-        const _SCALE_KEY = '{storage_key}';
+        const _SCALE_KEY = {storage_key};
         let _saveScaleTimer = null;
 
         function _saveScaleToServer(val) {{
-            if (!'{urls.save_scale}') return;
+            if (ns._queuePrefs && ns._queuePrefs({{ card_scale: val }})) return;
+            if (!{js_value(urls.save_scale)}) return;
             clearTimeout(_saveScaleTimer);
             _saveScaleTimer = setTimeout(function() {{
-                htmx.ajax('POST', '{urls.save_scale}', {{
+                htmx.ajax('POST', {js_value(urls.save_scale)}, {{
                     swap: 'none', values: {{ card_scale: val }}
                 }});
             }}, 500);
         }}
 
         function _applyScaleCssProperty(val) {{
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             if (cs) cs.style.setProperty('--card-stack-scale', val);
         }}
 
         ns.updateScale = function(value) {{
             _applyScaleCssProperty(value);
             try {{ localStorage.setItem(_SCALE_KEY, value); }} catch (e) {{}}
-            const slider = document.getElementById('{ids.scale_slider}');
+            const slider = document.getElementById({js_value(ids.scale_slider)});
             if (slider && parseInt(slider.value) !== parseInt(value)) slider.value = value;
             _saveScaleToServer(value);
             if (ns.triggerAutoAdjust) ns.triggerAutoAdjust();
         }};
 
         ns.decreaseScale = function() {{
-            const slider = document.getElementById('{ids.scale_slider}');
+            const slider = document.getElementById({js_value(ids.scale_slider)});
             const current = slider ? parseInt(slider.value) : {DEFAULT_CARD_SCALE};
             ns.updateScale(Math.max({config.card_scale_min}, current - {config.card_scale_step}));
         }};
 
         ns.increaseScale = function() {{
-            const slider = document.getElementById('{ids.scale_slider}');
+            const slider = document.getElementById({js_value(ids.scale_slider)});
             const current = slider ? parseInt(slider.value) : {DEFAULT_CARD_SCALE};
             ns.updateScale(Math.min({config.card_scale_max}, current + {config.card_scale_step}));
         }};
@@ -146,7 +180,7 @@ def _generate_scale_mgmt_js(
             let val = {DEFAULT_CARD_SCALE};
             try {{ const s = localStorage.getItem(_SCALE_KEY); if (s) val = parseInt(s); }} catch (e) {{}}
             _applyScaleCssProperty(val);
-            const slider = document.getElementById('{ids.scale_slider}');
+            const slider = document.getElementById({js_value(ids.scale_slider)});
             if (slider) slider.value = val;
         }};
     """
@@ -158,14 +192,14 @@ def _generate_card_count_mgmt_js(
     urls: CardStackUrls,  # URL bundle (update_viewport)
 ) -> str:  # JS code fragment for card count management
     """Generate JS for card count selector management."""
-    storage_key = card_count_storage_key(config.prefix)
-    auto_key = auto_count_storage_key(config.prefix)
-    valid_counts = ', '.join(str(c) for c in config.visible_count_options)
+    storage_key = js_derived(card_count_storage_key, config.prefix)
+    auto_key = js_derived(auto_count_storage_key, config.prefix)
+    valid_counts = js_value(config.visible_count_options)
     return f"""
         // === Card Count Management ===
-        const _COUNT_KEY = '{storage_key}';
-        const _AUTO_KEY = '{auto_key}';
-        const _VALID_COUNTS = [{valid_counts}];
+        const _COUNT_KEY = {storage_key};
+        const _AUTO_KEY = {auto_key};
+        const _VALID_COUNTS = {valid_counts};
 
         function _isAutoMode() {{
             try {{
@@ -188,28 +222,32 @@ def _generate_card_count_mgmt_js(
             if (!_VALID_COUNTS.includes(count)) return;
             try {{ localStorage.setItem(_COUNT_KEY, count); }} catch (e) {{}}
             try {{ localStorage.setItem(_AUTO_KEY, 'false'); }} catch (e) {{}}
-            const cardStack = document.getElementById('{ids.card_stack}');
+            const cardStack = document.getElementById({js_value(ids.card_stack)});
             if (cardStack) cardStack.dataset.visibleCount = count;
-            if ('{urls.update_viewport}') {{
-                htmx.ajax('POST', '{urls.update_viewport}', {{
-                    target: '#' + '{ids.card_stack}',
+            if ({js_value(urls.update_viewport)}) {{
+                htmx.ajax('POST', {js_value(urls.update_viewport)}, {{
+                    target: '#' + {js_value(ids.card_stack)},
                     swap: 'none',
                     values: {{ visible_count: count, is_auto: 'false' }}
                 }});
             }}
         }};
 
-        ns._autoUpdateCount = function(count) {{
+        ns._autoUpdateCount = function(count, estimate) {{
             // Auto-adjustment — sets is_auto_mode to true
             // Bypasses _VALID_COUNTS validation since auto can set any count.
+            // Sends card measurements for server-side height models; on
+            // estimate requests the server may answer with its own count.
             const c = Math.max(1, Math.round(count));
-            const cardStack = document.getElementById('{ids.card_stack}');
+            const cardStack = document.getElementById({js_value(ids.card_stack)});
             if (cardStack) cardStack.dataset.visibleCount = c;
-            if ('{urls.update_viewport}') {{
-                htmx.ajax('POST', '{urls.update_viewport}', {{
-                    target: '#' + '{ids.card_stack}',
+            if ({js_value(urls.update_viewport)}) {{
+                const values = {{ visible_count: c, is_auto: 'true' }};
+                if (ns._autoMeasurements) Object.assign(values, ns._autoMeasurements(!!estimate));
+                htmx.ajax('POST', {js_value(urls.update_viewport)}, {{
+                    target: '#' + {js_value(ids.card_stack)},
                     swap: 'none',
-                    values: {{ visible_count: c, is_auto: 'true' }}
+                    values: values
                 }});
             }}
         }};
@@ -218,6 +256,8 @@ def _generate_card_count_mgmt_js(
             // Entry point for dropdown onchange — handles both \"auto\" and numeric values.
             if (value === 'auto') {{
                 try {{ localStorage.setItem(_AUTO_KEY, 'true'); }} catch (e) {{}}
+                // Persist the mode switch even if auto-adjust keeps the count
+                if (ns._queuePrefs && ns._queuePrefs({{ is_auto: 'true' }})) ns.flushPrefs(false);
                 if (ns.triggerAutoAdjust) ns.triggerAutoAdjust();
             }} else {{
                 try {{ localStorage.setItem(_AUTO_KEY, 'false'); }} catch (e) {{}}
@@ -227,7 +267,7 @@ def _generate_card_count_mgmt_js(
         }};
 
         function _syncCountDropdown() {{
-            const sel = document.getElementById('{ids.card_count_select}');
+            const sel = document.getElementById({js_value(ids.card_count_select)});
             if (!sel) return;
             if (_isAutoMode()) {{
                 if (sel.value !== 'auto') sel.value = 'auto';
@@ -6,10 +6,13 @@ single namespaced IIFE."""
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/core.ipynb.
 
 # %% auto #0
-__all__ = ['global_callback_name', 'generate_card_stack_js']
+__all__ = ['global_callback_name', 'generate_card_stack_js', 'card_stack_runtime_config', 'generate_card_stack_runtime_js',
+           'generate_card_stack_instance_js']
 
 # %% ../../nbs/js/core.ipynb #jc000003
-from typing import Any, Optional, Tuple
+import functools
+import json
+from typing import Any, Dict, Optional, Tuple
 
 from fasthtml.common import Script
 
@@ -19,7 +22,7 @@ from ..core.button_ids import CardStackButtonIds
 from ..core.models import CardStackUrls, CardStackState
 from cjm_fasthtml_card_stack.core.constants import (
     width_storage_key, scale_storage_key, card_count_storage_key,
-    auto_count_storage_key,
+    auto_count_storage_key, NAV_SEQ_HEADER, VISIBLE_COUNT_HEADER,
     DEFAULT_CARD_WIDTH, DEFAULT_CARD_SCALE, DEFAULT_VISIBLE_COUNT,
 )
 from .viewport import generate_viewport_height_js
@@ -27,9 +30,15 @@ from .scroll import generate_scroll_nav_js
 from .touch import generate_touch_nav_js
 from .navigation import generate_page_nav_js
 from cjm_fasthtml_card_stack.js.controls import (
-    _generate_width_mgmt_js, _generate_scale_mgmt_js, _generate_card_count_mgmt_js,
+    _generate_prefs_mgmt_js, _generate_width_mgmt_js, _generate_scale_mgmt_js, _generate_card_count_mgmt_js,
 )
 from .auto_adjust import _generate_auto_adjust_js
+from .telemetry import _generate_telemetry_js
+from .window import _generate_window_patcher_js
+from .ws_nav import _generate_ws_nav_js
+from .item_events import _generate_item_events_js
+from .bundle import CardStackJsBundles
+from .values import JsRef, JsRefs, js_derived, js_global, js_value
 
 from cjm_fasthtml_virtual_scrollbar.core.models import ScrollbarIds
 from cjm_fasthtml_virtual_scrollbar.js.scrollbar import generate_scrollbar_js as _sb_generate_scrollbar_js
@@ -40,14 +49,23 @@ def _generate_coordinator_js(
     config: CardStackConfig,  # Config for prefix-unique listener guards
     button_ids: CardStackButtonIds,  # Nav button IDs (for boundary-no-op guard)
     focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+    urls: Optional[CardStackUrls] = None,  # Nav URLs to tag with a latest-wins sequence number
 ) -> str:  # JS code fragment for master coordinator
     """Generate JS for the master coordinator and HTMX listener."""
-    handler_key = f"_csHandlers_{config.prefix.replace('-', '_')}"
-    js_focus_pos = "null" if focus_position is None else str(focus_position)
+    handlers = js_global(lambda p: f"_csHandlers_{p.replace('-', '_')}", config.prefix)
+    js_focus_pos = js_value(focus_position)
+    nav_urls = [] if urls is None else [
+        u for u in (
+            urls.nav_up, urls.nav_down, urls.nav_first, urls.nav_last,
+            urls.nav_page_up, urls.nav_page_down, urls.nav_to_index, urls.nav_by,
+        ) if u
+    ]
+    js_nav_urls = ", ".join(js_value(u) for u in nav_urls)
+    js_viewport_url = js_value(urls.update_viewport if urls is not None else None)
     return f"""
         // === Grid Template Management ===
         ns.applyGridTemplate = function() {{
-            const inner = document.getElementById('{ids.card_stack_inner}');
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
             if (!inner) return;
             const focusPosRaw = {js_focus_pos};
             let tmpl;
@@ -79,9 +97,10 @@ def _generate_coordinator_js(
         // to ensure correct results regardless of which navigation path
         // triggered the update (arrow keys, page nav, scrollbar, etc.).
         ns.constrainFocusedSection = function() {{
-            const inner = document.getElementById('{ids.card_stack_inner}');
-            const focused = document.getElementById('{ids.viewport_section_focused}');
+            const inner = document.getElementById({js_value(ids.card_stack_inner)});
+            const focused = document.getElementById({js_value(ids.viewport_section_focused)});
             if (!inner || !focused) return;
+            const t0 = ns._tm ? performance.now() : 0;
             const gap = parseFloat(getComputedStyle(inner).rowGap) || 0;
             const maxH = inner.clientHeight - 2 * gap;
             if (maxH > 0) focused.style.maxHeight = maxH + 'px';
@@ -89,6 +108,7 @@ def _generate_coordinator_js(
             // Force reflow so scrollHeight/clientHeight reflect the new maxHeight
             focused.offsetHeight;
             focused.style.touchAction = focused.scrollHeight > focused.clientHeight ? 'pan-y' : 'none';
+            if (ns._tm) ns._tm.observe('reflow_ms', performance.now() - t0);
         }};
 
         // === Boundary Index Helpers ===
@@ -102,11 +122,11 @@ def _generate_coordinator_js(
         // the outer card-stack container. Relying on them produces a stale-at-0 bug
         // that blocks all upward nav and never blocks downward nav at the bottom.
         ns._getFocusedIndex = function() {{
-            const input = document.getElementById('{ids.focused_index_input}');
+            const input = document.getElementById({js_value(ids.focused_index_input)});
             return input ? parseInt(input.value || '0') : 0;
         }};
         ns._getTotalItems = function() {{
-            const input = document.getElementById('{ids.focused_index_input}');
+            const input = document.getElementById({js_value(ids.focused_index_input)});
             return input ? parseInt(input.dataset.totalItems || '0') : 0;
         }};
 
@@ -114,16 +134,16 @@ def _generate_coordinator_js(
         // If focused index is already 0, navigation is a no-op and the HTMX
         // request is canceled before it fires.
         const _UP_BTN_IDS = new Set([
-            '{button_ids.nav_up}',
-            '{button_ids.nav_page_up}',
-            '{button_ids.nav_first}',
+            {js_value(button_ids.nav_up)},
+            {js_value(button_ids.nav_page_up)},
+            {js_value(button_ids.nav_first)},
         ]);
         // Buttons whose click would move the focus DOWN (or to the last item).
         // If focused index is already total-1, navigation is a no-op.
         const _DOWN_BTN_IDS = new Set([
-            '{button_ids.nav_down}',
-            '{button_ids.nav_page_down}',
-            '{button_ids.nav_last}',
+            {js_value(button_ids.nav_down)},
+            {js_value(button_ids.nav_page_down)},
+            {js_value(button_ids.nav_last)},
         ]);
 
         // === Master Coordinator ===
@@ -140,7 +160,7 @@ def _generate_coordinator_js(
                 if (ns._setupTouchNav) ns._setupTouchNav();
 
                 requestAnimationFrame(function() {{
-                    const cs2 = document.getElementById('{ids.card_stack}');
+                    const cs2 = document.getElementById({js_value(ids.card_stack)});
                     if (cs2) cs2.style.opacity = '1';
 
                     // Continue auto-adjust loop if an adjustment is in flight
@@ -154,13 +174,132 @@ def _generate_coordinator_js(
             }});
         }};
 
+        // === Latest-Wins Navigation Sequencing ===
+        // Every nav request carries an increasing nav_seq; the server echoes the
+        // sequence it rendered on the focused_index_input (data-nav-seq). Responses
+        // older than the newest applied one are dropped before any OOB swap, so a
+        // late response can't re-render a stale window or move focus backwards.
+        // The counter is seeded from the input so it survives page reloads.
+        const _NAV_URLS = new Set([{js_nav_urls}]);
+        const _FOCUS_INPUT_RE = new RegExp('<input[^>]*id="' + {js_value(ids.focused_index_input)} + '"[^>]*>');
+        ns._navSeq = 0;
+        ns._appliedNavSeq = 0;
+        function _inputNavSeq() {{
+            const input = document.getElementById({js_value(ids.focused_index_input)});
+            return input ? parseInt(input.dataset.navSeq || '0') : 0;
+        }}
+        function _isNavPath(path) {{
+            return !!path && _NAV_URLS.has(path.split('?')[0]);
+        }}
+
+        function _isViewportPath(path) {{
+            return !!path && !!{js_viewport_url} && path.split('?')[0] === {js_viewport_url};
+        }}
+
+        // === Stateless Navigation ===
+        // With stateless_nav the server renders a view token on the
+        // focused_index_input (data-view) and keeps no nav state. Nav requests
+        // carry that token plus the live visible count and scale (auto-adjust
+        // and the scale controls change them client-side); viewport updates
+        // carry the focused index the server no longer tracks.
+        function _addViewState(params, isNav) {{
+            const input = document.getElementById({js_value(ids.focused_index_input)});
+            if (!input || !input.dataset.view) return;
+            if (params['focused_index'] == null) params['focused_index'] = input.value;
+            if (!isNav) return;
+            params['view'] = input.dataset.view;
+            const cs = document.getElementById({js_value(ids.card_stack)});
+            if (!cs) return;
+            if (cs.dataset.visibleCount) params['visible_count'] = cs.dataset.visibleCount;
+            const scale = cs.style.getPropertyValue('--card-stack-scale').trim();
+            if (scale) params['card_scale'] = scale;
+        }}
+
+        // === In-Place Position Updates ===
+        // Nav responses built with client_position_updates carry no progress
+        // or scrollbar re-render; the swapped-in focus input has the focused
+        // index and total, so the progress text and the scrollbar track's
+        // data attributes are updated here. The scrollbar's own swap/settle
+        // listeners then move the thumb. Harmless when the server did send
+        // both (same values), and stale responses never reach it (dropped
+        // before the swap).
+        ns.syncPosition = function() {{
+            const input = document.getElementById({js_value(ids.focused_index_input)});
+            if (!input) return;
+            const position = parseInt(input.value || '0');
+            const total = parseInt(input.dataset.totalItems || '0');
+            const track = document.getElementById({js_derived(lambda p: ScrollbarIds(prefix=p).track, config.prefix)});
+            if (track && track.dataset.position !== String(position)) {{
+                track.dataset.position = position;
+                track.dataset.totalItems = total;
+                track.dataset.maxPosition = Math.max(0, total - 1);
+                track.dataset.thumbRatio = (total > 0 ? 1 / total : 1).toFixed(6);
+            }}
+            const progress = document.getElementById({js_value(ids.progress)});
+            const text = progress && progress.firstElementChild;
+            if (text) {{
+                const fmt = (n) => n.toLocaleString('en-US');
+                text.textContent = text.textContent.replace(
+                    /[\\d,]+ of [\\d,]+$/, fmt(position + 1) + ' of ' + fmt(total));
+            }}
+        }};
+
+        function _configRequestHandler(evt) {{
+            if (_isViewportPath(evt.detail.path)) _addViewState(evt.detail.parameters, false);
+            if (!_isNavPath(evt.detail.path)) return;
+            _addViewState(evt.detail.parameters, true);
+            ns._navSeq = Math.max(ns._navSeq, ns._appliedNavSeq, _inputNavSeq()) + 1;
+            evt.detail.parameters['nav_seq'] = ns._navSeq;
+            if (ns._tm) {{
+                // Latency runs from the triggering input event when there is one
+                const trigger = evt.detail.triggeringEvent;
+                ns._tm.navStart(ns._navSeq, trigger ? trigger.timeStamp : performance.now());
+            }}
+        }}
+
+        // Auto-adjust estimates may be answered with a server-chosen count
+        // (CardHeightModel); adopt it before the new slots settle.
+        function _adoptServerCount(evt) {{
+            const n = parseInt(evt.detail.xhr.getResponseHeader('{VISIBLE_COUNT_HEADER}') || '0');
+            const cs = document.getElementById({js_value(ids.card_stack)});
+            if (n > 0 && cs) cs.dataset.visibleCount = n;
+        }}
+
+        function _beforeSwapHandler(evt) {{
+            const info = evt.detail.pathInfo;
+            if (info && _isViewportPath(info.requestPath)) {{
+                _adoptServerCount(evt);
+                return;
+            }}
+            if (!info || !_isNavPath(info.requestPath)) return;
+            const tag = _FOCUS_INPUT_RE.exec(evt.detail.serverResponse || '');
+            const m = tag && /data-nav-seq="(\\d+)"/.exec(tag[0]);
+            if (!m) {{
+                // Superseded on the server: advance past its latest sequence
+                const latest = parseInt(evt.detail.xhr.getResponseHeader('{NAV_SEQ_HEADER}') || '0');
+                ns._navSeq = Math.max(ns._navSeq, latest);
+                if (ns._tm) ns._tm.count('nav_superseded');
+                return;
+            }}
+            const seq = parseInt(m[1]);
+            if (seq < ns._appliedNavSeq) {{
+                evt.detail.shouldSwap = false;
+                if (ns._tm) ns._tm.count('nav_stale_dropped');
+                return;
+            }}
+            ns._appliedNavSeq = seq;
+        }}
+
         // === HTMX Event Listeners ===
         // Remove old listeners from previous IIFE (handles HTMX page navigation
         // that re-executes this script without a full page reload).
-        if (window.{handler_key}) {{
-            document.body.removeEventListener('htmx:beforeRequest', window.{handler_key}.beforeRequest);
-            document.body.removeEventListener('htmx:afterSwap', window.{handler_key}.swap);
-            document.body.removeEventListener('htmx:afterSettle', window.{handler_key}.settle);
+        if ({handlers}) {{
+            document.body.removeEventListener('htmx:configRequest', {handlers}.configRequest);
+            document.body.removeEventListener('htmx:beforeSwap', {handlers}.beforeSwap);
+            document.body.removeEventListener('htmx:beforeRequest', {handlers}.beforeRequest);
+            document.body.removeEventListener('htmx:afterSwap', {handlers}.swap);
+            document.body.removeEventListener('htmx:afterSettle', {handlers}.settle);
+            window.removeEventListener('pagehide', {handlers}.pagehide);
         }}
 
         // Boundary no-op guard: cancel nav requests when already at the boundary.
@@ -173,21 +312,25 @@ def _generate_coordinator_js(
             const total = ns._getTotalItems();
             if (_UP_BTN_IDS.has(elt.id) && idx <= 0) {{
                 evt.preventDefault();
+                if (ns._tm) ns._tm.count('nav_noop');
                 return;
             }}
             if (_DOWN_BTN_IDS.has(elt.id) && total > 0 && idx >= total - 1) {{
                 evt.preventDefault();
+                if (ns._tm) ns._tm.count('nav_noop');
                 return;
             }}
         }}
 
         function _afterSwapHandler(evt) {{
+            const info = evt.detail.pathInfo;
+            if (info && _isNavPath(info.requestPath)) ns.syncPosition();
             const target = evt.detail.target;
             if (!target) return;
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             const isCSSwap = (
-                target.id === '{ids.card_stack}' ||
-                target.id === '{ids.card_stack_inner}' ||
+                target.id === {js_value(ids.card_stack)} ||
+                target.id === {js_value(ids.card_stack_inner)} ||
                 (cs && cs.contains(target))
             );
             if (isCSSwap && typeof _autoGrowing !== 'undefined' && _autoGrowing) {{
@@ -198,10 +341,10 @@ def _generate_coordinator_js(
         function _afterSettleHandler(evt) {{
             const target = evt.detail.target;
             if (!target) return;
-            const cs = document.getElementById('{ids.card_stack}');
+            const cs = document.getElementById({js_value(ids.card_stack)});
             const isCSSwap = (
-                target.id === '{ids.card_stack}' ||
-                target.id === '{ids.card_stack_inner}' ||
+                target.id === {js_value(ids.card_stack)} ||
+                target.id === {js_value(ids.card_stack_inner)} ||
                 (cs && cs.contains(target))
             );
             if (isCSSwap) {{
@@ -216,16 +359,30 @@ def _generate_coordinator_js(
             // idempotent — a duplicate call (when isCSSwap is true) is
             // harmless since applyAllViewportSettings already calls it.
             if (ns.constrainFocusedSection) ns.constrainFocusedSection();
+
+            const info = evt.detail.pathInfo;
+            if (ns._tm && info && _isNavPath(info.requestPath)) ns._tm.navSettled(ns._appliedNavSeq);
+        }}
+
+        // Flush coalesced preference changes before the page goes away
+        function _pageHideHandler() {{
+            if (ns.flushPrefs) ns.flushPrefs(true);
         }}
 
-        window.{handler_key} = {{
+        {handlers} = {{
+            configRequest: _configRequestHandler,
+            beforeSwap: _beforeSwapHandler,
             beforeRequest: _beforeRequestHandler,
             swap: _afterSwapHandler,
             settle: _afterSettleHandler,
+            pagehide: _pageHideHandler,
         }};
+        document.body.addEventListener('htmx:configRequest', _configRequestHandler);
+        document.body.addEventListener('htmx:beforeSwap', _beforeSwapHandler);
         document.body.addEventListener('htmx:beforeRequest', _beforeRequestHandler);
         document.body.addEventListener('htmx:afterSwap', _afterSwapHandler);
         document.body.addEventListener('htmx:afterSettle', _afterSettleHandler);
+        window.addEventListener('pagehide', _pageHideHandler);
 
         // === Initialize ===
         requestAnimationFrame(function() {{
@@ -264,71 +421,184 @@ def _generate_global_callbacks_js(
     """Register global wrappers for keyboard navigation system."""
     lines = ["        // === Global Keyboard Callbacks ==="]
     for cb in _GLOBAL_CALLBACKS:
-        global_name = global_callback_name(config.prefix, cb)
-        lines.append(f"        window['{global_name}'] = function() {{ if (ns.{cb}) ns.{cb}(); }};")
+        global_name = js_derived(lambda p, cb=cb: global_callback_name(p, cb), config.prefix)
+        lines.append(f"        window[{global_name}] = function() {{ if (ns.{cb}) ns.{cb}(); }};")
     return "\n".join(lines)
 
 # %% ../../nbs/js/core.ipynb #jc000011
-def generate_card_stack_js(
+def _generate_instance_logic_js(
     ids: CardStackHtmlIds,  # HTML IDs for this instance
     button_ids: CardStackButtonIds,  # Button IDs for keyboard triggers
     config: CardStackConfig,  # Card stack configuration
     urls: CardStackUrls,  # URL bundle for routing
-    container_id: str = "",  # Consumer's parent container ID (for height calc)
-    extra_scripts: Tuple[str, ...] = (),  # Additional JS to include in the IIFE
     focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
-) -> Any:  # Script element with all card stack JavaScript
-    """Compose all card stack JS into a single namespaced IIFE."""
-    prefix = config.prefix
-    extra_js = "\n".join(extra_scripts)
-
+) -> str:  # JS code fragments for the card stack's own behavior
+    """Compose the card stack's own JS fragments (all but the library-generated viewport-fit and scrollbar code)."""
     # The card stack ID doubles as the keyboard zone ID
     zone_id = ids.card_stack
 
-    # Collect all fragments
-    viewport_js = generate_viewport_height_js(ids, container_id)
-    scroll_js = generate_scroll_nav_js(ids, button_ids, config.disable_scroll_in_modes, zone_id=zone_id)
-    touch_js = generate_touch_nav_js(ids, button_ids, config.disable_scroll_in_modes, zone_id=zone_id)
-    page_nav_js = generate_page_nav_js(button_ids)
-    width_js = _generate_width_mgmt_js(ids, config, urls)
-    scale_js = _generate_scale_mgmt_js(ids, config, urls)
-    count_js = _generate_card_count_mgmt_js(ids, config, urls)
-    auto_js = _generate_auto_adjust_js(ids, config, urls, focus_position)
-    global_cbs_js = _generate_global_callbacks_js(config)
-    coordinator_js = _generate_coordinator_js(ids, config, button_ids, focus_position)
-
-    # Scrollbar JS (separate IIFE, runs after the main card stack IIFE)
-    scrollbar_js = ""
-    if config.show_scrollbar:
-        sb_ids = ScrollbarIds(prefix=prefix)
-        # Zone activation callback: activates this card stack's keyboard zone on scrollbar interaction
-        sb_on_interact = f"_cs_{prefix.replace('-', '_')}_scrollbarActivate"
-        scrollbar_js = f"""
+    return "\n        ".join([
+        _generate_telemetry_js(config, urls),
+        generate_scroll_nav_js(
+            ids, button_ids, config.disable_scroll_in_modes, zone_id=zone_id, nav_by_url=urls.nav_by,
+        ),
+        generate_touch_nav_js(ids, button_ids, config.disable_scroll_in_modes, zone_id=zone_id),
+        generate_page_nav_js(button_ids),
+        _generate_prefs_mgmt_js(urls),
+        _generate_width_mgmt_js(ids, config, urls),
+        _generate_scale_mgmt_js(ids, config, urls),
+        _generate_card_count_mgmt_js(ids, config, urls),
+        _generate_auto_adjust_js(ids, config, urls, focus_position),
+        _generate_window_patcher_js(ids, config, urls),
+        _generate_global_callbacks_js(config),
+        _generate_coordinator_js(ids, config, button_ids, focus_position, urls),
+        _generate_ws_nav_js(ids, config, urls),
+        _generate_item_events_js(config, urls),
+    ])
+
+def _generate_instance_scrollbar_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    config: CardStackConfig,  # Card stack configuration
+    urls: CardStackUrls,  # URL bundle for routing
+) -> str:  # Scrollbar IIFE (empty when the scrollbar is hidden)
+    """Generate the virtual scrollbar JS (separate IIFE, runs after the card stack IIFE)."""
+    if not config.show_scrollbar:
+        return ""
+    prefix = config.prefix
+    sb_ids = ScrollbarIds(prefix=prefix)
+    # Zone activation callback: activates this card stack's keyboard zone on scrollbar interaction
+    sb_on_interact = f"_cs_{prefix.replace('-', '_')}_scrollbarActivate"
+    return f"""
         window['{sb_on_interact}'] = function() {{
-            if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone('{zone_id}');
+            if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone('{ids.card_stack}');
         }};
         """ + _sb_generate_scrollbar_js(
-            ids=sb_ids,
-            position_input_id=ids.focused_index_input,
-            nav_url=urls.nav_to_index,
-            nav_param="target_index",
-            on_interact=sb_on_interact,
-        )
-
-    return Script(f"""(function() {{
+        ids=sb_ids,
+        position_input_id=ids.focused_index_input,
+        nav_url=urls.nav_to_index,
+        nav_param="target_index",
+        on_interact=sb_on_interact,
+    )
+
+def _compose_card_stack_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    button_ids: CardStackButtonIds,  # Button IDs for keyboard triggers
+    config: CardStackConfig,  # Card stack configuration
+    urls: CardStackUrls,  # URL bundle for routing
+    container_id: str = "",  # Consumer's parent container ID (for height calc)
+    extra_scripts: Tuple[str, ...] = (),  # Additional JS to include in the IIFE
+    focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+) -> str:  # Full script text (card stack IIFE + scrollbar IIFE)
+    """Compose all card stack JS fragments into script text."""
+    viewport_js = generate_viewport_height_js(ids, container_id)
+    logic_js = _generate_instance_logic_js(ids, button_ids, config, urls, focus_position)
+    extra_js = "\n".join(extra_scripts)
+    scrollbar_js = _generate_instance_scrollbar_js(ids, config, urls)
+
+    return f"""(function() {{
         window.cardStacks = window.cardStacks || {{}};
-        const ns = window.cardStacks['{prefix}'] = {{}};
+        const ns = window.cardStacks[{js_value(config.prefix)}] = {{}};
 
         {viewport_js}
-        {scroll_js}
-        {touch_js}
-        {page_nav_js}
-        {width_js}
-        {scale_js}
-        {count_js}
-        {auto_js}
-        {global_cbs_js}
-        {coordinator_js}
+        {logic_js}
         {extra_js}
     }})();
+    {scrollbar_js}"""
+
+def generate_card_stack_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    button_ids: CardStackButtonIds,  # Button IDs for keyboard triggers
+    config: CardStackConfig,  # Card stack configuration
+    urls: CardStackUrls,  # URL bundle for routing
+    container_id: str = "",  # Consumer's parent container ID (for height calc)
+    extra_scripts: Tuple[str, ...] = (),  # Additional JS to include in the IIFE
+    focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+    bundles: Optional[CardStackJsBundles] = None,  # Serve as a cached external script (emits <script src>)
+) -> Any:  # Script element with all card stack JavaScript
+    """Compose all card stack JS into a single namespaced IIFE.
+
+    With `bundles`, the script is generated once per distinct set of inputs
+    and referenced by a content-hashed URL instead of being inlined.
+    """
+    args = (ids, button_ids, config, urls, container_id, tuple(extra_scripts), focus_position)
+    if bundles is not None:
+        return Script(src=bundles.get_or_build(args, lambda: _compose_card_stack_js(*args)))
+    return Script(_compose_card_stack_js(*args))
+
+# %% ../../nbs/js/core.ipynb #80cjwtis17
+_RUNTIME_CONFIG_SOURCES: Tuple[str, ...] = ("ids", "buttons", "config", "urls")  # Config groups read by the runtime
+
+@functools.lru_cache(maxsize=None)
+def _build_card_stack_runtime() -> Tuple[str, Dict[str, Tuple[str, ...]]]:  # (runtime JS, fields read per config group)
+    """Generate the shared runtime against config references, recording the fields it reads."""
+    refs = {name: JsRefs(f"c.{name}") for name in _RUNTIME_CONFIG_SOURCES}
+    logic_js = _generate_instance_logic_js(
+        refs["ids"], refs["buttons"], refs["config"], refs["urls"], JsRef("c.focus_position"),
+    )
+    runtime = f"""(function() {{
+        window.cardStacks = window.cardStacks || {{}};
+        window.cardStackRuntime = {{
+            register: function(c) {{
+                const ns = window.cardStacks[c.config.prefix] = {{}};
+        {logic_js}
+                return ns;
+            }},
+        }};
+        // Register instances whose scripts ran before the runtime loaded
+        (window._cardStackPending || []).splice(0).forEach(function(init) {{
+            init(window.cardStackRuntime);
+        }});
+    }})();"""
+    return runtime, {name: tuple(r.fields) for name, r in refs.items()}
+
+def card_stack_runtime_config(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    button_ids: CardStackButtonIds,  # Button IDs for keyboard triggers
+    config: CardStackConfig,  # Card stack configuration
+    urls: CardStackUrls,  # URL bundle for routing
+    focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+) -> Dict[str, Any]:  # JSON-ready per-instance config read by the shared runtime
+    """Collect the values the shared runtime reads for one card stack instance."""
+    _, fields = _build_card_stack_runtime()
+    sources = {"ids": ids, "buttons": button_ids, "config": config, "urls": urls}
+    instance = {name: {f: getattr(sources[name], f) for f in fields[name]} for name in _RUNTIME_CONFIG_SOURCES}
+    instance["focus_position"] = focus_position
+    return instance
+
+def generate_card_stack_runtime_js(
+    bundles: Optional[CardStackJsBundles] = None,  # Serve as a cached external script (emits <script src>)
+) -> Any:  # Script element with the shared card stack runtime
+    """Shared card stack runtime; include once per page before the instance scripts."""
+    runtime, _ = _build_card_stack_runtime()
+    if bundles is not None:
+        return Script(src=bundles.get_or_build(("card-stack-runtime",), lambda: runtime))
+    return Script(runtime)
+
+def generate_card_stack_instance_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    button_ids: CardStackButtonIds,  # Button IDs for keyboard triggers
+    config: CardStackConfig,  # Card stack configuration
+    urls: CardStackUrls,  # URL bundle for routing
+    container_id: str = "",  # Consumer's parent container ID (for height calc)
+    extra_scripts: Tuple[str, ...] = (),  # Additional JS run after registration (with `ns` in scope)
+    focus_position: Optional[int] = None,  # Focus slot offset (None=center, -1=bottom, 0=top)
+) -> Any:  # Script element registering this instance with the shared runtime
+    """Register one card stack with the shared runtime from a compact JSON config."""
+    instance = json.dumps(
+        card_stack_runtime_config(ids, button_ids, config, urls, focus_position),
+        separators=(",", ":"),
+    ).replace("</", "<\\/")
+    viewport_js = generate_viewport_height_js(ids, container_id)
+    extra_js = "\n".join(extra_scripts)
+    scrollbar_js = _generate_instance_scrollbar_js(ids, config, urls)
+
+    return Script(f"""(function(init) {{
+        if (window.cardStackRuntime) init(window.cardStackRuntime);
+        else (window._cardStackPending = window._cardStackPending || []).push(init);
+    }})(function(runtime) {{
+        const ns = runtime.register({instance});
+
+        {viewport_js}
+        {extra_js}
+    }});
     {scrollbar_js}""")
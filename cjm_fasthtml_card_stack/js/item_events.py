@@ -0,0 +1,46 @@
+"""Client side of server-pushed item changes: listens to the instance's item event stream and applies the re-rendered slots."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/item_events.ipynb.
+
+# %% auto #0
+__all__ = []
+
+# %% ../../nbs/js/item_events.ipynb #73vhnw0ncs
+from ..core.config import CardStackConfig
+from ..core.models import CardStackUrls
+from ..core.constants import ITEM_EVENT
+from .values import js_global, js_value
+
+# %% ../../nbs/js/item_events.ipynb #qf3bqecmi6
+def _generate_item_events_js(
+    config: CardStackConfig,  # Config with prefix (stream guard name)
+    urls: CardStackUrls,  # URL bundle (item_events)
+) -> str:  # JS code fragment for the item event listener
+    """Generate JS that applies server-pushed item change events."""
+    source = js_global(lambda p: f"_csItemEvents_{p.replace('-', '_')}", config.prefix)
+    guard = f"""
+        // === Item Change Events ===
+        if ({source}) {{
+            {source}.close();
+            {source} = null;
+        }}"""
+    if not urls.item_events:
+        return guard  # No stream: only close a previous instance's stream
+    return guard + f"""
+        const _EVENTS_URL = {js_value(urls.item_events)};
+        if (_EVENTS_URL && window.EventSource) {{
+            const _events = new EventSource(_EVENTS_URL);
+            _events.addEventListener('{ITEM_EVENT}', function(evt) {{
+                const push = JSON.parse(evt.data);
+                if (push.nav_seq < ns._appliedNavSeq || push.focused_index !== ns._getFocusedIndex()) {{
+                    if (ns._tm) ns._tm.count('push_dropped');
+                    return;
+                }}
+                htmx.swap(document.body, push.html, {{ swapStyle: 'none', swapDelay: 0, settleDelay: 0 }});
+                ns.syncPosition();
+                if (ns.constrainFocusedSection) ns.constrainFocusedSection();
+                if (ns._tm) ns._tm.count('push_applied');
+            }});
+            {source} = _events;
+        }}
+    """
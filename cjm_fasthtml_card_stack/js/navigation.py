@@ -7,6 +7,7 @@ __all__ = ['generate_page_nav_js']
 
 # %% ../../nbs/js/navigation.ipynb #jn000003
 from ..core.button_ids import CardStackButtonIds
+from .values import js_value
 
 # %% ../../nbs/js/navigation.ipynb #jn000005
 def generate_page_nav_js(
@@ -16,22 +17,22 @@ def generate_page_nav_js(
     return f"""
         // === Page Navigation ===
         ns.jumpPageUp = function() {{
-            const btn = document.getElementById('{button_ids.nav_page_up}');
+            const btn = document.getElementById({js_value(button_ids.nav_page_up)});
             if (btn) btn.click();
         }};
 
         ns.jumpPageDown = function() {{
-            const btn = document.getElementById('{button_ids.nav_page_down}');
+            const btn = document.getElementById({js_value(button_ids.nav_page_down)});
             if (btn) btn.click();
         }};
 
         ns.jumpToFirstItem = function() {{
-            const btn = document.getElementById('{button_ids.nav_first}');
+            const btn = document.getElementById({js_value(button_ids.nav_first)});
             if (btn) btn.click();
         }};
 
         ns.jumpToLastItem = function() {{
-            const btn = document.getElementById('{button_ids.nav_last}');
+            const btn = document.getElementById({js_value(button_ids.nav_last)});
             if (btn) btn.click();
         }};
     """
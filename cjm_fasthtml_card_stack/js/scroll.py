@@ -11,6 +11,7 @@ from typing import Tuple
 from ..core.html_ids import CardStackHtmlIds
 from ..core.button_ids import CardStackButtonIds
 from ..core.constants import SCROLL_THRESHOLD, NAVIGATION_COOLDOWN, TRACKPAD_COOLDOWN
+from .values import JsRef, js_value
 
 # %% ../../nbs/js/scroll.ipynb #js000005
 def generate_scroll_nav_js(
@@ -18,16 +19,17 @@ def generate_scroll_nav_js(
     button_ids: CardStackButtonIds,  # Button IDs for navigation triggers
     disable_in_modes: Tuple[str, ...] = (),  # Mode names where scroll nav is suppressed
     zone_id: str = "",  # Keyboard zone ID to activate on scroll interaction
+    nav_by_url: str = "",  # Coalesced multi-step nav URL (empty = click nav buttons per step)
 ) -> str:  # JavaScript code fragment for scroll navigation
     """Generate JS for scroll wheel to navigation conversion."""
     # Build mode check
     if disable_in_modes:
-        modes_array = ', '.join(f"'{m}'" for m in disable_in_modes)
+        disabled_modes = js_value(disable_in_modes)
         mode_check = f"""
         function isScrollDisabled() {{
             if (typeof window.kbNav !== 'undefined') {{
                 const state = window.kbNav.getState();
-                const disabledModes = [{modes_array}];
+                const disabledModes = {disabled_modes};
                 return state && disabledModes.includes(state.currentMode);
             }}
             return false;
@@ -40,7 +42,7 @@ def generate_scroll_nav_js(
 
     # Zone activation on scroll interaction
     zone_activate_js = (
-        f"if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone('{zone_id}');"
+        f"if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone({js_value(zone_id)});"
         if zone_id else ""
     )
 
@@ -49,16 +51,70 @@ def generate_scroll_nav_js(
     # trackpads send small continuous values (1-30).
     trackpad_detect_threshold = 50
 
+    # Step dispatch: coalesced nav_by requests, or one button click per step.
+    # A runtime URL reference is only known per instance, so both are emitted
+    # and one is picked when the instance registers.
+    runtime_url = isinstance(nav_by_url, JsRef)
+    by_name = "_scrollStepBy" if runtime_url else "_scrollStep"
+    click_name = "_scrollStepClick" if runtime_url else "_scrollStep"
+    step_js = ""
+    if nav_by_url:
+        step_js += f"""
+        // Send one nav_by request at a time; steps arriving while it is in
+        // flight are summed and sent together once the response has swapped.
+        function _sendNavSteps(steps) {{
+            const idx = ns._getFocusedIndex();
+            const total = ns._getTotalItems();
+            const target = Math.max(0, Math.min(total - 1, idx + steps));
+            if (total > 0 && target === idx) {{  // Boundary no-op
+                if (ns._tm) ns._tm.count('nav_noop');
+                return;
+            }}
+            _scrollState.inFlight = true;
+            htmx.ajax('POST', {js_value(nav_by_url)}, {{
+                swap: 'none', values: {{ delta: steps, focused_index: idx }}
+            }}).finally(function() {{
+                _scrollState.inFlight = false;
+                const pending = _scrollState.pendingSteps;
+                _scrollState.pendingSteps = 0;
+                if (pending !== 0) _sendNavSteps(pending);
+            }});
+        }}
+
+        function {by_name}(step) {{
+            if (_scrollState.inFlight) {{
+                _scrollState.pendingSteps += step;
+                if (ns._tm) ns._tm.count('wheel_coalesced');
+                return;
+            }}
+            _sendNavSteps(step);
+        }}
+        """
+    if not nav_by_url or runtime_url:
+        step_js += f"""
+        function {click_name}(step) {{
+            const btn = document.getElementById(
+                step > 0 ? {js_value(button_ids.nav_down)} : {js_value(button_ids.nav_up)}
+            );
+            if (btn) btn.click();
+        }}
+        """
+    if runtime_url:
+        step_js += f"""
+        const _scrollStep = {js_value(nav_by_url)} ? {by_name} : {click_name};
+        """
+
     return f"""
         // === Scroll Navigation ===
-        const _scrollState = {{ accumulatedDelta: 0, lastNavTime: 0 }};
+        const _scrollState = {{ accumulatedDelta: 0, lastNavTime: 0, inFlight: false, pendingSteps: 0 }};
         const _SCROLL_THRESHOLD = {SCROLL_THRESHOLD};
         const _NAV_COOLDOWN = {NAVIGATION_COOLDOWN};
         const _TRACKPAD_COOLDOWN = {TRACKPAD_COOLDOWN};
         const _TRACKPAD_DETECT = {trackpad_detect_threshold};
         {mode_check}
+        {step_js}
         function setupScrollNavigation() {{
-            const cardStack = document.getElementById('{ids.card_stack}');
+            const cardStack = document.getElementById({js_value(ids.card_stack)});
             if (!cardStack) return;
 
             // Abort previous listeners (handles re-setup from afterSettle
@@ -97,15 +153,14 @@ def generate_scroll_nav_js(
 
                 if (eventTime - _scrollState.lastNavTime >= cooldown) {{
                     // Cooldown passed — fire navigation
-                    const btnId = _scrollState.accumulatedDelta > 0
-                        ? '{button_ids.nav_down}' : '{button_ids.nav_up}';
+                    const step = _scrollState.accumulatedDelta > 0 ? 1 : -1;
                     _scrollState.accumulatedDelta = 0;
                     _scrollState.lastNavTime = eventTime;
-                    const btn = document.getElementById(btnId);
-                    if (btn) btn.click();
+                    _scrollStep(step);
                 }} else if (eventTime === _scrollState.lastNavTime) {{
                     // Same-batch event (main-thread blockage) — discard
                     _scrollState.accumulatedDelta = 0;
+                    if (ns._tm) ns._tm.count('wheel_dropped');
                 }}
                 // else: real event during cooldown (e.g. trackpad) — keep
                 // accumulated delta so it fires on the next cooldown-passing event
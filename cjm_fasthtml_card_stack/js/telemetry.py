@@ -0,0 +1,87 @@
+"""Opt-in client-side telemetry: navigation latency, forced reflow time, auto-adjust iterations, and dropped or coalesced input, aggregated in the page and beaconed to the server."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/telemetry.ipynb.
+
+# %% auto #0
+__all__ = []
+
+# %% ../../nbs/js/telemetry.ipynb #vuecd8fnh6
+from ..core.config import CardStackConfig
+from ..core.models import CardStackUrls
+from ..core.constants import TELEMETRY_BUCKETS
+from .values import js_global, js_value
+
+# %% ../../nbs/js/telemetry.ipynb #x4ycvgm62s
+def _generate_telemetry_js(
+    config: CardStackConfig,  # Config with prefix and beacon interval
+    urls: CardStackUrls,  # URL bundle (client_telemetry)
+) -> str:  # JS code fragment for client telemetry
+    """Generate JS that aggregates client telemetry and beacons it to the server."""
+    timer = js_global(lambda p: f"_csTelemetry_{p.replace('-', '_')}", config.prefix)
+    guard = f"""
+        // === Client Telemetry ===
+        ns._tm = null;
+        if ({timer}) {{
+            clearInterval({timer}.interval);
+            window.removeEventListener('pagehide', {timer}.flush);
+            document.removeEventListener('visibilitychange', {timer}.hidden);
+        }}"""
+    if not urls.client_telemetry:
+        return guard  # Telemetry off: only stop a previous instance's beacons
+    return guard + f"""
+        const _TM_URL = {js_value(urls.client_telemetry)};
+        if (_TM_URL) {{
+            const _TM_BUCKETS = {js_value(TELEMETRY_BUCKETS)};
+            let _tmHist = {{}};
+            let _tmCounters = {{}};
+            const _tmNavStarts = new Map();
+
+            ns._tm = {{
+                observe: function(name, value) {{
+                    let h = _tmHist[name];
+                    if (!h) h = _tmHist[name] = {{ c: new Array(_TM_BUCKETS.length + 1).fill(0), s: 0, m: 0 }};
+                    let i = 0;
+                    while (i < _TM_BUCKETS.length && value > _TM_BUCKETS[i]) i++;
+                    h.c[i]++;
+                    h.s += value;
+                    if (value > h.m) h.m = value;
+                }},
+                count: function(name, n) {{
+                    _tmCounters[name] = (_tmCounters[name] || 0) + (n === undefined ? 1 : n);
+                }},
+                // Input-to-settle latency, keyed by nav_seq
+                navStart: function(seq, startTime) {{
+                    ns._tm.count('nav_requests');
+                    if (_tmNavStarts.size > 64) _tmNavStarts.clear();
+                    _tmNavStarts.set(seq, startTime);
+                }},
+                navSettled: function(seq) {{
+                    const start = _tmNavStarts.get(seq);
+                    if (start === undefined) return;
+                    ns._tm.observe('nav_latency_ms', performance.now() - start);
+                    for (const s of _tmNavStarts.keys()) if (s <= seq) _tmNavStarts.delete(s);
+                }},
+            }};
+
+            ns.telemetrySnapshot = function() {{
+                return {{ v: 1, h: _tmHist, n: _tmCounters }};
+            }};
+
+            ns.flushTelemetry = function() {{
+                if (!Object.keys(_tmHist).length && !Object.keys(_tmCounters).length) return;
+                const body = new URLSearchParams({{ report: JSON.stringify(ns.telemetrySnapshot()) }});
+                _tmHist = {{}};
+                _tmCounters = {{}};
+                if (navigator.sendBeacon && navigator.sendBeacon(_TM_URL, body)) return;
+                fetch(_TM_URL, {{ method: 'POST', body: body, keepalive: true }}).catch(function() {{}});
+            }};
+
+            {timer} = {{
+                interval: setInterval(ns.flushTelemetry, {js_value(config.telemetry_interval_ms)}),
+                flush: ns.flushTelemetry,
+                hidden: function() {{ if (document.visibilityState === 'hidden') ns.flushTelemetry(); }},
+            }};
+            window.addEventListener('pagehide', {timer}.flush);
+            document.addEventListener('visibilitychange', {timer}.hidden);
+        }}
+    """
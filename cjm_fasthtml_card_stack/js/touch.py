@@ -16,6 +16,7 @@ from cjm_fasthtml_card_stack.core.constants import (
     TOUCH_MOMENTUM_FRICTION, TOUCH_PINCH_THRESHOLD,
     TOUCH_VELOCITY_SAMPLES,
 )
+from .values import js_value
 
 # %% ../../nbs/js/touch.ipynb #t1000005
 def generate_touch_nav_js(
@@ -27,12 +28,12 @@ def generate_touch_nav_js(
     """Generate JS for touch gesture to navigation conversion."""
     # Build mode check (same pattern as scroll.ipynb)
     if disable_in_modes:
-        modes_array = ', '.join(f"'{m}'" for m in disable_in_modes)
+        disabled_modes = js_value(disable_in_modes)
         mode_check = f"""
         function isTouchDisabled() {{
             if (typeof window.kbNav !== 'undefined') {{
                 const state = window.kbNav.getState();
-                const disabledModes = [{modes_array}];
+                const disabledModes = {disabled_modes};
                 return state && disabledModes.includes(state.currentMode);
             }}
             return false;
@@ -50,7 +51,7 @@ def generate_touch_nav_js(
 
     # Zone activation on touch interaction
     zone_activate_js = (
-        f"if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone('{zone_id}');"
+        f"if (window.kbNav && window.kbNav.setActiveZone) window.kbNav.setActiveZone({js_value(zone_id)});"
         if zone_id else ""
     )
 
@@ -83,7 +84,7 @@ def generate_touch_nav_js(
         {mode_check}
         function _getTouchStepDistance() {{
             const slot = document.querySelector(
-                '#' + CSS.escape('{ids.card_stack}') + ' .viewport-slot[tabindex=\\\"0\\\"]'
+                '#' + CSS.escape({js_value(ids.card_stack)}) + ' .viewport-slot[tabindex=\\\"0\\\"]'
             );
             if (slot) {{
                 const h = slot.getBoundingClientRect().height;
@@ -109,13 +110,13 @@ def generate_touch_nav_js(
 
         function _fireTouchNav(direction) {{
             const btnId = direction === 'down'
-                ? '{button_ids.nav_down}' : '{button_ids.nav_up}';
+                ? {js_value(button_ids.nav_down)} : {js_value(button_ids.nav_up)};
             const btn = document.getElementById(btnId);
             if (btn) btn.click();
         }}
 
         function setupTouchNavigation() {{
-            const cardStack = document.getElementById('{ids.card_stack}');
+            const cardStack = document.getElementById({js_value(ids.card_stack)});
             if (!cardStack) return;
 
             // Abort previous listeners (handles re-setup from afterSettle
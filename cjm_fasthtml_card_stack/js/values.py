@@ -0,0 +1,77 @@
+"""Emit Python values into generated JavaScript as literals or as references into a runtime config object."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/values.ipynb.
+
+# %% auto #0
+__all__ = ['JsRef', 'JsRefs', 'js_value', 'js_derived', 'js_global']
+
+# %% ../../nbs/js/values.ipynb #tle28i8fkm
+import json
+from typing import Any, Callable, List
+
+# %% ../../nbs/js/values.ipynb #w091f25rkp
+class JsRef(str):
+    """A JavaScript expression emitted verbatim instead of as a literal."""
+    __slots__ = ()
+
+class JsRefs:
+    """Stand-in for an IDs/config/URL object whose attributes are runtime references."""
+
+    def __init__(
+        self,
+        base: str,  # JS expression of the config object (e.g., "c.ids")
+    ):
+        self._base = base
+        self.fields: List[str] = []  # Attribute names read during generation, in first-use order
+
+    def __getattr__(self, name: str) -> JsRef:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self.fields:
+            self.fields.append(name)
+        return JsRef(f"{self._base}.{name}")
+
+# %% ../../nbs/js/values.ipynb #1h4g5mp1l7
+def js_value(
+    value: Any,  # Python value or JsRef
+) -> str:  # JS source: a literal, or the reference expression itself
+    """Render a Python value as JavaScript source (strings single-quoted)."""
+    if isinstance(value, JsRef):
+        return str(value)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        escaped = json.dumps(value)[1:-1].replace("'", "\\'").replace("</", "<\\/")
+        return f"'{escaped}'"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(js_value(v) for v in value) + "]"
+    raise TypeError(f"Cannot render {type(value).__name__} as a JavaScript value")
+
+# %% ../../nbs/js/values.ipynb #am9ibiqlma
+_PREFIX_MARKER: str = "\x00"
+
+def js_derived(
+    name_fn: Callable[[str], str],  # Computes a name from an instance prefix
+    prefix: str,  # Instance prefix (str or JsRef)
+) -> str:  # JS source for name_fn(prefix)
+    """Render a prefix-derived name as a JS literal or runtime concatenation."""
+    if not isinstance(prefix, JsRef):
+        return js_value(name_fn(prefix))
+    head, found, tail = name_fn(_PREFIX_MARKER).partition(_PREFIX_MARKER)
+    if not found:
+        raise ValueError("name_fn must embed the prefix")
+    parts = ([js_value(head)] if head else []) + [str(prefix)] + ([js_value(tail)] if tail else [])
+    return JsRef(" + ".join(parts))
+
+def js_global(
+    name_fn: Callable[[str], str],  # Computes a window property name from an instance prefix
+    prefix: str,  # Instance prefix (str or JsRef)
+) -> str:  # JS source referencing the window property
+    """Reference a prefix-derived window property (`window.x` or `window[expr]`)."""
+    if isinstance(prefix, JsRef):
+        return f"window[{js_derived(name_fn, prefix)}]"
+    return f"window.{name_fn(prefix)}"
@@ -0,0 +1,86 @@
+"""Client for the JSON window route: fetches a window payload and patches the viewport sections directly, without htmx OOB parsing."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/window.ipynb.
+
+# %% auto #0
+__all__ = []
+
+# %% ../../nbs/js/window.ipynb #m11j522ia9
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackUrls
+from .values import js_value
+
+# %% ../../nbs/js/window.ipynb #o8r04xwvot
+def _generate_window_patcher_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    config: CardStackConfig,  # Config with the window_patcher switch
+    urls: CardStackUrls,  # URL bundle (nav_window)
+) -> str:  # JS code fragment for the window patcher (empty unless enabled)
+    """Generate JS that fetches JSON window payloads and patches the viewport sections."""
+    if not (config.window_patcher and urls.nav_window):
+        return ""
+    return f"""
+        // === JSON Window Patcher ===
+        const _WIN_URL = {js_value(urls.nav_window)};
+        const _winHtml = new WeakMap();  // Slot node -> HTML it was parsed from
+
+        ns.applyWindow = function(payload) {{
+            if (!payload || payload.superseded) return false;
+            if (payload.nav_seq < (ns._appliedNavSeq || 0)) return false;  // Stale
+            ns._appliedNavSeq = Math.max(ns._appliedNavSeq || 0, payload.nav_seq);
+            const sections = [
+                document.getElementById({js_value(ids.viewport_section_before)}),
+                document.getElementById({js_value(ids.viewport_section_focused)}),
+                document.getElementById({js_value(ids.viewport_section_after)}),
+            ];
+            if (sections.some(function(s) {{ return !s; }})) return false;
+
+            const tpl = document.createElement('template');
+            const fresh = [];
+            const nodes = Object.keys(payload.slots).map(function(id) {{
+                const html = payload.slots[id];
+                let node = document.getElementById(id);
+                if (!node || _winHtml.get(node) !== html) {{
+                    tpl.innerHTML = html;
+                    node = tpl.content.firstElementChild;
+                    _winHtml.set(node, html);
+                    fresh.push(node);
+                }}
+                return node;
+            }});
+            const fs = payload.focus_slot;
+            sections[0].replaceChildren(...nodes.slice(0, fs));
+            sections[1].replaceChildren(...nodes.slice(fs, fs + 1));
+            sections[2].replaceChildren(...nodes.slice(fs + 1));
+            if (window.htmx) fresh.forEach(function(node) {{ htmx.process(node); }});
+
+            const input = document.getElementById({js_value(ids.focused_index_input)});
+            if (input) {{
+                input.value = payload.focused_index;
+                input.dataset.totalItems = payload.total;
+                input.dataset.navSeq = payload.nav_seq;
+                if (payload.view) input.dataset.view = payload.view;
+            }}
+            if (ns.syncPosition) ns.syncPosition();
+            if (ns.constrainFocusedSection) ns.constrainFocusedSection();
+            return true;
+        }};
+
+        ns.fetchWindow = function(move) {{
+            if (!_WIN_URL) return Promise.resolve(false);
+            const params = Object.assign({{}}, move || {{}});
+            if (Object.keys(params).length > 0) {{
+                ns._navSeq = Math.max(ns._navSeq || 0, ns._appliedNavSeq || 0) + 1;
+                params['nav_seq'] = ns._navSeq;
+            }}
+            const input = document.getElementById({js_value(ids.focused_index_input)});
+            if (input && input.dataset.view) {{
+                params['focused_index'] = input.value;
+                params['view'] = input.dataset.view;
+            }}
+            return fetch(_WIN_URL, {{ method: 'POST', body: new URLSearchParams(params), credentials: 'same-origin' }})
+                .then(function(r) {{ return r.ok ? r.json() : null; }})
+                .then(ns.applyWindow);
+        }};
+    """
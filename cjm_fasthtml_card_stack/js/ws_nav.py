@@ -0,0 +1,123 @@
+"""Client side of the WebSocket nav transport: sends nav requests over one socket instead of one POST each and applies the OOB fragments it gets back."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/js/ws_nav.ipynb.
+
+# %% auto #0
+__all__ = []
+
+# %% ../../nbs/js/ws_nav.ipynb #hnen9u6ncz
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackUrls
+from .values import js_global, js_value
+
+# %% ../../nbs/js/ws_nav.ipynb #6yl5feyzcp
+def _generate_ws_nav_js(
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    config: CardStackConfig,  # Config with prefix (socket guard name)
+    urls: CardStackUrls,  # URL bundle (nav_ws and the nav URLs it replaces)
+) -> str:  # JS code fragment for the WebSocket nav transport
+    """Generate JS that sends nav requests over a WebSocket and applies the replies."""
+    sock = js_global(lambda p: f"_csSocket_{p.replace('-', '_')}", config.prefix)
+    commands = (
+        ("nav_up", urls.nav_up), ("nav_down", urls.nav_down),
+        ("nav_first", urls.nav_first), ("nav_last", urls.nav_last),
+        ("nav_page_up", urls.nav_page_up), ("nav_page_down", urls.nav_page_down),
+        ("nav_to_index", urls.nav_to_index), ("nav_by", urls.nav_by),
+    )
+    js_commands = ", ".join(f"[{js_value(url)}, '{cmd}']" for cmd, url in commands if url)
+    guard = f"""
+        // === WebSocket Navigation ===
+        // Registered after the coordinator: its beforeRequest guard runs first.
+        if ({sock}) {{
+            {sock}.closed = true;
+            clearTimeout({sock}.retry);
+            if ({sock}.socket) {sock}.socket.close();
+            document.body.removeEventListener('htmx:beforeRequest', {sock}.beforeRequest);
+            document.body.removeEventListener('htmx:afterRequest', {sock}.afterRequest);
+            {sock} = null;
+        }}"""
+    if not urls.nav_ws:
+        return guard  # No transport: only close a previous instance's socket
+    return guard + f"""
+        const _WS_URL = {js_value(urls.nav_ws)};
+        if (_WS_URL && window.WebSocket) {{
+            const _WS_CMDS = new Map([{js_commands}]);
+            const _ws = {{ socket: null, retry: null, delay: 500, closed: false, resync: false }};
+
+            function _wsConnect() {{
+                if (_ws.closed) return;
+                const scheme = location.protocol === 'https:' ? 'wss:' : 'ws:';
+                const socket = new WebSocket(scheme + '//' + location.host + _WS_URL);
+                socket.onopen = function() {{ _ws.delay = 500; }};
+                socket.onmessage = function(evt) {{ _wsApply(evt.data); }};
+                socket.onclose = function() {{
+                    if (_ws.socket === socket) _ws.socket = null;
+                    if (_ws.closed) return;
+                    _ws.retry = setTimeout(_wsConnect, _ws.delay);
+                    _ws.delay = Math.min(_ws.delay * 2, 30000);
+                }};
+                _ws.socket = socket;
+            }}
+
+            function _wsApply(html) {{
+                const tag = _FOCUS_INPUT_RE.exec(html);
+                const m = tag && /data-nav-seq="(\\d+)"/.exec(tag[0]);
+                if (!m) return;
+                const seq = parseInt(m[1]);
+                if (seq < ns._appliedNavSeq) {{
+                    if (ns._tm) ns._tm.count('nav_stale_dropped');
+                    return;
+                }}
+                ns._appliedNavSeq = seq;
+                htmx.swap(document.body, html, {{ swapStyle: 'none', swapDelay: 0, settleDelay: 0 }});
+                ns.syncPosition();
+                if (ns.constrainFocusedSection) ns.constrainFocusedSection();
+                if (ns._tm) ns._tm.navSettled(seq);
+            }}
+
+            function _wsParams(requestConfig) {{
+                const params = {{}};
+                if (requestConfig.formData) {{
+                    requestConfig.formData.forEach(function(value, key) {{ params[key] = value; }});
+                }} else {{
+                    Object.assign(params, requestConfig.parameters);
+                }}
+                return params;
+            }}
+
+            function _wsBeforeRequest(evt) {{
+                if (evt.defaultPrevented) return;  // Boundary no-op
+                const socket = _ws.socket;
+                if (!socket || socket.readyState !== WebSocket.OPEN) return;
+                const info = evt.detail.pathInfo;
+                const cmd = info && info.requestPath && _WS_CMDS.get(info.requestPath.split('?')[0]);
+                if (!cmd || !evt.detail.requestConfig) return;
+                evt.preventDefault();
+                const msg = _wsParams(evt.detail.requestConfig);
+                msg.cmd = cmd;
+                if (_ws.resync) {{
+                    msg.resync = 1;
+                    _ws.resync = false;
+                }}
+                socket.send(JSON.stringify(msg));
+                if (ns._tm) ns._tm.count('nav_ws');
+            }}
+
+            // Requests that reached the server may have changed stored state
+            function _wsAfterRequest() {{
+                _ws.resync = true;
+            }}
+
+            {sock} = {{
+                get socket() {{ return _ws.socket; }},
+                get retry() {{ return _ws.retry; }},
+                set closed(value) {{ _ws.closed = value; }},
+                beforeRequest: _wsBeforeRequest,
+                afterRequest: _wsAfterRequest,
+            }};
+            document.body.addEventListener('htmx:beforeRequest', _wsBeforeRequest);
+            document.body.addEventListener('htmx:afterRequest', _wsAfterRequest);
+            _wsConnect();
+        }}
+    """
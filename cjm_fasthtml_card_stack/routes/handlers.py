@@ -4,30 +4,49 @@
 
 # %% auto #0
 __all__ = ['build_slots_response', 'build_nav_response', 'card_stack_navigate', 'card_stack_navigate_to_index',
-           'card_stack_update_viewport', 'card_stack_save_width', 'card_stack_save_scale']
+           'card_stack_navigate_by', 'card_stack_update_viewport', 'card_stack_navigate_async',
+           'card_stack_navigate_to_index_async', 'card_stack_navigate_by_async', 'card_stack_update_viewport_async',
+           'card_stack_save_width', 'card_stack_save_scale', 'card_stack_save_prefs']
 
 # %% ../../nbs/routes/handlers.ipynb #h1000003
-from typing import Any, Callable, List, Optional, Tuple
+import asyncio
+import inspect
+import math
+from typing import Any, Callable, List, Mapping, Optional, Tuple
+
+from fasthtml.common import HttpHeader
 
 from ..core.config import CardStackConfig
 from ..core.html_ids import CardStackHtmlIds
 from ..core.models import CardStackState, CardStackUrls
+from ..core.constants import NAV_SEQ_HEADER, VISIBLE_COUNT_HEADER
+from ..core.data_source import CardItems, count_once, item_count, fetch_window
 from cjm_fasthtml_card_stack.components.viewport import (
-    render_all_slots_oob, render_viewport, render_card_stack_scrollbar,
+    render_all_slots_oob, render_slots_diff_oob, render_viewport, render_card_stack_scrollbar,
 )
 from ..components.progress import render_progress_indicator
-from ..helpers.focus import render_focus_oob
+from ..helpers.focus import render_focus_oob, calculate_viewport_window, encode_view_state
+from ..helpers.heights import CardHeightModel
 
 # %% ../../nbs/routes/handlers.ipynb #h1000005
 def build_slots_response(
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
     urls: CardStackUrls,  # URL bundle for navigation
     render_card: Callable,  # Card renderer callback
-) -> List[Any]:  # OOB slot elements (3 viewport sections)
-    """Build OOB slot updates for the viewport sections only."""
+    prev_focused_index: Optional[int] = None,  # Focused index before this update (enables slot diffs)
+) -> List[Any]:  # OOB slot elements (3 viewport sections, or slot diffs)
+    """Build OOB slot updates for the viewport sections only.
+
+    When `config.incremental_nav` is on and the previous focused index is
+    known, only the slots that enter, leave, or change section are sent.
+    """
+    if config.incremental_nav and prev_focused_index is not None:
+        return render_slots_diff_oob(
+            prev_focused_index, card_items, state, config, ids, urls, render_card,
+        )
     return render_all_slots_oob(
         card_items=card_items,
         state=state,
@@ -39,7 +58,7 @@ def build_slots_response(
 
 # %% ../../nbs/routes/handlers.ipynb #h1000006
 def build_nav_response(
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
@@ -47,16 +66,19 @@ def build_nav_response(
     render_card: Callable,  # Card renderer callback
     progress_label: str = "Item",  # Label for progress indicator
     form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    prev_focused_index: Optional[int] = None,  # Focused index before navigation (enables slot diffs)
 ) -> Tuple:  # OOB elements (slots + progress + focus + scrollbar)
-    """Build full OOB response for navigation: slots + progress + focus inputs + scrollbar."""
-    total_items = len(card_items)
+    """Build full OOB response for navigation: slots + progress + focus inputs + scrollbar.
+
+    With `config.client_position_updates` the progress indicator and scrollbar
+    are left out: the client updates both in place from the focus input,
+    which already carries the focused index and total.
+    """
+    total_items = item_count(card_items)
     slots_oob = build_slots_response(
         card_items=card_items, state=state, config=config,
         ids=ids, urls=urls, render_card=render_card,
-    )
-    progress_oob = render_progress_indicator(
-        state.focused_index, total_items, ids,
-        label=progress_label, oob=True,
+        prev_focused_index=prev_focused_index,
     )
     # Pass total_items so the OOB-swapped hidden input carries data-total-items
     # for the client-side boundary no-op guard to read a fresh value every nav.
@@ -64,8 +86,17 @@ def build_nav_response(
         state.focused_index, ids,
         form_input_name=form_input_name,
         total_items=total_items,
+        nav_seq=state.nav_seq,
+        view=encode_view_state(state, config) if config.stateless_nav else None,
     )
 
+    if config.client_position_updates:
+        return (*slots_oob, *focus_oob)
+
+    progress_oob = render_progress_indicator(
+        state.focused_index, total_items, ids,
+        label=progress_label, oob=True,
+    )
     result = (*slots_oob, progress_oob, *focus_oob)
 
     # Scrollbar OOB keeps track data-attributes in sync
@@ -77,10 +108,64 @@ def build_nav_response(
 
     return result
 
+# %% ../../nbs/routes/handlers.ipynb #nnq0l29o0a
+def _diff_base_index(
+    state: CardStackState,  # State before navigation is applied
+    client_focused_index: Optional[int] = None,  # Index reported by the client, if any
+) -> Optional[int]:  # Index to diff against, or None to force a full re-render
+    """Pick the previous focused index a slot diff can safely be built against.
+
+    A diff is only valid against the window the client is actually showing.
+    If the client reports a different index than the server state holds
+    (dropped or reordered responses), return None so all sections re-render.
+    """
+    if client_focused_index is not None and client_focused_index != state.focused_index:
+        return None
+    return state.focused_index
+
+# %% ../../nbs/routes/handlers.ipynb #5x7gcx7iaq
+def _superseded(
+    state: CardStackState,  # Current card stack state (nav_seq updated in place)
+    nav_seq: Optional[int] = None,  # Client sequence number of this request
+) -> bool:  # True if a newer nav request was already processed
+    """Check a request's sequence number against state, recording it if newer."""
+    if nav_seq is None:
+        return False
+    if nav_seq <= state.nav_seq:
+        return True
+    state.nav_seq = nav_seq
+    return False
+
+def _superseded_response(
+    state: CardStackState,  # Current card stack state
+) -> Tuple:  # Empty body with the latest processed sequence number
+    """Response for a skipped nav request."""
+    return (HttpHeader(NAV_SEQ_HEADER, str(state.nav_seq)),)
+
+# %% ../../nbs/routes/handlers.ipynb #8nssyd2vr9
+def _resolve_direction(
+    direction: str,  # "up", "down", "first", "last", "page_up", "page_down"
+    state: CardStackState,  # Current card stack state
+    total: int,  # Total number of items (> 0)
+) -> int:  # Target focused index (unknown directions keep the current index)
+    """Map a navigation direction to the new focused index."""
+    # Page jump = visible_count - 1 (one overlap card), minimum 1
+    page_jump = max(1, state.visible_count - 1)
+
+    direction_map = {
+        "up": max(0, state.focused_index - 1),
+        "down": min(total - 1, state.focused_index + 1),
+        "first": 0,
+        "last": total - 1,
+        "page_up": max(0, state.focused_index - page_jump),
+        "page_down": min(total - 1, state.focused_index + page_jump),
+    }
+    return direction_map.get(direction, state.focused_index)
+
 # %% ../../nbs/routes/handlers.ipynb #h1000008
 def card_stack_navigate(
     direction: str,  # "up", "down", "first", "last", "page_up", "page_down"
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state (mutated in place)
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
@@ -88,37 +173,33 @@ def card_stack_navigate(
     render_card: Callable,  # Card renderer callback
     progress_label: str = "Item",  # Label for progress indicator
     form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
 ) -> Tuple:  # OOB elements (slots + progress + focus)
     """Navigate to a different item. Mutates state.focused_index in place."""
-    total = len(card_items)
+    card_items = count_once(card_items)
+    total = item_count(card_items)
     if total == 0:
         return build_slots_response(
             card_items, state, config, ids, urls, render_card
         )
 
-    # Page jump = visible_count - 1 (one overlap card), minimum 1
-    page_jump = max(1, state.visible_count - 1)
-
-    direction_map = {
-        "up": max(0, state.focused_index - 1),
-        "down": min(total - 1, state.focused_index + 1),
-        "first": 0,
-        "last": total - 1,
-        "page_up": max(0, state.focused_index - page_jump),
-        "page_down": min(total - 1, state.focused_index + page_jump),
-    }
-    state.focused_index = direction_map.get(direction, state.focused_index)
+    if _superseded(state, nav_seq):
+        return _superseded_response(state)
+    prev_index = _diff_base_index(state, client_focused_index)
+    state.focused_index = _resolve_direction(direction, state, total)
 
     return build_nav_response(
         card_items, state, config, ids, urls, render_card,
         progress_label=progress_label,
         form_input_name=form_input_name,
+        prev_focused_index=prev_index,
     )
 
 # %% ../../nbs/routes/handlers.ipynb #h1000009
 def card_stack_navigate_to_index(
     target_index: int,  # Target item index to navigate to
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state (mutated in place)
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
@@ -126,34 +207,106 @@ def card_stack_navigate_to_index(
     render_card: Callable,  # Card renderer callback
     progress_label: str = "Item",  # Label for progress indicator
     form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
 ) -> Tuple:  # OOB elements (slots + progress + focus)
     """Navigate to a specific item index. Mutates state.focused_index in place."""
-    total = len(card_items)
+    card_items = count_once(card_items)
+    total = item_count(card_items)
     if total == 0:
         return build_slots_response(
             card_items, state, config, ids, urls, render_card
         )
 
+    if _superseded(state, nav_seq):
+        return _superseded_response(state)
+    prev_index = _diff_base_index(state, client_focused_index)
     state.focused_index = max(0, min(total - 1, target_index))
 
     return build_nav_response(
         card_items, state, config, ids, urls, render_card,
         progress_label=progress_label,
         form_input_name=form_input_name,
+        prev_focused_index=prev_index,
+    )
+
+# %% ../../nbs/routes/handlers.ipynb #rjn57r8jiw
+def card_stack_navigate_by(
+    delta: int,  # Signed number of items to move (negative = up)
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback
+    progress_label: str = "Item",  # Label for progress indicator
+    form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
+) -> Tuple:  # OOB elements (slots + progress + focus)
+    """Move focus by several items in one request. Mutates state.focused_index in place.
+
+    Used by scroll navigation to coalesce a burst of wheel steps: only the
+    final window is rendered instead of every intermediate one.
+    """
+    return card_stack_navigate_to_index(
+        state.focused_index + delta, card_items, state, config, ids, urls, render_card,
+        progress_label=progress_label,
+        form_input_name=form_input_name,
+        client_focused_index=client_focused_index,
+        nav_seq=nav_seq,
     )
 
 # %% ../../nbs/routes/handlers.ipynb #h1000011
+def _choose_visible_count(
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state
+    is_auto: bool,  # Whether this update came from auto-adjust mode
+    height_model: Optional[CardHeightModel],  # Learned card heights (None = client decides)
+    section_height: Optional[float],  # Client-measured space per context section (estimate requests only)
+    card_gap: float,  # Client-measured gap between cards in px
+    card_heights: Optional[Mapping[int, float]],  # Client-measured slot heights by item index
+) -> Optional[int]:  # Server-chosen visible count, or None to keep the requested one
+    """Feed auto-adjust measurements to the height model and let it choose the count."""
+    if height_model is None or not is_auto:
+        return None
+    if card_heights:
+        height_model.record_measurements(card_items, state, card_heights)
+    if section_height is None:
+        return None
+    if not (math.isfinite(section_height) and section_height >= 0
+            and math.isfinite(card_gap) and card_gap >= 0):
+        return None  # Ignore malformed measurements and keep the requested count
+    return height_model.choose_visible_count(card_items, state, section_height, card_gap)
+
 def card_stack_update_viewport(
     visible_count: int,  # New number of visible cards
-    card_items: List[Any],  # All data items
+    card_items: CardItems,  # All data items (list or data source)
     state: CardStackState,  # Current card stack state (mutated in place)
     config: CardStackConfig,  # Card stack configuration
     ids: CardStackHtmlIds,  # HTML IDs for this instance
     urls: CardStackUrls,  # URL bundle for navigation
     render_card: Callable,  # Card renderer callback
     is_auto: bool = True,  # Whether this update came from auto-adjust mode
-) -> Tuple:  # OOB section elements (3 viewport sections + scrollbar)
-    """Update viewport with new card count via OOB section swaps. Mutates state in place."""
+    height_model: Optional[CardHeightModel] = None,  # Learned card heights (lets the server choose auto counts)
+    section_height: Optional[float] = None,  # Client-measured space per context section in px (estimate requests)
+    card_gap: float = 0.0,  # Client-measured gap between cards in px
+    card_heights: Optional[Mapping[int, float]] = None,  # Client-measured slot heights by item index
+    form_input_name: str = "focused_index",  # Name for the hidden input (re-issued under stateless nav)
+) -> Tuple:  # OOB section elements (3 viewport sections + scrollbar, + visible count header when chosen)
+    """Update viewport with new card count via OOB section swaps. Mutates state in place.
+
+    With a `height_model`, auto-adjust requests teach it the measured card
+    heights, and estimate requests (those carrying `section_height`) have it
+    choose the visible count instead of the client. Under stateless nav the
+    focused index input is re-issued with a fresh view token.
+    """
+    card_items = count_once(card_items)
+    chosen = _choose_visible_count(
+        card_items, state, is_auto, height_model, section_height, card_gap, card_heights,
+    )
+    if chosen is not None:
+        visible_count = chosen
     state.visible_count = visible_count
     state.is_auto_mode = is_auto
     result = tuple(build_slots_response(
@@ -168,10 +321,201 @@ def card_stack_update_viewport(
     # Scrollbar OOB — visible_count change affects thumb height
     if config.show_scrollbar:
         scrollbar_oob = render_card_stack_scrollbar(
-            state, config, len(card_items), oob=True,
+            state, config, item_count(card_items), oob=True,
         )
         result = result + (scrollbar_oob,)
 
+    # Stateless nav: refresh the view token so later navs carry the new count
+    if config.stateless_nav:
+        result = result + render_focus_oob(
+            state.focused_index, ids,
+            form_input_name=form_input_name,
+            total_items=item_count(card_items),
+            view=encode_view_state(state, config),
+        )
+
+    if chosen is not None:
+        result = result + (HttpHeader(VISIBLE_COUNT_HEADER, str(chosen)),)
+    return result
+
+# %% ../../nbs/routes/handlers.ipynb #ltiivw0chx
+async def _maybe_await(
+    value: Any,  # Plain value or awaitable
+) -> Any:  # Resolved value
+    """Await value if it is awaitable, otherwise return it unchanged."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+# %% ../../nbs/routes/handlers.ipynb #he02igt84k
+async def _build_concurrently(
+    build: Callable[[Callable], Any],  # Pure builder: (render_card) -> response
+    render_card: Callable,  # Card renderer callback (sync or async)
+) -> Any:  # Response produced by the builder
+    """Run a response builder with all of its card renders awaited concurrently."""
+    requests = []
+
+    def _record(item, context):
+        requests.append((item, context))
+        return None
+
+    build(_record)
+    rendered = await asyncio.gather(
+        *(_maybe_await(render_card(item, context)) for item, context in requests)
+    )
+    # The builder is deterministic, so the second pass asks for the same
+    # cards in the same order
+    results = iter(rendered)
+    return build(lambda item, context: next(results))
+
+# %% ../../nbs/routes/handlers.ipynb #v6jkrk1r2p
+def _prefetch_window(
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # State after navigation is applied
+) -> CardItems:  # Items with the current window fetched once
+    """Fetch the viewport window up front so both builder passes share it."""
+    indices = calculate_viewport_window(
+        state.focused_index, item_count(card_items), state.visible_count, state.focus_position
+    )
+    return fetch_window(card_items, indices)
+
+# %% ../../nbs/routes/handlers.ipynb #m2mqdw8qdr
+async def card_stack_navigate_async(
+    direction: str,  # "up", "down", "first", "last", "page_up", "page_down"
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    progress_label: str = "Item",  # Label for progress indicator
+    form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
+) -> Tuple:  # OOB elements (slots + progress + focus)
+    """Async `card_stack_navigate`: visible cards are rendered concurrently."""
+    card_items = count_once(card_items)
+    total = item_count(card_items)
+    if total == 0:
+        return await _build_concurrently(
+            lambda rc: build_slots_response(card_items, state, config, ids, urls, rc),
+            render_card,
+        )
+
+    if _superseded(state, nav_seq):
+        return _superseded_response(state)
+    prev_index = _diff_base_index(state, client_focused_index)
+    state.focused_index = _resolve_direction(direction, state, total)
+    window_items = _prefetch_window(card_items, state)
+
+    return await _build_concurrently(
+        lambda rc: build_nav_response(
+            window_items, state, config, ids, urls, rc,
+            progress_label=progress_label,
+            form_input_name=form_input_name,
+            prev_focused_index=prev_index,
+        ),
+        render_card,
+    )
+
+# %% ../../nbs/routes/handlers.ipynb #z0ncdj2jue
+async def card_stack_navigate_to_index_async(
+    target_index: int,  # Target item index to navigate to
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    progress_label: str = "Item",  # Label for progress indicator
+    form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
+) -> Tuple:  # OOB elements (slots + progress + focus)
+    """Async `card_stack_navigate_to_index`: visible cards are rendered concurrently."""
+    card_items = count_once(card_items)
+    total = item_count(card_items)
+    if total == 0:
+        return await _build_concurrently(
+            lambda rc: build_slots_response(card_items, state, config, ids, urls, rc),
+            render_card,
+        )
+
+    if _superseded(state, nav_seq):
+        return _superseded_response(state)
+    prev_index = _diff_base_index(state, client_focused_index)
+    state.focused_index = max(0, min(total - 1, target_index))
+    window_items = _prefetch_window(card_items, state)
+
+    return await _build_concurrently(
+        lambda rc: build_nav_response(
+            window_items, state, config, ids, urls, rc,
+            progress_label=progress_label,
+            form_input_name=form_input_name,
+            prev_focused_index=prev_index,
+        ),
+        render_card,
+    )
+
+# %% ../../nbs/routes/handlers.ipynb #2pe25knd8h
+async def card_stack_navigate_by_async(
+    delta: int,  # Signed number of items to move (negative = up)
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    progress_label: str = "Item",  # Label for progress indicator
+    form_input_name: str = "focused_index",  # Name for the focused index hidden input
+    client_focused_index: Optional[int] = None,  # Index the client DOM shows (slot diffs only when it matches state)
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded requests skip rendering)
+) -> Tuple:  # OOB elements (slots + progress + focus)
+    """Async `card_stack_navigate_by`: visible cards are rendered concurrently."""
+    return await card_stack_navigate_to_index_async(
+        state.focused_index + delta, card_items, state, config, ids, urls, render_card,
+        progress_label=progress_label,
+        form_input_name=form_input_name,
+        client_focused_index=client_focused_index,
+        nav_seq=nav_seq,
+    )
+
+# %% ../../nbs/routes/handlers.ipynb #p6wgcd2py8
+async def card_stack_update_viewport_async(
+    visible_count: int,  # New number of visible cards
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    is_auto: bool = True,  # Whether this update came from auto-adjust mode
+    height_model: Optional[CardHeightModel] = None,  # Learned card heights (lets the server choose auto counts)
+    section_height: Optional[float] = None,  # Client-measured space per context section in px (estimate requests)
+    card_gap: float = 0.0,  # Client-measured gap between cards in px
+    card_heights: Optional[Mapping[int, float]] = None,  # Client-measured slot heights by item index
+    form_input_name: str = "focused_index",  # Name for the hidden input (re-issued under stateless nav)
+) -> Tuple:  # OOB section elements (3 viewport sections + scrollbar, + visible count header when chosen)
+    """Async `card_stack_update_viewport`: visible cards are rendered concurrently."""
+    card_items = count_once(card_items)
+    chosen = _choose_visible_count(
+        card_items, state, is_auto, height_model, section_height, card_gap, card_heights,
+    )
+    if chosen is not None:
+        visible_count = chosen
+    state.visible_count = visible_count
+    state.is_auto_mode = is_auto
+    window_items = _prefetch_window(card_items, state)
+
+    result = await _build_concurrently(
+        lambda rc: card_stack_update_viewport(
+            visible_count, window_items, state, config, ids, urls, rc, is_auto=is_auto,
+            form_input_name=form_input_name,
+        ),
+        render_card,
+    )
+    if chosen is not None:
+        result = result + (HttpHeader(VISIBLE_COUNT_HEADER, str(chosen)),)
     return result
 
 # %% ../../nbs/routes/handlers.ipynb #h1000013
@@ -191,3 +535,24 @@ def card_stack_save_scale(
 ) -> None:  # No response (swap=none on client)
     """Save card stack scale. Mutates state.card_scale in place."""
     state.card_scale = max(config.card_scale_min, min(config.card_scale_max, card_scale))
+
+# %% ../../nbs/routes/handlers.ipynb #vp5awzafm0
+def card_stack_save_prefs(
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration (for clamping bounds)
+    card_width: Optional[int] = None,  # Card stack width in rem (None = unchanged)
+    card_scale: Optional[int] = None,  # Card stack scale percentage (None = unchanged)
+    visible_count: Optional[int] = None,  # Visible card count (None = unchanged)
+    is_auto: Optional[bool] = None,  # Auto-adjust mode (None = unchanged)
+) -> bool:  # Whether any preference changed (callers can skip the state write)
+    """Save any subset of preferences at once. Mutates state in place."""
+    before = (state.card_width, state.card_scale, state.visible_count, state.is_auto_mode)
+    if card_width is not None:
+        card_stack_save_width(state, card_width, config)
+    if card_scale is not None:
+        card_stack_save_scale(state, card_scale, config)
+    if visible_count is not None:
+        state.visible_count = max(1, visible_count)
+    if is_auto is not None:
+        state.is_auto_mode = is_auto
+    return (state.card_width, state.card_scale, state.visible_count, state.is_auto_mode) != before
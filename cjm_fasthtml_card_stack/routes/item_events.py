@@ -0,0 +1,177 @@
+"""Server push for item changes: a notifier the app calls when items change, and the response builders for the event stream that re-renders the affected visible slots."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/routes/item_events.ipynb.
+
+# %% auto #0
+__all__ = ['CardStackNotifier', 'build_items_changed_response', 'build_items_changed_response_async', 'item_event_message']
+
+# %% ../../nbs/routes/item_events.ipynb #jidvq8en08
+import asyncio
+import json
+import threading
+from typing import AbstractSet, Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from fasthtml.common import to_xml
+
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState, CardStackUrls
+from ..core.constants import ITEM_EVENT
+from ..core.data_source import CardItems, count_once, item_count, fetch_window
+from ..components.viewport import render_slot_card, compile_viewport_styles
+from ..helpers.focus import resolve_focus_slot, calculate_viewport_window
+from ..helpers.render_cache import CardRenderCache
+from .handlers import build_nav_response, _build_concurrently, _prefetch_window
+
+# %% ../../nbs/routes/item_events.ipynb #cgu98ar61l
+class _ItemSubscription:
+    """Pending item changes for one connected event stream."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._all = False  # Re-render the whole window
+        self._indices: Set[int] = set()
+
+    def push(
+        self,
+        indices: Optional[AbstractSet[int]],  # Changed item indices (None = all)
+    ) -> None:
+        """Queue changes (safe to call from any thread)."""
+        try:
+            self._loop.call_soon_threadsafe(self._merge, indices)
+        except RuntimeError:  # Loop already closed; the stream is gone
+            pass
+
+    def _merge(self, indices):
+        if indices is None:
+            self._all = True
+        else:
+            self._indices.update(indices)
+        self._ready.set()
+
+    async def next(self) -> Optional[Set[int]]:  # Changed indices since the last call (None = all)
+        """Wait for changes and take everything queued so far."""
+        await self._ready.wait()
+        self._ready.clear()
+        indices = None if self._all else self._indices
+        self._all, self._indices = False, set()
+        return indices
+
+class CardStackNotifier:
+    """Fans item change notifications out to the connected item event streams."""
+
+    def __init__(self):
+        self.caches: List[CardRenderCache] = []  # Render caches to invalidate (the router adds its own)
+        self.notifications = 0  # notify_items_changed calls
+        self._subscriptions: Set[_ItemSubscription] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> int:  # Number of open item event streams
+        """Number of open item event streams."""
+        return len(self._subscriptions)
+
+    def subscribe(self) -> _ItemSubscription:  # Subscription bound to the running event loop
+        """Register an event stream (call from the stream's event loop)."""
+        subscription = _ItemSubscription()
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(
+        self,
+        subscription: _ItemSubscription,  # Subscription from subscribe()
+    ) -> None:
+        """Remove a closed event stream."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def notify_items_changed(
+        self,
+        indices: Optional[Iterable[int]] = None,  # Changed item indices (None = everything, e.g. items replaced)
+    ) -> int:  # Number of event streams notified
+        """Drop cached renders of the changed items and push the change to every open stream."""
+        changed = None if indices is None else frozenset(indices)
+        for cache in self.caches:
+            cache.invalidate(changed)
+        with self._lock:
+            self.notifications += 1
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.push(changed)
+        return len(subscriptions)
+
+# %% ../../nbs/routes/item_events.ipynb #22kzi6qiav
+def _clamp_focus(
+    state: CardStackState,  # Current card stack state (mutated in place)
+    total: int,  # New total item count
+) -> None:
+    """Keep the focused index inside a resized item list."""
+    state.focused_index = max(0, min(state.focused_index, total - 1))
+
+def build_items_changed_response(
+    card_items: CardItems,  # All data items (list or data source), after the change
+    state: CardStackState,  # Client's card stack state (focused index clamped in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback
+    changed: Optional[AbstractSet[int]] = None,  # Changed item indices (None = all)
+    prev_total: Optional[int] = None,  # Item count the client last saw (None = unknown)
+    progress_label: str = "Item",  # Label for progress indicator
+) -> Tuple:  # OOB elements (empty when no visible item changed)
+    """Re-render the changed items visible in the state's window (or the whole window if the count changed)."""
+    card_items = count_once(card_items)
+    total = item_count(card_items)
+    if changed is None or total != prev_total:
+        _clamp_focus(state, total)
+        return build_nav_response(card_items, state, config, ids, urls, render_card, progress_label=progress_label)
+    window = calculate_viewport_window(state.focused_index, total, state.visible_count, state.focus_position)
+    visible = [i for i in window if i in changed and 0 <= i < total]
+    if not visible:
+        return ()
+    focus_slot = resolve_focus_slot(state.focus_position, state.visible_count)
+    window_items = fetch_window(card_items, visible)
+    styles = compile_viewport_styles(config)
+    return tuple(
+        render_slot_card(
+            slot_index=window.index(item_index), focus_slot=focus_slot,
+            card_items=window_items, item_index=item_index,
+            render_card=render_card, state=state,
+            config=config, ids=ids, urls=urls, oob=True, styles=styles,
+        )
+        for item_index in visible
+    )
+
+async def build_items_changed_response_async(
+    card_items: CardItems,  # All data items (list or data source), after the change
+    state: CardStackState,  # Client's card stack state (focused index clamped in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    changed: Optional[AbstractSet[int]] = None,  # Changed item indices (None = all)
+    prev_total: Optional[int] = None,  # Item count the client last saw (None = unknown)
+    progress_label: str = "Item",  # Label for progress indicator
+) -> Tuple:  # OOB elements (empty when no visible item changed)
+    """Async `build_items_changed_response`: visible cards are rendered concurrently."""
+    card_items = count_once(card_items)
+    if changed is None or item_count(card_items) != prev_total:
+        _clamp_focus(state, item_count(card_items))
+    window_items = _prefetch_window(card_items, state)
+    return await _build_concurrently(
+        lambda rc: build_items_changed_response(
+            window_items, state, config, ids, urls, rc, changed, prev_total, progress_label,
+        ),
+        render_card,
+    )
+
+def item_event_message(
+    parts: Tuple,  # OOB elements from build_items_changed_response
+    focused_index: int,  # Focused index the update was rendered against
+    nav_seq: int,  # Latest nav sequence number the server processed
+) -> str:  # One Server-Sent Events message
+    """Format an item change update as an SSE `items` event."""
+    data = json.dumps({"focused_index": focused_index, "nav_seq": nav_seq, "html": to_xml(parts, indent=False)})
+    return f"event: {ITEM_EVENT}\ndata: {data}\n\n"
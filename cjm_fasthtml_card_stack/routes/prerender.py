@@ -0,0 +1,198 @@
+"""Speculative background rendering of the windows adjacent to the focused card."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/routes/prerender.ipynb.
+
+# %% auto #0
+__all__ = ['CardPrerenderer']
+
+# %% ../../nbs/routes/prerender.ipynb #3j0zyk8ul8
+import asyncio
+import dataclasses
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Set, Tuple
+
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState, CardStackUrls
+from ..core.data_source import CardItems, item_count
+from ..components.viewport import render_all_slots_oob
+from ..helpers.render_cache import CardRenderCache
+from .handlers import _resolve_direction
+
+# %% ../../nbs/routes/prerender.ipynb #6psx5mfh54
+_DEFAULT_DIRECTIONS: Tuple[str, ...] = ("down", "up", "page_down", "page_up")
+
+_log = logging.getLogger(__name__)
+
+class CardPrerenderer:
+    """Bounded background pre-renderer for adjacent card stack windows.
+
+    One cache serves every session. `render_card` only receives the item and
+    its `CardRenderContext`, and cache keys hold the item's value (or its
+    `item_key`) plus the context fields, so an entry is exactly what any
+    session would render for that key. Renderers that read per-user data from
+    elsewhere must put the user into the cache's `item_key`.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[CardRenderCache] = None,  # Cache to fill (default: new CardRenderCache)
+        max_workers: int = 2,  # Background render threads
+        max_pending: int = 4,  # Cap on queued/running window jobs (extra schedules are dropped)
+        directions: Tuple[str, ...] = _DEFAULT_DIRECTIONS,  # Moves to anticipate after each nav
+    ):
+        self.cache = cache if cache is not None else CardRenderCache()
+        self.max_pending = max_pending
+        self.directions = directions
+        self.hits = 0  # Cards served from speculative renders
+        self.misses = 0  # Cards rendered on demand (not cached)
+        self.scheduled = 0  # Window jobs submitted
+        self.dropped = 0  # Window jobs skipped because of max_pending
+        self.failed = 0  # Window jobs whose renderer raised (logged)
+        self._speculative: "OrderedDict[Any, None]" = OrderedDict()  # Unserved speculative keys, oldest first
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="card-prerender",
+        )
+
+    def _record_use(
+        self,
+        key: Any,  # Cache key of the card about to be served
+    ) -> None:
+        """Update hit/miss counters for a card requested by a real response."""
+        with self._lock:
+            if key in self._speculative:
+                del self._speculative[key]
+                if key in self.cache:
+                    self.hits += 1
+                    return
+            if key not in self.cache:
+                self.misses += 1
+
+    def wrap(
+        self,
+        render_card: Callable,  # Callback: (item, CardRenderContext) -> FT (sync or async)
+    ) -> Callable:  # Drop-in render_card that serves from the speculative cache
+        """Wrap a render_card callback so responses use (and count) speculative renders."""
+        if inspect.iscoroutinefunction(render_card):
+            async def prerendered_card(item, context):
+                self._record_use(self.cache.key(item, context))
+                return await self.cache.get_or_render_async(item, context, render_card)
+        else:
+            def prerendered_card(item, context):
+                self._record_use(self.cache.key(item, context))
+                return self.cache.get_or_render(item, context, render_card)
+        prerendered_card.__wrapped__ = render_card
+        return prerendered_card
+
+    def schedule(
+        self,
+        card_items: CardItems,  # All data items (list or data source)
+        state: CardStackState,  # State after the current nav (copied, not retained)
+        config: CardStackConfig,  # Card stack configuration
+        ids: CardStackHtmlIds,  # HTML IDs for this instance
+        urls: CardStackUrls,  # URL bundle for navigation
+        render_card: Callable,  # Unwrapped card renderer (sync or async)
+    ) -> int:  # Number of window jobs submitted
+        """Queue background renders of the windows reachable by one more nav.
+
+        Async renderers run on the calling event loop (the app's), so they
+        can use loop-bound resources such as async DB pools.
+        """
+        total = item_count(card_items)
+        if total == 0:
+            return 0
+        loop = None
+        if inspect.iscoroutinefunction(render_card):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # No app loop: each card runs on a private loop
+        targets = []
+        for direction in self.directions:
+            target = _resolve_direction(direction, state, total)
+            if target != state.focused_index and target not in targets:
+                targets.append(target)
+
+        submitted = 0
+        for target in targets:
+            with self._lock:
+                if len(self._pending) >= self.max_pending:
+                    self.dropped += 1
+                    continue
+                next_state = dataclasses.replace(state, focused_index=target)
+                future = self._executor.submit(
+                    self._render_window, card_items, next_state, config, ids, urls, render_card, loop,
+                )
+                self._pending.add(future)
+                self.scheduled += 1
+            future.add_done_callback(self._job_done)
+            submitted += 1
+        return submitted
+
+    def _job_done(
+        self,
+        future: Future,  # Finished window job
+    ) -> None:
+        """Release a finished job's slot in the pending cap and log renderer errors."""
+        error = None if future.cancelled() else future.exception()
+        with self._lock:
+            self._pending.discard(future)
+            if error is not None:
+                self.failed += 1
+        if error is not None:
+            _log.warning("Speculative card render failed", exc_info=error)
+
+    def _render_window(
+        self,
+        card_items: CardItems,  # All data items (list or data source)
+        state: CardStackState,  # Anticipated state
+        config: CardStackConfig,  # Card stack configuration
+        ids: CardStackHtmlIds,  # HTML IDs for this instance
+        urls: CardStackUrls,  # URL bundle for navigation
+        render_card: Callable,  # Unwrapped card renderer (sync or async)
+        loop: Optional[asyncio.AbstractEventLoop] = None,  # App loop for async renderers (None = private loop)
+    ) -> None:
+        """Render every not-yet-cached card of one anticipated window (worker thread)."""
+        requests = []
+        render_all_slots_oob(
+            card_items, state, config, ids, urls,
+            lambda item, context: requests.append((item, context)),
+        )
+        for item, context in requests:
+            key = self.cache.key(item, context)
+            if key is None or key in self.cache:
+                continue  # Uncacheable (no item key) or already rendered
+            if inspect.iscoroutinefunction(render_card):
+                coro = self.cache.get_or_render_async(item, context, render_card)
+                if loop is not None:
+                    asyncio.run_coroutine_threadsafe(coro, loop).result()
+                else:
+                    asyncio.run(coro)
+            else:
+                self.cache.get_or_render(item, context, render_card)
+            with self._lock:
+                self._speculative[key] = None
+                self._speculative.move_to_end(key)
+                # Keys beyond the cache's capacity have been evicted; don't retain their items
+                while len(self._speculative) > self.cache.max_entries:
+                    self._speculative.popitem(last=False)
+
+    def wait(
+        self,
+        timeout: Optional[float] = None,  # Seconds to wait (None = until done)
+    ) -> bool:  # True if no jobs remain pending
+        """Block until currently scheduled window jobs finish."""
+        with self._lock:
+            pending = set(self._pending)
+        done, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def close(self) -> None:
+        """Stop the worker threads, discarding queued jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
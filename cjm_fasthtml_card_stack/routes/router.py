@@ -3,134 +3,587 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/routes/router.ipynb.
 
 # %% auto #0
-__all__ = ['init_card_stack_router']
+__all__ = ['init_card_stack_router', 'init_card_stack_js_router']
 
 # %% ../../nbs/routes/router.ipynb #r1000003
-from typing import Any, Callable, List, Optional, Tuple
+import functools
+import inspect
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fasthtml.common import EventStream, HttpHeader
 
 from cjm_fasthtml_app_core.core.routing import APIRouter
 
 from ..core.config import CardStackConfig
 from ..core.html_ids import CardStackHtmlIds
 from ..core.models import CardStackState, CardStackUrls
+from ..core.data_source import CardItems, count_once, item_count
+from ..core.state_store import CardStackStateStore, batch_state_writes, state_snapshot
+from ..helpers.render_cache import CardRenderCache
+from ..helpers.heights import CardHeightModel, parse_card_heights
+from ..helpers.focus import decode_view_state
+from ..helpers.timing import CardStackMetrics, timed_callback, instrument_route
+from ..helpers.telemetry import ClientTelemetry, parse_client_telemetry
+from .prerender import CardPrerenderer
+from .window import card_stack_window, card_stack_window_async
+from .item_events import CardStackNotifier, item_event_message
+from .item_events import build_items_changed_response, build_items_changed_response_async
+from ..js.bundle import CardStackJsBundles
+from ..js.core import generate_card_stack_runtime_js
 from cjm_fasthtml_card_stack.routes.handlers import (
     card_stack_navigate,
     card_stack_navigate_to_index,
+    card_stack_navigate_by,
     card_stack_update_viewport,
     card_stack_save_width,
     card_stack_save_scale,
+    card_stack_save_prefs,
+    card_stack_navigate_async,
+    card_stack_navigate_to_index_async,
+    card_stack_navigate_by_async,
+    card_stack_update_viewport_async,
+    _maybe_await,
 )
 
+# %% ../../nbs/routes/router.ipynb #ptnf2luxte
+def _async_route(
+    router: APIRouter,  # Router to register routes on
+) -> Callable:  # Route decorator
+    """Route decorator for bodies that return awaitables.
+
+    The route is registered as a coroutine function (so FastHTML awaits it on
+    the event loop) while keeping the body's name and signature for URL and
+    form-parameter derivation.
+    """
+    def register(fn):
+        @functools.wraps(fn)
+        async def route(*args, **kwargs):
+            return await _maybe_await(fn(*args, **kwargs))
+        return router(route)
+    return register
+
+def _batched_route(
+    fn: Callable,  # Route body (may return an awaitable)
+) -> Callable:  # Route body with the same signature
+    """Run a route body inside `batch_state_writes()` (async bodies until awaited)."""
+    async def finish_async(awaitable: Any) -> Any:
+        with batch_state_writes():
+            return await awaitable
+
+    @functools.wraps(fn)
+    def route(*args, **kwargs):
+        with batch_state_writes():
+            result = fn(*args, **kwargs)
+        return finish_async(result) if inspect.isawaitable(result) else result
+    return route
+
 # %% ../../nbs/routes/router.ipynb #r1000005
 def init_card_stack_router(
     config: CardStackConfig,  # Card stack configuration
-    state_getter: Callable[[], CardStackState],  # Function to get current state
-    state_setter: Callable[[CardStackState], None],  # Function to save state
-    get_items: Callable[[], List[Any]],  # Function to get current items list
+    state_getter: Optional[Callable[[], CardStackState]],  # Function to get current state (None with state_store)
+    state_setter: Optional[Callable[[CardStackState], None]],  # Function to save state (None with state_store)
+    get_items: Callable[[], CardItems],  # Function to get current items (list or CardStackDataSource)
     render_card: Callable,  # Card renderer callback: (item, CardRenderContext) -> FT
     route_prefix: str = "/card-stack",  # Route prefix for all card stack routes
     progress_label: str = "Item",  # Label for progress indicator
+    render_cache: Optional[CardRenderCache] = None,  # Opt-in rendered-card cache (wraps render_card)
+    async_mode: Optional[bool] = None,  # Register async routes (None = auto-detect coroutine callbacks)
+    prerenderer: Optional[CardPrerenderer] = None,  # Opt-in speculative renders of adjacent windows (supersedes render_cache)
+    height_model: Optional[CardHeightModel] = None,  # Opt-in learned card heights (server chooses auto-adjust counts)
+    state_store: Optional[CardStackStateStore] = None,  # Session-keyed state persistence (replaces state_getter/state_setter)
+    server_timing: bool = False,  # Add a Server-Timing header with per-phase durations to every response
+    metrics: Optional[CardStackMetrics] = None,  # Counter/histogram sink for per-phase request timings
+    on_client_telemetry: Optional[Callable[[ClientTelemetry], Any]] = None,  # Receives client telemetry reports (enables client telemetry)
+    websocket_nav: bool = False,  # Also accept nav commands over a WebSocket (urls.nav_ws)
+    notifier: Optional[CardStackNotifier] = None,  # Pushes item changes to connected clients (enables urls.item_events)
 ) -> Tuple[APIRouter, CardStackUrls]:  # (router, urls) tuple
     """Initialize an APIRouter with all standard card stack routes."""
+    if state_store is None and (state_getter is None or state_setter is None):
+        raise ValueError("Provide state_getter and state_setter, or a state_store")
     router = APIRouter(prefix=route_prefix)
     ids = CardStackHtmlIds(prefix=config.prefix)
+    instrumented = server_timing or metrics is not None
+
+    base_render_card = render_card
+    if instrumented:
+        # Time only the consumer's renderer (cache hits cost it nothing)
+        render_card = timed_callback("render", render_card)
+    if prerenderer is not None:
+        render_card = prerenderer.wrap(render_card)
+    elif render_cache is not None:
+        render_card = render_cache.wrap(render_card)
+
+    def _prerender(items: CardItems, state: CardStackState) -> None:
+        """Queue speculative renders of the windows one nav away."""
+        if prerenderer is not None:
+            prerenderer.schedule(items, state, config, ids, urls, base_render_card)
+
+    if async_mode is None:
+        async_mode = any(
+            inspect.iscoroutinefunction(fn)
+            for fn in (state_getter, state_setter, get_items, render_card, on_client_telemetry)
+            if fn is not None
+        )
+    route = _async_route(router) if async_mode else router
+    if instrumented:
+        get_items = timed_callback("items", get_items)
+        register = route
+
+        def route(fn: Callable) -> Any:
+            """Register a route whose phases are timed and reported."""
+            tags = {"prefix": config.prefix, "route": fn.__name__}
+            return register(instrument_route(fn, tags, metrics, server_timing))
+    if state_store is not None:
+        register_unbatched = route
+
+        def route(fn: Callable) -> Any:
+            """Register a route whose state store writes flush once, after its body."""
+            return register_unbatched(_batched_route(fn))
+
+    # Routes receive the request session (used by state stores). The state is
+    # only written back when a route changed it — boundary no-ops, superseded
+    # nav requests, and already-clamped preferences skip the write.
+
+    def _load_state(session: Optional[dict]) -> Any:
+        """Current state (or an awaitable of it)."""
+        if state_store is not None:
+            return state_store.get(config.prefix, session)
+        return state_getter()
+
+    def _write_state(session: Optional[dict], state: CardStackState) -> Any:
+        """Persist the state (may return an awaitable)."""
+        if state_store is not None:
+            return state_store.put(config.prefix, state, session)
+        return state_setter(state)
+
+    if instrumented:
+        _load_state = timed_callback("state_get", _load_state)
+        _write_state = timed_callback("state_set", _write_state)
+
+    def _save_state(session: Optional[dict], state: CardStackState, before: Tuple) -> Any:
+        """Write the state back if the route changed it (may return an awaitable)."""
+        if state_snapshot(state) == before:
+            return None
+        return _write_state(session, state)
+
+    def _adopt_client_index(state: CardStackState, focused_index: Optional[int]) -> None:
+        """Use the client's focused index under stateless nav (the stored one is stale)."""
+        if config.stateless_nav and focused_index is not None:
+            state.focused_index = max(0, focused_index)
+
+    def _clamp_client_index(state: CardStackState, items: CardItems) -> None:
+        """Keep a client-supplied focused index inside the item list (stateless nav only)."""
+        if config.stateless_nav:
+            state.focused_index = max(0, min(state.focused_index, item_count(items) - 1))
+
+    async def _run_async(
+        handler: Callable, session: Optional[dict], client_state: Optional[CardStackState] = None,
+        client_index: Optional[int] = None, **kwargs,
+    ) -> Any:
+        """Async route body: await the callbacks and an async handler."""
+        if client_state is not None:
+            state = client_state
+        else:
+            state = await _maybe_await(_load_state(session))
+        before = state_snapshot(state)
+        _adopt_client_index(state, client_index)
+        items = count_once(await _maybe_await(get_items()))
+        _clamp_client_index(state, items)
+        result = await handler(
+            card_items=items, state=state, config=config, ids=ids, urls=urls,
+            render_card=render_card, **kwargs,
+        )
+        if client_state is None:
+            await _maybe_await(_save_state(session, state, before))
+        if handler is not card_stack_update_viewport_async:
+            _prerender(items, state)
+        return result
 
     # -----------------------------------------------------------------
     # Navigation Routes
     # -----------------------------------------------------------------
 
-    def _nav(direction: str) -> Any:
-        """Shared navigation handler."""
-        state = state_getter()
-        items = get_items()
-        result = card_stack_navigate(
-            direction=direction, card_items=items, state=state,
-            config=config, ids=ids, urls=urls,
-            render_card=render_card, progress_label=progress_label,
+    # Nav buttons hx-include the focused_index hidden input; its value tells
+    # the handlers which window the client is showing (guards slot diffs).
+    # The client JS adds nav_seq to every nav request (latest-wins ordering).
+    #
+    # With config.stateless_nav the client also sends the view token from that
+    # input (plus its live visible_count and card_scale), and nav routes build
+    # the state from the request: no state lookup and no write. Requests
+    # without a valid token fall back to stored state. With config.state_secret
+    # the token is signed, so any replica sharing the secret can trust it.
+
+    def _client_state(
+        focused_index: Optional[int], view: str, visible_count: Optional[int], card_scale: Optional[int],
+    ) -> Optional[CardStackState]:
+        """Nav state carried by the request, or None to use stored state."""
+        if not config.stateless_nav:
+            return None
+        return decode_view_state(view, focused_index, config, visible_count, card_scale)
+
+    def _navigate(
+        handler: Callable, async_handler: Callable, session: Optional[dict],
+        client_state: Optional[CardStackState], focused_index: Optional[int], nav_seq: Optional[int],
+        **kwargs,
+    ) -> Any:
+        """Shared navigation route body."""
+        nav_kwargs = dict(
+            progress_label=progress_label, client_focused_index=focused_index, nav_seq=nav_seq, **kwargs,
         )
-        state_setter(state)
+        if async_mode:
+            return _run_async(async_handler, session, client_state, **nav_kwargs)
+        state = client_state if client_state is not None else _load_state(session)
+        before = state_snapshot(state)
+        items = count_once(get_items())
+        _clamp_client_index(state, items)
+        result = handler(
+            card_items=items, state=state, config=config, ids=ids, urls=urls,
+            render_card=render_card, **nav_kwargs,
+        )
+        if client_state is None:
+            _save_state(session, state, before)
+        _prerender(items, state)
         return result
 
-    @router
-    def nav_up() -> Any:
+    @route
+    def nav_up(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate to previous item."""
-        return _nav("up")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="up")
 
-    @router
-    def nav_down() -> Any:
+    @route
+    def nav_down(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate to next item."""
-        return _nav("down")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="down")
 
-    @router
-    def nav_first() -> Any:
+    @route
+    def nav_first(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate to first item."""
-        return _nav("first")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="first")
 
-    @router
-    def nav_last() -> Any:
+    @route
+    def nav_last(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate to last item."""
-        return _nav("last")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="last")
 
-    @router
-    def nav_page_up() -> Any:
+    @route
+    def nav_page_up(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate up by page."""
-        return _nav("page_up")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="page_up")
 
-    @router
-    def nav_page_down() -> Any:
+    @route
+    def nav_page_down(
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate down by page."""
-        return _nav("page_down")
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate, card_stack_navigate_async, session, client_state,
+                         focused_index, nav_seq, direction="page_down")
 
-    @router
-    def nav_to_index(target_index: int) -> Any:
+    @route
+    def nav_to_index(
+        target_index: int, focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
         """Navigate to a specific item index (click-to-focus)."""
-        state = state_getter()
-        items = get_items()
-        result = card_stack_navigate_to_index(
-            target_index=target_index, card_items=items, state=state,
-            config=config, ids=ids, urls=urls,
-            render_card=render_card, progress_label=progress_label,
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate_to_index, card_stack_navigate_to_index_async, session, client_state,
+                         focused_index, nav_seq, target_index=target_index)
+
+    @route
+    def nav_by(
+        delta: int, focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
+        """Navigate by a signed step count (coalesced scroll bursts)."""
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        return _navigate(card_stack_navigate_by, card_stack_navigate_by_async, session, client_state,
+                         focused_index, nav_seq, delta=delta)
+
+    # -----------------------------------------------------------------
+    # JSON Window Route
+    # -----------------------------------------------------------------
+
+    # For custom clients and the window patcher JS: one route takes any move
+    # (direction, target_index or delta; none reads the current window) and
+    # returns build_window_payload JSON instead of OOB fragments.
+
+    @route
+    def nav_window(
+        direction: str = "", target_index: Optional[int] = None, delta: Optional[int] = None,
+        focused_index: Optional[int] = None, nav_seq: Optional[int] = None, session=None,
+        view: str = "", visible_count: Optional[int] = None, card_scale: Optional[int] = None,
+    ) -> Any:
+        """Apply a move and return the viewport window as JSON."""
+        client_state = _client_state(focused_index, view, visible_count, card_scale)
+        move = dict(direction=direction or None, target_index=target_index, delta=delta, nav_seq=nav_seq)
+        if async_mode:
+            return _run_async(card_stack_window_async, session, client_state, **move)
+        state = client_state if client_state is not None else _load_state(session)
+        before = state_snapshot(state)
+        items = count_once(get_items())
+        _clamp_client_index(state, items)
+        result = card_stack_window(
+            card_items=items, state=state, config=config, ids=ids, urls=urls,
+            render_card=render_card, **move,
         )
-        state_setter(state)
+        if client_state is None:
+            _save_state(session, state, before)
+        _prerender(items, state)
         return result
 
     # -----------------------------------------------------------------
     # Viewport Route
     # -----------------------------------------------------------------
 
-    @router
-    def update_viewport(visible_count: int, is_auto: str = "true") -> Any:
+    # Auto-adjust requests also carry client measurements (section_height,
+    # card_gap, card_heights) for the optional height model. Under stateless
+    # nav the stored focused index is stale, so the client sends its own.
+
+    @route
+    def update_viewport(
+        visible_count: int,
+        is_auto: str = "true",
+        section_height: Optional[float] = None,
+        card_gap: float = 0.0,
+        card_heights: str = "",
+        focused_index: Optional[int] = None,
+        session=None,
+    ) -> Any:
         """Update viewport with new card count (OOB section swaps)."""
-        state = state_getter()
-        items = get_items()
+        measurements = dict(
+            height_model=height_model, section_height=section_height,
+            card_gap=card_gap, card_heights=parse_card_heights(card_heights),
+        )
+        if async_mode:
+            return _run_async(
+                card_stack_update_viewport_async, session, client_index=focused_index,
+                visible_count=visible_count,
+                is_auto=(is_auto == "true"), **measurements,
+            )
+        state = _load_state(session)
+        before = state_snapshot(state)
+        _adopt_client_index(state, focused_index)
+        items = count_once(get_items())
+        _clamp_client_index(state, items)
         result = card_stack_update_viewport(
             visible_count=visible_count, card_items=items, state=state,
             config=config, ids=ids, urls=urls, render_card=render_card,
-            is_auto=(is_auto == "true"),
+            is_auto=(is_auto == "true"), **measurements,
         )
-        state_setter(state)
+        _save_state(session, state, before)
         return result
 
     # -----------------------------------------------------------------
     # Preference Persistence Routes
     # -----------------------------------------------------------------
 
-    @router
-    def save_width(card_width: int) -> Any:
-        """Save card stack width to server state."""
-        state = state_getter()
-        card_stack_save_width(state, card_width, config)
-        state_setter(state)
+    async def _save_async(save: Callable, session: Optional[dict], **prefs) -> Any:
+        """Async preference save."""
+        state = await _maybe_await(_load_state(session))
+        before = state_snapshot(state)
+        save(state, config=config, **prefs)
+        await _maybe_await(_save_state(session, state, before))
         return ""
 
-    @router
-    def save_scale(card_scale: int) -> Any:
-        """Save card stack scale to server state."""
-        state = state_getter()
-        card_stack_save_scale(state, card_scale, config)
-        state_setter(state)
+    def _save(save: Callable, session: Optional[dict], **prefs) -> Any:
+        """Shared preference save handler."""
+        if async_mode:
+            return _save_async(save, session, **prefs)
+        state = _load_state(session)
+        before = state_snapshot(state)
+        save(state, config=config, **prefs)
+        _save_state(session, state, before)
         return ""
 
+    @route
+    def save_width(card_width: int, session=None) -> Any:
+        """Save card stack width to server state."""
+        return _save(card_stack_save_width, session, card_width=card_width)
+
+    @route
+    def save_scale(card_scale: int, session=None) -> Any:
+        """Save card stack scale to server state."""
+        return _save(card_stack_save_scale, session, card_scale=card_scale)
+
+    # The client coalesces width/scale/auto-mode changes into one save_prefs
+    # request (sent with sendBeacon on pagehide).
+
+    @route
+    def save_prefs(
+        card_width: Optional[int] = None,
+        card_scale: Optional[int] = None,
+        visible_count: Optional[int] = None,
+        is_auto: str = "",
+        session=None,
+    ) -> Any:
+        """Save any subset of preferences to server state in one request."""
+        return _save(
+            card_stack_save_prefs, session,
+            card_width=card_width, card_scale=card_scale, visible_count=visible_count,
+            is_auto=(is_auto == "true") if is_auto else None,
+        )
+
+    # -----------------------------------------------------------------
+    # Client Telemetry Route
+    # -----------------------------------------------------------------
+
+    # Registered only with on_client_telemetry; its URL switches the client
+    # telemetry JS on. Invalid reports are dropped without calling back.
+
+    client_telemetry = None
+    if on_client_telemetry is not None:
+        @route
+        def client_telemetry(report: str = "", session=None) -> Any:
+            """Receive a client telemetry beacon."""
+            telemetry = parse_client_telemetry(report)
+            if telemetry is None:
+                return ""
+            result = on_client_telemetry(telemetry)
+            return _telemetry_done(result) if inspect.isawaitable(result) else ""
+
+        async def _telemetry_done(result: Any) -> str:
+            """Await an async telemetry callback (its return value is not sent)."""
+            await result
+            return ""
+
+    # -----------------------------------------------------------------
+    # WebSocket Navigation Route
+    # -----------------------------------------------------------------
+
+    # With websocket_nav the client sends nav commands ({"cmd": "nav_down",
+    # ...the nav route's params}) over one socket instead of one POST each,
+    # and gets the same OOB fragments back. Each socket keeps its own state,
+    # loaded by its first command and written back after every move so the
+    # HTTP routes see it; "resync" reloads it after the client made HTTP
+    # requests that may have changed the stored state. Superseded commands
+    # get no reply. SessionStateStore cookies can't be rewritten over a
+    # socket, so pair it with stateless_nav (or use a server-side store).
+
+    nav_ws_url = ""
+    if websocket_nav:
+        socket_states: Dict[int, CardStackState] = {}
+        socket_moves = {
+            f"nav_{d}": (card_stack_navigate, card_stack_navigate_async, "direction")
+            for d in ("up", "down", "first", "last", "page_up", "page_down")
+        }
+        socket_moves["nav_to_index"] = (
+            card_stack_navigate_to_index, card_stack_navigate_to_index_async, "target_index")
+        socket_moves["nav_by"] = (card_stack_navigate_by, card_stack_navigate_by_async, "delta")
+
+        async def nav_ws(
+            ws, cmd: str = "", target_index: Optional[int] = None, delta: Optional[int] = None,
+            focused_index: Optional[int] = None, nav_seq: Optional[int] = None, resync: int = 0,
+            session=None, view: str = "", visible_count: Optional[int] = None,
+            card_scale: Optional[int] = None,
+        ) -> Any:
+            """Apply one nav command received over the socket."""
+            if cmd not in socket_moves:
+                return None
+            handler, async_handler, arg = socket_moves[cmd]
+            move = cmd[len("nav_"):] if arg == "direction" else {"target_index": target_index, "delta": delta}[arg]
+            if move is None:
+                return None
+            state = socket_states.get(id(ws))
+            if state is None or resync:
+                state = _client_state(focused_index, view, visible_count, card_scale)
+                if state is None:
+                    state = await _maybe_await(_load_state(session))
+                socket_states[id(ws)] = state
+            before = state_snapshot(state)
+            items = count_once(await _maybe_await(get_items()))
+            _clamp_client_index(state, items)
+            nav_kwargs = dict(
+                card_items=items, state=state, config=config, ids=ids, urls=urls,
+                render_card=render_card, progress_label=progress_label,
+                client_focused_index=focused_index, nav_seq=nav_seq, **{arg: move},
+            )
+            result = await async_handler(**nav_kwargs) if async_mode else handler(**nav_kwargs)
+            if not config.stateless_nav:
+                await _maybe_await(_save_state(session, state, before))
+            _prerender(items, state)
+            return tuple(part for part in result if not isinstance(part, HttpHeader)) or None
+
+        def nav_ws_closed(ws) -> None:
+            """Drop a closed socket's state."""
+            socket_states.pop(id(ws), None)
+
+        router.ws("/nav_ws", disconn=nav_ws_closed)(nav_ws)
+        nav_ws_url = f"{route_prefix}/nav_ws"
+
+    # -----------------------------------------------------------------
+    # Item Events Route
+    # -----------------------------------------------------------------
+
+    # Registered only with a notifier; its URL switches the client's event
+    # stream on. Each push re-renders against the client's stored state, so
+    # under stateless_nav (where the stored focused index lags the client)
+    # the client skips most slot pushes and its next nav shows the change.
+
+    item_events = None
+    if notifier is not None:
+        cache = prerenderer.cache if prerenderer is not None else render_cache
+        if cache is not None and cache not in notifier.caches:
+            notifier.caches.append(cache)
+
+        async def _item_event_stream(session: Optional[dict]) -> AsyncIterator[str]:
+            """Yield one items event per batch of changes that touches the client's window."""
+            subscription = notifier.subscribe()
+            try:
+                total = item_count(await _maybe_await(get_items()))
+                while True:
+                    changed = await subscription.next()
+                    state = await _maybe_await(_load_state(session))
+                    before = state_snapshot(state)
+                    focused_index = state.focused_index
+                    items = count_once(await _maybe_await(get_items()))
+                    build_kwargs = dict(
+                        card_items=items, state=state, config=config, ids=ids, urls=urls,
+                        render_card=render_card, changed=changed, prev_total=total,
+                        progress_label=progress_label,
+                    )
+                    if async_mode:
+                        parts = await build_items_changed_response_async(**build_kwargs)
+                    else:
+                        parts = build_items_changed_response(**build_kwargs)
+                    total = item_count(items)
+                    if not parts:
+                        continue
+                    await _maybe_await(_save_state(session, state, before))
+                    yield item_event_message(parts, focused_index, state.nav_seq)
+            finally:
+                notifier.unsubscribe(subscription)
+
+        @router
+        async def item_events(session=None) -> Any:
+            """Open the item change event stream (Server-Sent Events)."""
+            return EventStream(_item_event_stream(session))
+
     # -----------------------------------------------------------------
     # Build URL bundle from registered routes
     # -----------------------------------------------------------------
@@ -143,9 +596,35 @@ def init_card_stack_router(
         nav_page_up=nav_page_up.to(),
         nav_page_down=nav_page_down.to(),
         nav_to_index=nav_to_index.to(),
+        nav_by=nav_by.to(),
         update_viewport=update_viewport.to(),
+        nav_window=nav_window.to(),
+        nav_ws=nav_ws_url,
         save_width=save_width.to(),
         save_scale=save_scale.to(),
+        save_prefs=save_prefs.to(),
+        client_telemetry=client_telemetry.to() if client_telemetry is not None else "",
+        item_events=item_events.to() if item_events is not None else "",
     )
 
     return router, urls
+
+# %% ../../nbs/routes/router.ipynb #6v2edr9g8q
+def init_card_stack_js_router(
+    bundles: CardStackJsBundles,  # Script registry shared with generate_card_stack_js
+) -> APIRouter:  # Router serving {route_prefix}/{content_hash}.js
+    """Initialize an APIRouter that serves cached card stack JS bundles.
+
+    The shared runtime is preloaded here, so every process that sets up the
+    router can serve its URL.
+    """
+    router = APIRouter(prefix=bundles.route_prefix)
+    with bundles.preloading():
+        generate_card_stack_runtime_js(bundles)
+
+    @router("/{content_hash}.js", methods=["get"])
+    def card_stack_js(content_hash: str, req) -> Any:
+        """Serve a card stack script with immutable caching headers."""
+        return bundles.response(content_hash, req.headers.get("if-none-match"))
+
+    return router
@@ -0,0 +1,128 @@
+"""JSON navigation responses for custom clients: the focused index, total, viewport window, focus slot, and pre-rendered slot HTML."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/routes/window.ipynb.
+
+# %% auto #0
+__all__ = ['WINDOW_FORMAT_VERSION', 'build_window_payload', 'card_stack_window', 'card_stack_window_async']
+
+# %% ../../nbs/routes/window.ipynb #lms4zxufac
+from typing import Any, Callable, Dict, Optional
+
+from fasthtml.common import to_xml
+
+from ..core.config import CardStackConfig
+from ..core.html_ids import CardStackHtmlIds
+from ..core.models import CardStackState, CardStackUrls
+from ..core.data_source import CardItems, count_once, item_count, fetch_window
+from ..components.viewport import render_slot_card, compile_viewport_styles
+from ..helpers.focus import resolve_focus_slot, calculate_viewport_window, encode_view_state
+from cjm_fasthtml_card_stack.routes.handlers import (
+    _resolve_direction, _superseded, _build_concurrently, _prefetch_window,
+)
+
+# %% ../../nbs/routes/window.ipynb #jyxrccynk1
+WINDOW_FORMAT_VERSION = 1  # Bump when payload keys change meaning
+
+def build_window_payload(
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation (click-to-focus overlays)
+    render_card: Callable,  # Card renderer callback
+) -> Dict[str, Any]:  # JSON-ready window description
+    """Render the current viewport window as a compact JSON payload."""
+    total = item_count(card_items)
+    window = calculate_viewport_window(state.focused_index, total, state.visible_count, state.focus_position)
+    focus_slot = resolve_focus_slot(state.focus_position, state.visible_count)
+    window_items = fetch_window(card_items, window)
+    styles = compile_viewport_styles(config)
+    slots = {
+        ids.viewport_slot(item_index): to_xml(render_slot_card(
+            slot_index=slot_index, focus_slot=focus_slot,
+            card_items=window_items, item_index=item_index,
+            render_card=render_card, state=state,
+            config=config, ids=ids, urls=urls, styles=styles,
+        ), indent=False)
+        for slot_index, item_index in enumerate(window)
+    }
+    payload = {
+        "v": WINDOW_FORMAT_VERSION,
+        "focused_index": state.focused_index,
+        "total": total,
+        "window": list(window),
+        "focus_slot": focus_slot,
+        "slots": slots,
+        "nav_seq": state.nav_seq,
+    }
+    if config.stateless_nav:
+        payload["view"] = encode_view_state(state, config)
+    return payload
+
+# %% ../../nbs/routes/window.ipynb #xejz9x3oqo
+def _apply_move(
+    state: CardStackState,  # Current card stack state (mutated in place)
+    total: int,  # Total number of items
+    direction: Optional[str] = None,  # "up", "down", "first", "last", "page_up", "page_down"
+    target_index: Optional[int] = None,  # Absolute target index
+    delta: Optional[int] = None,  # Signed step count
+) -> None:
+    """Move the focused index by whichever move was given (first of direction, target_index, delta)."""
+    if total == 0:
+        return
+    if direction is not None:
+        state.focused_index = _resolve_direction(direction, state, total)
+    elif target_index is not None:
+        state.focused_index = max(0, min(total - 1, target_index))
+    elif delta is not None:
+        state.focused_index = max(0, min(total - 1, state.focused_index + delta))
+
+def _superseded_payload(
+    state: CardStackState,  # Current card stack state
+) -> Dict[str, Any]:  # Marker payload with the latest processed sequence number
+    """Payload for a skipped move."""
+    return {"v": WINDOW_FORMAT_VERSION, "superseded": True, "nav_seq": state.nav_seq}
+
+def card_stack_window(
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback
+    direction: Optional[str] = None,  # Move like card_stack_navigate
+    target_index: Optional[int] = None,  # Move like card_stack_navigate_to_index
+    delta: Optional[int] = None,  # Move like card_stack_navigate_by
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded moves skip rendering)
+) -> Dict[str, Any]:  # Window payload (or a superseded marker)
+    """Apply at most one move and return the viewport window as JSON. Mutates state in place."""
+    card_items = count_once(card_items)
+    moving = direction is not None or target_index is not None or delta is not None
+    if moving and _superseded(state, nav_seq):
+        return _superseded_payload(state)
+    _apply_move(state, item_count(card_items), direction, target_index, delta)
+    return build_window_payload(card_items, state, config, ids, urls, render_card)
+
+async def card_stack_window_async(
+    card_items: CardItems,  # All data items (list or data source)
+    state: CardStackState,  # Current card stack state (mutated in place)
+    config: CardStackConfig,  # Card stack configuration
+    ids: CardStackHtmlIds,  # HTML IDs for this instance
+    urls: CardStackUrls,  # URL bundle for navigation
+    render_card: Callable,  # Card renderer callback (sync or async)
+    direction: Optional[str] = None,  # Move like card_stack_navigate
+    target_index: Optional[int] = None,  # Move like card_stack_navigate_to_index
+    delta: Optional[int] = None,  # Move like card_stack_navigate_by
+    nav_seq: Optional[int] = None,  # Client nav sequence number (superseded moves skip rendering)
+) -> Dict[str, Any]:  # Window payload (or a superseded marker)
+    """Async `card_stack_window`: visible cards are rendered concurrently."""
+    card_items = count_once(card_items)
+    moving = direction is not None or target_index is not None or delta is not None
+    if moving and _superseded(state, nav_seq):
+        return _superseded_payload(state)
+    _apply_move(state, item_count(card_items), direction, target_index, delta)
+    window_items = _prefetch_window(card_items, state)
+    return await _build_concurrently(
+        lambda rc: build_window_payload(window_items, state, config, ids, urls, rc),
+        render_card,
+    )
@@ -32,11 +32,12 @@ from cjm_fasthtml_card_stack.core.config import CardStackConfig
 from cjm_fasthtml_card_stack.core.models import CardStackState, CardRenderContext
 from cjm_fasthtml_card_stack.core.html_ids import CardStackHtmlIds
 from cjm_fasthtml_card_stack.core.button_ids import CardStackButtonIds
+from cjm_fasthtml_card_stack.core.state_store import MemoryStateStore
 from cjm_fasthtml_card_stack.routes.router import init_card_stack_router
 from cjm_fasthtml_card_stack.components.viewport import render_viewport
 from cjm_fasthtml_card_stack.components.settings_modal import render_card_stack_settings_modal
 from cjm_fasthtml_card_stack.components.progress import render_progress_indicator
-from cjm_fasthtml_card_stack.js.core import generate_card_stack_js
+from cjm_fasthtml_card_stack.js.core import generate_card_stack_instance_js, generate_card_stack_runtime_js
 from cjm_fasthtml_card_stack.js.sync import generate_card_stack_sync_js
 from cjm_fasthtml_card_stack.keyboard.actions import (
     create_card_stack_focus_zone, create_card_stack_nav_actions,
@@ -143,62 +144,51 @@ def setup(route_prefix="/dual"):
 
     Returns dict with configs, routers, and page rendering callable.
     """
+    # One store holds both stacks' state, keyed by config prefix
+    store = MemoryStateStore(per_session=False)
+
     # --- Text stack (left) ---
     text_config = CardStackConfig(prefix="dual-text", click_to_focus=True)
     text_ids = CardStackHtmlIds(prefix=text_config.prefix)
     text_btn_ids = CardStackButtonIds(prefix=text_config.prefix)
-    text_state = CardStackState(visible_count=5, card_width=60)
+    store.put(text_config.prefix, CardStackState(visible_count=5, card_width=60))
 
     def get_text_state():
-        return text_state
-
-    def set_text_state(s):
-        text_state.focused_index = s.focused_index
-        text_state.visible_count = s.visible_count
-        text_state.card_width = s.card_width
-        text_state.card_scale = s.card_scale
-        text_state.active_mode = s.active_mode
-        text_state.focus_position = s.focus_position
+        return store.get(text_config.prefix)
 
     def get_text_items():
         return SAMPLE_ITEMS
 
     text_router, text_urls = init_card_stack_router(
         config=text_config,
-        state_getter=get_text_state,
-        state_setter=set_text_state,
+        state_getter=None,
+        state_setter=None,
         get_items=get_text_items,
         render_card=render_text_card,
         route_prefix=f"{route_prefix}/text",
+        state_store=store,
     )
 
     # --- Audio stack (right) ---
     audio_config = CardStackConfig(prefix="dual-audio", click_to_focus=True)
     audio_ids = CardStackHtmlIds(prefix=audio_config.prefix)
     audio_btn_ids = CardStackButtonIds(prefix=audio_config.prefix)
-    audio_state = CardStackState(visible_count=5, card_width=50)
+    store.put(audio_config.prefix, CardStackState(visible_count=5, card_width=50))
 
     def get_audio_state():
-        return audio_state
-
-    def set_audio_state(s):
-        audio_state.focused_index = s.focused_index
-        audio_state.visible_count = s.visible_count
-        audio_state.card_width = s.card_width
-        audio_state.card_scale = s.card_scale
-        audio_state.active_mode = s.active_mode
-        audio_state.focus_position = s.focus_position
+        return store.get(audio_config.prefix)
 
     def get_audio_items():
         return SAMPLE_AUDIO_CHUNKS
 
     audio_router, audio_urls = init_card_stack_router(
         config=audio_config,
-        state_getter=get_audio_state,
-        state_setter=set_audio_state,
+        state_getter=None,
+        state_setter=None,
         get_items=get_audio_items,
         render_card=render_audio_card,
         route_prefix=f"{route_prefix}/audio",
+        state_store=store,
     )
 
     # --- Column container IDs (for viewport height calculation) ---
@@ -278,7 +268,7 @@ def setup(route_prefix="/dual"):
 
         kb_system = build_dual_keyboard_system()
 
-        text_js = generate_card_stack_js(
+        text_js = generate_card_stack_instance_js(
             ids=text_ids,
             button_ids=text_btn_ids,
             config=text_config,
@@ -288,7 +278,7 @@ def setup(route_prefix="/dual"):
             extra_scripts=(generate_scale_spacing_js(text_config, text_ids),),
         )
 
-        audio_js = generate_card_stack_js(
+        audio_js = generate_card_stack_instance_js(
             ids=audio_ids,
             button_ids=audio_btn_ids,
             config=audio_config,
@@ -507,6 +497,7 @@ def setup(route_prefix="/dual"):
             render_card_stack_action_buttons(audio_btn_ids, audio_urls, audio_ids),
 
             # Card stack JS for both stacks
+            generate_card_stack_runtime_js(),
             text_js,
             audio_js,
 